@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""Time WebViewer.format_text on a 2 MB document.
+
+The document is the converted tests/data/html2text corpus, repeated. Run
+from the repo root:
+
+    python benchmarks/colorizer_benchmark.py [repeat]
+"""
+
+from __future__ import print_function
+from __future__ import division
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from haxor_news.config import Config  # NOQA
+from haxor_news.lib.html2text.html2text import HTML2Text  # NOQA
+from haxor_news.web_viewer import WebViewer  # NOQA
+from tests.data.html2text_corpus import convert, expected_digests  # NOQA
+
+
+DOCUMENT_SIZE = 2 * 1024 * 1024
+
+
+def load_document():
+    """Build a DOCUMENT_SIZE markdown document from the corpus.
+
+    :rtype: str
+    :return: The markdown document.
+    """
+    text = ''.join(convert(HTML2Text, name, 'web_viewer')
+                   for name in sorted(expected_digests))
+    return (text * (DOCUMENT_SIZE // len(text) + 1))[:DOCUMENT_SIZE]
+
+
+def main(repeat=3):
+    web_viewer = WebViewer(config=Config())
+    text = load_document()
+    size = len(text.encode('utf-8'))
+    seconds = min(timeit.repeat(lambda: web_viewer.format_text(text),
+                                number=1,
+                                repeat=repeat))
+    print('{0:<24} {1:>8.1f} KB {2:>8.3f} s {3:>8.2f} MB/s'
+          .format('format_text', size / 1024, seconds,
+                  size / seconds / 1024 / 1024))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""Measure how much main-content extraction cuts the HTML converted.
+
+For each page in tests/data/html2text, prints the HTML bytes converted and
+the rendered text bytes without and with extraction, and the time spent
+extracting and converting.  Pages without clutter, such as the Rust release
+notes, are left whole.  Run from the repo root:
+
+    python benchmarks/extraction_benchmark.py [repeat]
+"""
+
+from __future__ import print_function
+from __future__ import division
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from haxor_news.content_extractor import ContentExtractor  # NOQA
+from haxor_news.web_viewer import WebViewer  # NOQA
+from tests.data.html2text_corpus import CORPUS_DIR, load_html  # NOQA
+
+
+def main(repeat=3):
+    web_viewer = WebViewer()
+    names = sorted(name for name in os.listdir(CORPUS_DIR)
+                   if name.endswith(('.html', '.html.gz')))
+    for name in names:
+        html = load_html(name)
+        size = len(html.encode('utf-8'))
+        extracted_size = len(
+            ContentExtractor().extract(html).encode('utf-8'))
+        text_sizes = []
+        timings = []
+        for extract_content in (False, True):
+            web_viewer.extract_content = extract_content
+            text_sizes.append(len(
+                web_viewer.render_html(html).encode('utf-8')))
+            timings.append(min(timeit.repeat(
+                lambda: web_viewer.render_html(html),
+                number=1,
+                repeat=repeat)))
+        print('{0:<26} {1:>8.1f} KB {2:>8.1f} KB {3:>6.1%} '
+              '{4:>8.1f} KB {5:>8.1f} KB {6:>6.1%} '
+              '{7:>8.3f} s {8:>8.3f} s'
+              .format(name, size / 1024, extracted_size / 1024,
+                      1 - extracted_size / size, text_sizes[0] / 1024,
+                      text_sizes[1] / 1024,
+                      1 - text_sizes[1] / text_sizes[0], timings[0],
+                      timings[1]))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
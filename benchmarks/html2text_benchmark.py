@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""Time the vendored html2text on the corpus in tests/data/html2text.
+
+Run from the repo root:
+
+    python benchmarks/html2text_benchmark.py [repeat]
+
+Both tokenizers are timed when lxml is installed.
+"""
+
+from __future__ import print_function
+from __future__ import division
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from haxor_news.lib.html2text.html2text import HTML2Text, \
+    lxml_etree  # NOQA
+from tests.data.html2text_corpus import SETTINGS, convert, \
+    expected_digests, load_html  # NOQA
+
+
+def main(repeat=3):
+    tokenizers = ['html.parser']
+    if lxml_etree is not None:
+        tokenizers.append('lxml')
+    for name, digests in sorted(expected_digests.items()):
+        size = len(load_html(name).encode('utf-8'))
+        for settings_name in sorted(digests):
+            for tokenizer in tokenizers:
+                seconds = min(timeit.repeat(
+                    lambda: convert(HTML2Text, name, settings_name,
+                                    tokenizer),
+                    number=1,
+                    repeat=repeat))
+                print('{0:<24} {1:<22} {2:<12} {3:>8.1f} KB {4:>8.3f} s '
+                      '{5:>8.2f} MB/s'.format(
+                          name, settings_name, tokenizer, size / 1024,
+                          seconds, size / seconds / 1024 / 1024))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,376 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""Benchmark listing, comment trees, ranked search, rendering, completion
+and startup.
+
+Runs offline, against a synthetic bundle by default or against a bundle
+of real data built with hn bundle build.  Results are written as JSON and
+compared against a stored baseline.  Run from the repo root:
+
+    python benchmarks/suite.py run -o results.json
+    python benchmarks/suite.py run --bundle flight.json.gz -o results.json
+    python benchmarks/suite.py compare baseline.json results.json
+
+compare exits with 1 if any benchmark regressed past the threshold or
+exceeded its latency budget.
+"""
+
+from __future__ import print_function
+from __future__ import division
+
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+import click
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from haxor_news.bm25 import Bm25Index  # NOQA
+from haxor_news.lib.haxor.haxor import Item  # NOQA
+from haxor_news.synthetic import SyntheticGenerator  # NOQA
+from tests.data.html2text_corpus import CORPUS_DIR, load_html  # NOQA
+
+
+COLD_START_COMMANDS = (
+    ('help', ['--help']),
+    ('top', ['top', '10']),
+    ('view_comments', ['view', '1', '-c']),
+    ('user', ['user', 'heavy']),
+)
+COMPLETER_INPUTS = (
+    'hn view 1 --comments_regex_query',
+    'hn hiring "(?i)python" --where',
+    'hn fr',
+)
+RANKED_SEARCH_BUDGET = 0.05
+RANKED_SEARCH_COMMENTS = 1000
+RANKED_SEARCH_QUERY = 'python rust remote senior database'
+RESULTS_VERSION = 1
+
+
+class Quiet(object):
+    """Send stdout to the null device, the output is not measured."""
+
+    def __enter__(self):
+        self.stdout = sys.stdout
+        sys.stdout = open(os.devnull, 'w')
+
+    def __exit__(self, *args):
+        sys.stdout.close()
+        sys.stdout = self.stdout
+
+
+class Context(object):
+    """The data and HackerNews instance shared by the benchmarks.
+
+    HOME points at a temporary directory, so the config and caches of the
+    user are neither read nor written.
+    """
+
+    def __init__(self, bundle_path, repeat):
+        self.repeat = repeat
+        self.home = tempfile.mkdtemp()
+        os.environ['HOME'] = self.home
+        if bundle_path is None:
+            bundle_path = os.path.join(self.home, 'bundle.json.gz')
+            self.create_synthetic_bundle().save(bundle_path)
+        self.bundle_path = os.path.abspath(bundle_path)
+        from haxor_news.hacker_news import HackerNews
+        self.hacker_news = HackerNews()
+        self.hacker_news.bundle_path = self.bundle_path
+        self.hacker_news.load_bundle()
+        self.hacker_news.config.show_tip = False
+        pages = self.hacker_news.bundle.pages
+        self.story_ids = pages.get('topstories', [])[:30]
+        stories = [pages['item/{0}'.format(story_id)]
+                   for story_id in self.story_ids
+                   if 'item/{0}'.format(story_id) in pages]
+        self.thread = max(stories, key=lambda story: len(story.get(
+            'kids', [])))
+
+    def close(self):
+        shutil.rmtree(self.home)
+
+    def create_synthetic_bundle(self):
+        generator = SyntheticGenerator(seed=0)
+        story_ids = [generator.thread(3000, chain_depth=40)]
+        for _ in range(29):
+            story_ids.append(generator.thread(
+                generator.random.randint(0, 200)))
+        generator.story_list('topstories', story_ids)
+        generator.user('heavy', submissions=50000)
+        return generator.to_bundle()
+
+    def measure(self, function, number=1):
+        """Time the given function, best and mean of `repeat` runs.
+
+        :rtype: dict
+        :return: The seconds per call, best and mean.
+        """
+        times = timeit.repeat(function, number=number, repeat=self.repeat)
+        return {
+            'seconds': min(times) / number,
+            'mean': sum(times) / len(times) / number,
+        }
+
+
+def count_comments(context):
+    pages = context.hacker_news.bundle.pages
+    count = 0
+    kids = list(context.thread.get('kids', []))
+    while kids:
+        item = pages.get('item/{0}'.format(kids.pop()))
+        if item is not None:
+            count += 1
+            kids.extend(item.get('kids', []))
+    return count
+
+
+def benchmark_print_items(context):
+    """List 30 stories, like hn top 30."""
+    hacker_news = context.hacker_news
+    with Quiet():
+        result = context.measure(
+            lambda: hacker_news.print_items('', context.story_ids))
+    result['unit'] = 'listing'
+    return result
+
+
+def benchmark_print_comments(context):
+    """Print the whole largest thread, like hn view 1 -c."""
+    hacker_news = context.hacker_news
+    item = Item(context.thread)
+
+    def print_comments():
+        hacker_news.config.item_cache = []
+        hacker_news.print_comments(item)
+
+    with Quiet():
+        result = context.measure(print_comments)
+    result['rate'] = count_comments(context) / result['seconds']
+    result['unit'] = 'comments/s'
+    return result
+
+
+def benchmark_format_comment(context):
+    """Format each top level comment of the largest thread."""
+    pages = context.hacker_news.bundle.pages
+    items = [Item(pages['item/{0}'.format(kid)])
+             for kid in context.thread.get('kids', [])
+             if 'item/{0}'.format(kid) in pages]
+    items = [item for item in items if item.text is not None]
+
+    def format_comments():
+        for item in items:
+            context.hacker_news.format_comment(item, 0, 'yellow', '')
+
+    result = context.measure(format_comments)
+    result['rate'] = len(items) / result['seconds']
+    result['unit'] = 'comments/s'
+    return result
+
+
+def benchmark_ranked_search(context):
+    """Rank a monthly hiring thread from its cached index, like hn hiring -r.
+
+    A busy who is hiring thread has about a thousand top level comments of a
+    few hundred words, ranked search should answer within 50 ms.
+    """
+    generator = SyntheticGenerator(seed=0, text_words=200)
+    texts = [generator.create_text()
+             for _ in range(RANKED_SEARCH_COMMENTS)]
+    serialized = json.dumps(Bm25Index.build(texts).to_dict())
+
+    def search():
+        index = Bm25Index.from_dict(json.loads(serialized))
+        index.top_k(RANKED_SEARCH_QUERY, 10)
+
+    result = context.measure(search)
+    result['budget'] = RANKED_SEARCH_BUDGET
+    result['rate'] = RANKED_SEARCH_COMMENTS / result['seconds']
+    result['unit'] = 'comments/s'
+    return result
+
+
+def benchmark_web_viewer_render(context):
+    """Render the tests/data/html2text corpus as hn view does."""
+    web_viewer = context.hacker_news.web_viewer
+    names = sorted(name for name in os.listdir(CORPUS_DIR)
+                   if name.endswith(('.html', '.html.gz')))
+    pages = [load_html(name) for name in names]
+    size = sum(len(page.encode('utf-8')) for page in pages)
+
+    def render():
+        for page in pages:
+            web_viewer.render_html(page)
+
+    result = context.measure(render)
+    result['rate'] = size / result['seconds'] / 1024 / 1024
+    result['unit'] = 'MB/s'
+    return result
+
+
+def benchmark_completer_keystroke(context):
+    """Complete after each keystroke of a few typed commands."""
+    from prompt_toolkit.document import Document
+    from haxor_news.completer import Completer
+    from haxor_news.utils import TextUtils
+    completer = Completer(fuzzy_match=False, text_utils=TextUtils())
+    texts = [text[:end] for text in COMPLETER_INPUTS
+             for end in range(1, len(text) + 1)]
+    documents = [Document(text=text, cursor_position=len(text))
+                 for text in texts]
+
+    def type_commands():
+        for document in documents:
+            list(completer.get_completions(document, None))
+
+    result = context.measure(type_commands)
+    result['seconds'] /= len(documents)
+    result['mean'] /= len(documents)
+    result['unit'] = 'keystroke'
+    return result
+
+
+def benchmark_cold_start(context, args):
+    """Run hn in a new process, offline from the bundle."""
+    command = [sys.executable, '-m', 'haxor_news.main_cli', '--bundle',
+               context.bundle_path, '--offline'] + args
+    env = dict(os.environ, HOME=context.home, PYTHONPATH=ROOT)
+    with open(os.devnull, 'w') as null:
+        def run():
+            subprocess.call(command, stdout=null, stderr=null, env=env)
+        result = context.measure(run)
+    result['unit'] = 'process'
+    return result
+
+
+def get_benchmarks():
+    """List the benchmarks in the order they run.
+
+    :rtype: list
+    :return: (name, function taking the context) tuples.
+    """
+    benchmarks = [
+        ('print_items', benchmark_print_items),
+        ('print_comments', benchmark_print_comments),
+        ('format_comment', benchmark_format_comment),
+        ('ranked_search', benchmark_ranked_search),
+        ('web_viewer_render', benchmark_web_viewer_render),
+        ('completer_keystroke', benchmark_completer_keystroke),
+    ]
+    for name, args in COLD_START_COMMANDS:
+        benchmarks.append((
+            'cold_start_' + name,
+            lambda context, args=args: benchmark_cold_start(context, args)))
+    return benchmarks
+
+
+def format_result(name, result):
+    line = '{0:<28} {1:>12.6f} s / {2:<10}'.format(
+        name, result['seconds'], result['unit'])
+    if 'rate' in result:
+        line += ' {0:>12.1f} {1}'.format(result['rate'],
+                                         result.get('rate_unit', ''))
+    if result['seconds'] > result.get('budget', float('inf')):
+        line += ' OVER BUDGET {0:.3f} s'.format(result['budget'])
+    return line
+
+
+@click.group()
+def cli():
+    """Run and compare the haxor-news benchmarks."""
+
+
+@cli.command()
+@click.option('-o', '--output', required=True, help='The results file.')
+@click.option('--bundle', 'bundle_path', default=None,
+              help='Benchmark a bundle instead of synthetic data.')
+@click.option('-r', '--repeat', default=5)
+@click.option('-k', '--only', default=None,
+              help='Run the benchmarks whose name starts with this.')
+def run(output, bundle_path, repeat, only):
+    """Run the benchmarks and write the results as JSON."""
+    context = Context(bundle_path, repeat)
+    results = {}
+    try:
+        for name, benchmark in get_benchmarks():
+            if only is not None and not name.startswith(only):
+                continue
+            result = benchmark(context)
+            if 'rate' in result:
+                result['rate_unit'] = result['unit']
+                result['unit'] = 'run'
+            results[name] = result
+            click.echo(format_result(name, result))
+    finally:
+        context.close()
+    with open(output, 'w') as output_file:
+        json.dump({
+            'version': RESULTS_VERSION,
+            'created': time.time(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'bundle': bundle_path,
+            'benchmarks': results,
+        }, output_file, indent=2, sort_keys=True)
+
+
+@cli.command()
+@click.argument('baseline', type=click.File('r'))
+@click.argument('results', type=click.File('r'))
+@click.option('-t', '--threshold', default=0.1,
+              help='The slowdown flagged as a regression, 0.1 is 10%.')
+def compare(baseline, results, threshold):
+    """Compare results against a baseline, flagging regressions."""
+    baseline = json.load(baseline)['benchmarks']
+    results = json.load(results)['benchmarks']
+    regressions = []
+    for name in sorted(set(baseline) | set(results)):
+        if name not in results or name not in baseline:
+            click.echo('{0:<28} {1}'.format(
+                name, 'missing' if name not in results else 'new'))
+            continue
+        ratio = results[name]['seconds'] / baseline[name]['seconds']
+        status = ''
+        if results[name]['seconds'] > \
+                results[name].get('budget', float('inf')):
+            status = 'OVER BUDGET'
+            regressions.append(name)
+        elif ratio > 1 + threshold:
+            status = 'REGRESSION'
+            regressions.append(name)
+        elif ratio < 1 / (1 + threshold):
+            status = 'improved'
+        click.echo('{0:<28} {1:>12.6f} s {2:>12.6f} s {3:>7.2f}x {4}'.format(
+            name, baseline[name]['seconds'], results[name]['seconds'], ratio,
+            status))
+    if regressions:
+        click.secho('{0} regression(s): {1}'.format(
+            len(regressions), ', '.join(regressions)), fg='red')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    cli()
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+from collections import deque
+
+
+class AhoCorasick(object):
+    """Match many keywords against a text in a single linear pass.
+
+    The automaton is built once from the keywords and can then scan any
+    number of texts.  Matching is case insensitive and only reports keywords
+    that start and end on a word boundary, so 'go' does not match 'google'
+    while 'c++' still matches 'c++,'.
+
+    :type fail: list
+    :param fail: The failure transition of each state.
+
+    :type goto: list
+    :param goto: The goto transitions of each state, a dict mapping a
+        character to the next state.
+
+    :type keywords: list
+    :param keywords: The keywords, as given.
+
+    :type outputs: list
+    :param outputs: The indices of the keywords ending in each state.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = list(keywords)
+        self.goto = [{}]
+        self.fail = [0]
+        self.outputs = [[]]
+        for keyword_index, keyword in enumerate(self.keywords):
+            self._add_keyword(keyword_index, keyword.lower())
+        self._build_fail_transitions()
+
+    def _add_keyword(self, keyword_index, keyword):
+        """Add a keyword to the trie.
+
+        :type keyword_index: int
+        :param keyword_index: The index of the keyword in keywords.
+
+        :type keyword: str
+        :param keyword: The lower cased keyword.
+        """
+        if not keyword:
+            return
+        state = 0
+        for char in keyword:
+            next_state = self.goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto.append({})
+                self.fail.append(0)
+                self.outputs.append([])
+                self.goto[state][char] = next_state
+            state = next_state
+        self.outputs[state].append(keyword_index)
+
+    def _build_fail_transitions(self):
+        """Compute the failure transitions breadth first."""
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                if self.fail[next_state] == next_state:
+                    self.fail[next_state] = 0
+                self.outputs[next_state] = self.outputs[next_state] + \
+                    self.outputs[self.fail[next_state]]
+
+    def _on_boundary(self, text, start, end):
+        """Determine if text[start:end] is delimited by word boundaries.
+
+        Only alphanumeric keyword edges need a boundary.
+
+        :type text: str
+        :param text: The lower cased text.
+
+        :type start: int
+        :param start: The match start index.
+
+        :type end: int
+        :param end: The match end index, exclusive.
+
+        :rtype: bool
+        :return: Specifies if the match is a whole word.
+        """
+        if start > 0 and text[start].isalnum() and text[start-1].isalnum():
+            return False
+        if end < len(text) and text[end-1].isalnum() and text[end].isalnum():
+            return False
+        return True
+
+    def find_all(self, text):
+        """Find all keyword occurrences in the text.
+
+        :type text: str
+        :param text: The text to scan.
+
+        :rtype: generator
+        :return: Yields (start index, keyword index) tuples in the order the
+            matches end.
+        """
+        text = text.lower()
+        goto = self.goto
+        fail = self.fail
+        outputs = self.outputs
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword_index in outputs[state]:
+                start = index + 1 - len(self.keywords[keyword_index])
+                if self._on_boundary(text, start, index + 1):
+                    yield start, keyword_index
+
+    def matches(self, text):
+        """Get the distinct keywords found in the text.
+
+        :type text: str
+        :param text: The text to scan.
+
+        :rtype: list
+        :return: The matched keywords, in keywords order.
+        """
+        keyword_indices = set(keyword_index for _, keyword_index
+                              in self.find_all(text))
+        return [self.keywords[keyword_index]
+                for keyword_index in sorted(keyword_indices)]
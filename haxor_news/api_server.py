@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""A local stand-in for the Hacker News Firebase v0 API.
+
+Serves the pages of a bundle, see `bundle.Bundle`, with injected latency,
+errors, slow bodies and rate limiting, to test concurrency, retries and
+deadlines without hitting the real API:
+
+    python -m haxor_news.api_server --bundle flight.json.gz \\
+        --latency lognormal:0.08,0.5 --error_rate 0.02 --rate_limit 50
+    HAXOR_API_URL=http://127.0.0.1:8000/v0/ hn top
+"""
+
+from __future__ import print_function
+from __future__ import division
+
+import json
+import math
+import random
+import threading
+import time
+
+import click
+
+from .bundle import Bundle, InvalidBundle
+from .compat import BaseHTTPRequestHandler, HTTPServer, ThreadingMixIn
+from .compat import urlparse
+
+
+class LatencyDistribution(object):
+    """Draw request latencies in seconds from a distribution.
+
+    The distribution is given as kind:parameters, one of:
+        fixed:SECONDS
+        uniform:LOW,HIGH
+        exponential:MEAN
+        lognormal:MEDIAN,SIGMA
+
+    :type kind: str
+    :param kind: The distribution kind, a key of KINDS.
+
+    :type KINDS: dict (const)
+    :param KINDS: Maps a distribution kind to its number of parameters.
+
+    :type parameters: list
+    :param parameters: The distribution parameters.
+
+    :type random: :class:`random.Random`
+    :param random: The random number generator.
+    """
+
+    KINDS = {
+        'exponential': 1,
+        'fixed': 1,
+        'lognormal': 2,
+        'uniform': 2,
+    }
+
+    def __init__(self, spec='fixed:0', random_=None):
+        kind, _, parameters = spec.partition(':')
+        if kind not in self.KINDS:
+            raise ValueError('Unknown latency distribution: ' + spec)
+        try:
+            self.parameters = [float(parameter)
+                               for parameter in parameters.split(',')]
+        except ValueError:
+            raise ValueError('Invalid latency distribution: ' + spec)
+        if len(self.parameters) != self.KINDS[kind] or \
+                min(self.parameters) < 0:
+            raise ValueError('Invalid latency distribution: ' + spec)
+        self.kind = kind
+        self.random = random_ if random_ is not None else random.Random()
+
+    def sample(self):
+        """Draw a latency.
+
+        :rtype: float
+        :return: The latency in seconds.
+        """
+        if self.kind == 'fixed':
+            return self.parameters[0]
+        if self.kind == 'uniform':
+            return self.random.uniform(*self.parameters)
+        if self.kind == 'exponential':
+            if not self.parameters[0]:
+                return 0
+            return self.random.expovariate(1 / self.parameters[0])
+        median, sigma = self.parameters
+        if not median:
+            return 0
+        return self.random.lognormvariate(math.log(median), sigma)
+
+
+class TokenBucket(object):
+    """Limit the request rate, allowing short bursts.
+
+    :type burst: int
+    :param burst: The maximum number of tokens.
+
+    :type rate: float
+    :param rate: The tokens added per second.
+
+    :type tokens: float
+    :param tokens: The available tokens.
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self.tokens = self.burst
+        self.updated = time.time()
+        self._lock = threading.Lock()
+
+    def take(self):
+        """Take a token.
+
+        :rtype: float
+        :return: 0 if a token was taken, else the seconds until the next
+            token is available.
+        """
+        with self._lock:
+            now = time.time()
+            self.tokens = min(self.burst,
+                              self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+            return (1 - self.tokens) / self.rate
+
+
+class ApiRequestHandler(BaseHTTPRequestHandler):
+    """Hand the requests to `ApiServer.handle_api`."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.handle_api(self)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ApiServer(ThreadingMixIn, HTTPServer):
+    """Serve the Firebase v0 routes from a page store with injected faults.
+
+    Pages missing from the store are served as null, like the real API
+    does for unknown items and users.  maxitem and updates are derived from
+    the store unless it has them.
+
+    :type counts: dict
+    :param counts: Counts the requests, errors, rate_limited and
+        slow_bodies served.
+
+    :type error_rate: float
+    :param error_rate: The fraction of requests failing with a 500.
+
+    :type latency: :class:`LatencyDistribution`
+    :param latency: The distribution of the delay before each response.
+
+    :type pages: dict
+    :param pages: Maps an API path, such as item/8863 or topstories, to its
+        JSON response, see `bundle.Bundle.pages`.
+
+    :type random: :class:`random.Random`
+    :param random: The random number generator deciding the faults.
+
+    :type rate_limiter: :class:`TokenBucket`
+    :param rate_limiter: Answers requests over the rate limit with a 429,
+        or None for no limit.
+
+    :type slow_body: float
+    :param slow_body: The seconds a slow body takes to send.
+
+    :type SLOW_BODY_CHUNKS: int (const)
+    :param SLOW_BODY_CHUNKS: The number of pieces a slow body is sent in.
+
+    :type slow_body_rate: float
+    :param slow_body_rate: The fraction of responses sent slowly.
+    """
+
+    SLOW_BODY_CHUNKS = 10
+    daemon_threads = True
+
+    def __init__(self, pages, host='127.0.0.1', port=0, latency=None,
+                 error_rate=0, slow_body=0, slow_body_rate=0,
+                 rate_limit=None, burst=None, seed=None):
+        self.random = random.Random(seed)
+        self.latency = LatencyDistribution(latency or 'fixed:0', self.random)
+        HTTPServer.__init__(self, (host, port), ApiRequestHandler)
+        self.pages = pages
+        self.error_rate = error_rate
+        self.slow_body = slow_body
+        self.slow_body_rate = slow_body_rate
+        self.rate_limiter = None
+        if rate_limit:
+            self.rate_limiter = TokenBucket(rate_limit, burst)
+        self.counts = {
+            'errors': 0,
+            'rate_limited': 0,
+            'requests': 0,
+            'slow_bodies': 0,
+        }
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        """The base url to use as HAXOR_API_URL.
+
+        :rtype: str
+        :return: The base url.
+        """
+        host, port = self.server_address[:2]
+        return 'http://{0}:{1}/v0/'.format(host, port)
+
+    def count(self, name):
+        with self._lock:
+            self.counts[name] += 1
+
+    def draw(self):
+        with self._lock:
+            return self.random.random()
+
+    def get_page(self, path):
+        """Get the JSON of the given API path.
+
+        :type path: str
+        :param path: The API path, such as item/8863.
+
+        :rtype: object
+        :return: The JSON, or None if the page is unknown.
+        """
+        if path in self.pages:
+            return self.pages[path]
+        if path == 'maxitem':
+            item_ids = [int(page[len('item/'):]) for page in self.pages
+                        if page.startswith('item/')]
+            return max(item_ids) if item_ids else 0
+        if path == 'updates':
+            return {'items': [], 'profiles': []}
+        return None
+
+    def handle_api(self, handler):
+        """Answer an API request, injecting the configured faults.
+
+        :type handler: :class:`ApiRequestHandler`
+        :param handler: The request handler.
+        """
+        self.count('requests')
+        path = urlparse(handler.path).path
+        if not path.startswith('/v0/') or not path.endswith('.json'):
+            self.send(handler, 404, {'error': 'Not found'})
+            return
+        if self.rate_limiter is not None:
+            wait = self.rate_limiter.take()
+            if wait:
+                self.count('rate_limited')
+                self.send(handler, 429, {'error': 'Too many requests'},
+                          {'Retry-After': str(int(math.ceil(wait)))})
+                return
+        latency = self.latency.sample()
+        if latency:
+            time.sleep(latency)
+        if self.error_rate and self.draw() < self.error_rate:
+            self.count('errors')
+            self.send(handler, 500, {'error': 'Injected error'})
+            return
+        slow = bool(self.slow_body_rate) and \
+            self.draw() < self.slow_body_rate
+        if slow:
+            self.count('slow_bodies')
+        page = self.get_page(path[len('/v0/'):-len('.json')])
+        self.send(handler, 200, page, slow=slow)
+
+    def send(self, handler, status, data, headers=None, slow=False):
+        """Send a JSON response.
+
+        :type handler: :class:`ApiRequestHandler`
+        :param handler: The request handler.
+
+        :type status: int
+        :param status: The status code.
+
+        :type data: object
+        :param data: The JSON.
+
+        :type headers: dict
+        :param headers: Additional response headers.
+
+        :type slow: bool
+        :param slow: Specifies if the body is sent in SLOW_BODY_CHUNKS
+            pieces over slow_body seconds.
+        """
+        body = json.dumps(data).encode('utf-8')
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'application/json; charset=utf-8')
+        handler.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        try:
+            if not slow:
+                handler.wfile.write(body)
+                return
+            size = int(math.ceil(len(body) / self.SLOW_BODY_CHUNKS))
+            for start in range(0, len(body), size):
+                time.sleep(self.slow_body / self.SLOW_BODY_CHUNKS)
+                handler.wfile.write(body[start:start+size])
+                handler.wfile.flush()
+        except (IOError, OSError):
+            # The client gave up, such as after a read timeout.
+            pass
+
+
+@click.command()
+@click.option('--bundle', 'bundle_path', required=True,
+              help='The bundle serving as fixtures, see hn bundle build.')
+@click.option('--host', default='127.0.0.1')
+@click.option('--port', default=8000)
+@click.option('--latency', default='fixed:0',
+              help='fixed:S, uniform:LOW,HIGH, exponential:MEAN or '
+                   'lognormal:MEDIAN,SIGMA, in seconds.')
+@click.option('--error_rate', default=0.0,
+              help='The fraction of requests failing with a 500.')
+@click.option('--slow_body', default=0.0,
+              help='The seconds a slow body takes to send.')
+@click.option('--slow_body_rate', default=0.0,
+              help='The fraction of responses sent slowly.')
+@click.option('--rate_limit', default=0.0,
+              help='The requests per second allowed, 0 for no limit.')
+@click.option('--burst', default=None, type=int,
+              help='The requests allowed at once, defaults to the rate.')
+@click.option('--seed', default=None, type=int)
+def main(bundle_path, host, port, latency, error_rate, slow_body,
+         slow_body_rate, rate_limit, burst, seed):
+    """Serve the Hacker News API locally from a bundle."""
+    try:
+        pages = Bundle.load(bundle_path).pages
+    except InvalidBundle as e:
+        raise click.BadParameter(str(e), param_hint='--bundle')
+    try:
+        server = ApiServer(pages, host, port, latency, error_rate, slow_body,
+                           slow_body_rate, rate_limit, burst, seed)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint='--latency')
+    click.echo('Serving {0} pages on {1}'.format(len(pages), server.base_url))
+    click.echo('Run: HAXOR_API_URL={0} hn top'.format(server.base_url))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
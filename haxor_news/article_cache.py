@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+import hashlib
+import json
+import os
+import zlib
+
+from .compat import replace_file
+
+
+class ArticleCache(object):
+    """Cache fetched articles and their rendered views on disk.
+
+    Each article is stored under the sha1 hash of its url as two files:
+        <key>.json: The article metadata, a dict with the following keys:
+            url: The article url.
+            etag: The ETag validator of the response, or None.
+            last_modified: The Last-Modified validator, or None.
+            encoding: The encoding of the raw HTML.
+            encoding_source: How the encoding was found, see
+                `charset_detector.CharsetDetector`.
+            fetched: The epoch timestamp the article was last validated.
+            renders: Maps a render settings key to the rendered text.
+            truncated: Specifies if the raw HTML was cut short.
+        <key>.html.z: The zlib compressed raw HTML.
+
+    :type cache_dir: str
+    :param cache_dir: The directory holding the cached articles.
+
+    :type MAX_RENDERS: int (const)
+    :param MAX_RENDERS: The maximum number of renders kept per article.
+    """
+
+    MAX_RENDERS = 4
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def _write(self, path, data):
+        """Write bytes to the cache.
+
+        Writes to a temporary file first so a concurrent reader never sees a
+        partially written file.
+
+        :type path: str
+        :param path: The cache file path.
+
+        :type data: bytes
+        :param data: The data to write.
+        """
+        if not os.path.isdir(self.cache_dir):
+            try:
+                os.makedirs(self.cache_dir)
+            except OSError:
+                # Another process may have created it in the meantime.
+                if not os.path.isdir(self.cache_dir):
+                    raise
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as cache_file:
+            cache_file.write(data)
+        replace_file(temp_path, path)
+
+    def get_path(self, url, extension):
+        """Get a cache file path for the given article.
+
+        :type url: str
+        :param url: The article url.
+
+        :type extension: str
+        :param extension: The cache file extension.
+
+        :rtype: str
+        :return: The cache file path.
+        """
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, key + extension)
+
+    def load(self, url):
+        """Load the given article from the cache.
+
+        :type url: str
+        :param url: The article url.
+
+        :rtype: tuple
+        :return: The article metadata and raw HTML bytes, or (None, None) if
+            the article is not cached or its cache files are unreadable.
+        """
+        try:
+            with open(self.get_path(url, '.json')) as meta_file:
+                article = json.load(meta_file)
+            with open(self.get_path(url, '.html.z'), 'rb') as html_file:
+                html = zlib.decompress(html_file.read())
+        except (IOError, ValueError, zlib.error):
+            return None, None
+        if article.get('url') != url:
+            return None, None
+        return article, html
+
+    def save(self, article, html=None):
+        """Save the given article to the cache.
+
+        At most MAX_RENDERS renders are kept, the oldest are dropped first.
+
+        :type article: dict
+        :param article: The article metadata.
+
+        :type html: bytes
+        :param html: The raw HTML, or None to keep the cached HTML.
+        """
+        url = article['url']
+        renders = article['renders']
+        for render_key in list(renders)[:-self.MAX_RENDERS]:
+            del renders[render_key]
+        if html is not None:
+            self._write(self.get_path(url, '.html.z'), zlib.compress(html))
+        self._write(self.get_path(url, '.json'),
+                    json.dumps(article).encode('utf-8'))
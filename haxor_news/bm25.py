@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+import heapq
+import math
+import re
+
+from .compat import HTMLParser
+
+try:
+    unescape = HTMLParser.HTMLParser().unescape
+except AttributeError:
+    unescape = HTMLParser.unescape
+
+
+class Bm25Index(object):
+    """Rank documents against a query with Okapi BM25.
+
+    The index stores term frequencies as posting lists so scoring a query
+    only touches the documents that contain at least one query term.
+
+    :type avg_doc_length: float
+    :param avg_doc_length: The average document length in tokens.
+
+    :type B: float (const)
+    :param B: The document length normalization parameter.
+
+    :type doc_lengths: list
+    :param doc_lengths: The length in tokens of each document.
+
+    :type K1: float (const)
+    :param K1: The term frequency saturation parameter.
+
+    :type postings: dict
+    :param postings: Maps a term to a list of [doc index, term frequency].
+
+    :type VERSION: int (const)
+    :param VERSION: The version of the serialized index, bumped whenever
+        tokenizing changes so cached indices are rebuilt.
+    """
+
+    B = 0.75
+    K1 = 1.2
+    REGEX_TAG = re.compile(r'<[^>]*>')
+    REGEX_TOKEN = re.compile(r'[a-z0-9][a-z0-9+#]*')
+    VERSION = 2
+
+    def __init__(self, postings=None, doc_lengths=None):
+        self.postings = postings if postings is not None else {}
+        self.doc_lengths = doc_lengths if doc_lengths is not None else []
+        self.avg_doc_length = self._compute_avg_doc_length()
+
+    def _compute_avg_doc_length(self):
+        """Compute the average document length.
+
+        :rtype: float
+        :return: The average document length, 0 if there are no documents.
+        """
+        if not self.doc_lengths:
+            return 0.0
+        return sum(self.doc_lengths) / len(self.doc_lengths)
+
+    @classmethod
+    def build(cls, docs):
+        """Build an index over the given documents.
+
+        :type docs: iterable
+        :param docs: A collection of document strings, which may contain
+            html markup.
+
+        :rtype: :class:`Bm25Index`
+        :return: The index, where document indices follow the order of docs.
+        """
+        postings = {}
+        doc_lengths = []
+        for doc_index, doc in enumerate(docs):
+            term_counts = {}
+            tokens = cls.tokenize(doc)
+            for token in tokens:
+                term_counts[token] = term_counts.get(token, 0) + 1
+            for term, count in term_counts.items():
+                postings.setdefault(term, []).append([doc_index, count])
+            doc_lengths.append(len(tokens))
+        return cls(postings, doc_lengths)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Load an index previously serialized with `to_dict`.
+
+        :type data: dict
+        :param data: The serialized index.
+
+        :rtype: :class:`Bm25Index`
+        :return: The index.
+        """
+        return cls(data['postings'], data['doc_lengths'])
+
+    @classmethod
+    def tokenize(cls, text):
+        """Split text into lower case terms, ignoring html tags and entities.
+
+        :type text: str
+        :param text: The text to tokenize.
+
+        :rtype: list
+        :return: The terms in order of appearance.
+        """
+        if not text:
+            return []
+        text = unescape(cls.REGEX_TAG.sub(' ', text))
+        return cls.REGEX_TOKEN.findall(text.lower())
+
+    def score(self, query):
+        """Score every document matching at least one query term.
+
+        :type query: str
+        :param query: The free text query.
+
+        :rtype: dict
+        :return: Maps a doc index to its BM25 score.
+        """
+        scores = {}
+        num_docs = len(self.doc_lengths)
+        if not num_docs or not self.avg_doc_length:
+            return scores
+        for term in set(self.tokenize(query)):
+            term_postings = self.postings.get(term)
+            if not term_postings:
+                continue
+            doc_freq = len(term_postings)
+            idf = math.log(1 + (num_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+            for doc_index, term_freq in term_postings:
+                norm = self.K1 * (1 - self.B + self.B *
+                                  self.doc_lengths[doc_index] /
+                                  self.avg_doc_length)
+                scores[doc_index] = scores.get(doc_index, 0.0) + \
+                    idf * term_freq * (self.K1 + 1) / (term_freq + norm)
+        return scores
+
+    def to_dict(self):
+        """Serialize the index to a json compatible dict.
+
+        :rtype: dict
+        :return: The serialized index.
+        """
+        return {
+            'postings': self.postings,
+            'doc_lengths': self.doc_lengths,
+            'version': self.VERSION,
+        }
+
+    def top_k(self, query, k):
+        """Get the k best matching documents.
+
+        Uses a bounded heap instead of sorting every scored document.
+
+        :type query: str
+        :param query: The free text query.
+
+        :type k: int
+        :param k: The maximum number of results.
+
+        :rtype: list
+        :return: A list of (doc index, score) tuples, best match first.
+        """
+        scores = self.score(query)
+        return heapq.nlargest(k, scores.items(), key=lambda pair: pair[1])
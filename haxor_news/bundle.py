@@ -0,0 +1,403 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+import gzip
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from .compat import replace_file
+from .lib.haxor.haxor import HackerNewsApi, HTTPError
+
+
+class InvalidBundle(Exception):
+    pass
+
+
+class Bundle(object):
+    """An offline snapshot of Hacker News, stored as a gzipped JSON file.
+
+    :type articles: dict
+    :param articles: Maps an article url to a dict with the following keys:
+            article: The article metadata, see `article_cache.ArticleCache`.
+            html: The raw HTML bytes decoded as latin-1, which maps each
+                byte to one character.
+
+    :type created: float
+    :param created: The epoch timestamp the bundle was built.
+
+    :type freelance_id: int
+    :param freelance_id: The bundled monthly freelancer post id, or 0.
+
+    :type hiring_id: int
+    :param hiring_id: The bundled monthly who's hiring post id, or 0.
+
+    :type pages: dict
+    :param pages: Maps an API path, such as item/8863, user/pg or
+        topstories, to its JSON response.
+
+    :type VERSION: int (const)
+    :param VERSION: The bundle file format version.
+    """
+
+    VERSION = 1
+
+    def __init__(self):
+        self.articles = {}
+        self.created = time.time()
+        self.freelance_id = 0
+        self.hiring_id = 0
+        self.pages = {}
+
+    @classmethod
+    def load(cls, path):
+        """Load a bundle file.
+
+        :type path: str
+        :param path: The bundle file path.
+
+        :rtype: :class:`Bundle`
+        :return: The bundle.
+
+        :raises: `InvalidBundle` if the file is missing, unreadable or of
+            another version.
+        """
+        try:
+            with gzip.open(path, 'rb') as bundle_file:
+                data = json.loads(bundle_file.read().decode('utf-8'))
+        except (IOError, OSError, ValueError) as e:
+            raise InvalidBundle('Cannot read bundle {0}: {1}'.format(path, e))
+        if data.get('version') != cls.VERSION:
+            raise InvalidBundle('Unsupported bundle version in ' + path)
+        bundle = cls()
+        bundle.articles = data['articles']
+        bundle.created = data['created']
+        bundle.freelance_id = data['freelance_id']
+        bundle.hiring_id = data['hiring_id']
+        bundle.pages = data['pages']
+        return bundle
+
+    def save(self, path):
+        """Save the bundle to a file.
+
+        Writes to a temporary file first so an interrupted build never
+        leaves a truncated bundle behind.
+
+        :type path: str
+        :param path: The bundle file path.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        data = {
+            'articles': self.articles,
+            'created': self.created,
+            'freelance_id': self.freelance_id,
+            'hiring_id': self.hiring_id,
+            'pages': self.pages,
+            'version': self.VERSION,
+        }
+        temp_path = path + '.tmp'
+        with gzip.open(temp_path, 'wb') as bundle_file:
+            bundle_file.write(json.dumps(data).encode('utf-8'))
+        replace_file(temp_path, path)
+
+
+class BundleArticleCache(object):
+    """Serve the articles of a bundle through the ArticleCache interface.
+
+    New renders are kept in memory, the bundle file is never written.
+
+    :type bundle: :class:`Bundle`
+    :param bundle: The bundle.
+    """
+
+    def __init__(self, bundle):
+        self.bundle = bundle
+
+    def load(self, url):
+        """Load the given article from the bundle.
+
+        :type url: str
+        :param url: The article url.
+
+        :rtype: tuple
+        :return: The article metadata and raw HTML bytes, or (None, None) if
+            the article is not bundled.
+        """
+        entry = self.bundle.articles.get(url)
+        if entry is None:
+            return None, None
+        return entry['article'], entry['html'].encode('latin-1')
+
+    def save(self, article, html=None):
+        """Save the given article to the bundle in memory.
+
+        :type article: dict
+        :param article: The article metadata.
+
+        :type html: bytes
+        :param html: The raw HTML, or None to keep the bundled HTML.
+        """
+        entry = self.bundle.articles.setdefault(article['url'], {'html': ''})
+        entry['article'] = article
+        if html is not None:
+            entry['html'] = html.decode('latin-1')
+
+
+class BundleResponse(object):
+    """The part of a `requests.Response` used by `HackerNewsApi`.
+
+    :type data: object
+    :param data: The decoded JSON.
+
+    :type status_code: int
+    :param status_code: The HTTP status code.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.status_code = 200
+
+    def json(self):
+        return self.data
+
+
+class OfflineHackerNewsApi(HackerNewsApi):
+    """Serve the Hacker News API from a bundle, without any request.
+
+    Items and users missing from the bundle are reported as not found,
+    other missing pages as an `HTTPError`.
+
+    :type bundle: :class:`Bundle`
+    :param bundle: The bundle.
+    """
+
+    def __init__(self, bundle):
+        super(OfflineHackerNewsApi, self).__init__()
+        self.bundle = bundle
+
+    def _get(self, url, timeout=None):
+        path = url[len(self.base_url):-len('.json')]
+        try:
+            return BundleResponse(self.bundle.pages[path])
+        except KeyError:
+            if path.startswith(('item/', 'user/')):
+                return BundleResponse(None)
+            raise HTTPError
+
+
+class BundleBuilder(object):
+    """Build a bundle from the Hacker News API and the web.
+
+    :type bundle: :class:`Bundle`
+    :param bundle: The bundle being built.
+
+    :type hacker_news_api: :class:`haxor.HackerNewsApi`
+    :param hacker_news_api: An instance of `haxor.HackerNewsApi`.
+
+    :type STORY_LISTS: tuple (const)
+    :param STORY_LISTS: The API pages listing story ids.
+
+    :type web_viewer: :class:`web_viewer.WebViewer`
+    :param web_viewer: An instance of `web_viewer.WebViewer` with an
+        article cache.
+    """
+
+    STORY_LISTS = (
+        'askstories',
+        'beststories',
+        'jobstories',
+        'newstories',
+        'showstories',
+        'topstories',
+    )
+
+    def __init__(self, hacker_news_api, web_viewer):
+        self.bundle = Bundle()
+        self.hacker_news_api = hacker_news_api
+        self.web_viewer = web_viewer
+
+    def add_articles(self, urls):
+        """Fetch, render and bundle the given articles.
+
+        The articles are fetched and rendered in parallel with the current
+        render settings, see `web_viewer.WebViewer.render_many`, and read
+        back from the article cache with their renders.
+
+        :type urls: list
+        :param urls: The article urls.
+
+        :rtype: int
+        :return: The number of bundled articles.
+        """
+        count = 0
+        for url, _ in self.web_viewer.render_many(urls):
+            article, html = self.web_viewer.article_cache.load(url)
+            if article is None:
+                continue
+            self.bundle.articles[url] = {
+                'article': article,
+                'html': html.decode('latin-1'),
+            }
+            count += 1
+        return count
+
+    def add_comments(self, items, depth=None):
+        """Bundle the comment trees of the given items.
+
+        Fetches the trees level by level, each level concurrently.
+
+        :type items: list
+        :param items: The `haxor.Item` objects whose comments to bundle.
+
+        :type depth: int
+        :param depth: The number of levels to bundle, or None for the whole
+            trees.
+
+        :rtype: int
+        :return: The number of bundled comments.
+        """
+        count = 0
+        kids = [kid for item in items for kid in item.kids or []]
+        while kids and depth != 0:
+            comments = self.add_items(kids)
+            count += len(comments)
+            kids = [kid for comment in comments for kid in comment.kids or []]
+            if depth is not None:
+                depth -= 1
+        return count
+
+    def add_items(self, item_ids):
+        """Fetch and bundle the given items concurrently.
+
+        :type item_ids: list
+        :param item_ids: The item ids.
+
+        :rtype: list
+        :return: The fetched `haxor.Item` objects.
+        """
+        items = self.hacker_news_api.get_items(item_ids)
+        for item in items:
+            self.bundle.pages['item/{0}'.format(item.item_id)] = \
+                json.loads(item.raw)
+        return items
+
+    def add_story_lists(self, limit):
+        """Fetch and bundle the first stories of every story list.
+
+        Lists that failed to fetch are left out.
+
+        :type limit: int
+        :param limit: The number of stories bundled per list.
+
+        :rtype: list
+        :return: The ids of the bundled stories, without duplicates.
+        """
+        def get_story_list(page):
+            try:
+                return self.hacker_news_api._get_page(page).json()[:limit]
+            except (HTTPError, requests.exceptions.RequestException):
+                return None
+
+        with ThreadPoolExecutor(len(self.STORY_LISTS)) as executor:
+            story_lists = list(executor.map(get_story_list,
+                                            self.STORY_LISTS))
+        story_ids = []
+        for page, story_list in zip(self.STORY_LISTS, story_lists):
+            if story_list is None:
+                continue
+            self.bundle.pages[page] = story_list
+            story_ids.extend(story_id for story_id in story_list
+                             if story_id not in story_ids)
+        return story_ids
+
+    def add_users(self, user_ids):
+        """Fetch and bundle the given users concurrently.
+
+        Users that do not exist or failed to fetch are left out.
+
+        :type user_ids: list
+        :param user_ids: The user ids.
+        """
+        def get_user_data(user_id):
+            try:
+                return self.hacker_news_api._get_page_param(
+                    'user', user_id).json()
+            except (HTTPError, requests.exceptions.RequestException):
+                return None
+
+        user_ids = list(user_ids)
+        if not user_ids:
+            return
+        with ThreadPoolExecutor(self.hacker_news_api.MAX_WORKERS) as executor:
+            for user_id, data in zip(user_ids,
+                                     executor.map(get_user_data, user_ids)):
+                if data:
+                    self.bundle.pages['user/' + user_id] = data
+
+    def build(self, limit, with_comments=False, with_articles=False,
+              monthly_posts=None):
+        """Build a bundle.
+
+        Bundles the first stories of each story list with their authors.
+        Comment trees and articles are fetched concurrently with each
+        other.  The monthly posts are always bundled with their top level
+        comments, which hn hiring and hn freelance search.
+
+        :type limit: int
+        :param limit: The number of stories bundled per list.
+
+        :type with_comments: bool
+        :param with_comments: Specifies if the comment trees are bundled.
+
+        :type with_articles: bool
+        :param with_articles: Specifies if the rendered articles are
+            bundled.
+
+        :type monthly_posts: tuple
+        :param monthly_posts: The who's hiring and freelancer post ids, or
+            None to leave them out.
+
+        :rtype: dict
+        :return: The number of bundled stories, comments and articles.
+        """
+        stories = self.add_items(self.add_story_lists(limit))
+        self.add_users(set(story.by for story in stories if story.by))
+        posts = []
+        if monthly_posts is not None:
+            self.bundle.hiring_id, self.bundle.freelance_id = monthly_posts
+            posts = self.add_items(list(monthly_posts))
+        urls = []
+        for story in stories:
+            if story.url and story.url not in urls:
+                urls.append(story.url)
+        counts = {'stories': len(stories), 'comments': 0, 'articles': 0}
+        with ThreadPoolExecutor(1) as executor:
+            articles_future = None
+            if with_articles and urls:
+                articles_future = executor.submit(self.add_articles, urls)
+            counts['comments'] = self.add_comments(
+                posts, depth=None if with_comments else 1)
+            if with_comments:
+                counts['comments'] += self.add_comments(stories)
+            if articles_future is not None:
+                counts['articles'] = articles_future.result()
+        return counts
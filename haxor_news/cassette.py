@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+import datetime
+import gzip
+import io
+import json
+import threading
+import time
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .compat import replace_file
+
+
+class InvalidCassette(Exception):
+    pass
+
+
+class Cassette(object):
+    """Recorded HTTP interactions, stored as a gzipped JSON file.
+
+    Each interaction is a dict with the following keys:
+        method: The request method.
+        url: The request url.
+        status: The response status code.
+        reason: The response reason phrase.
+        headers: The response headers.
+        body: The decoded response body, as bytes decoded as latin-1.
+        latency: The seconds until the response headers arrived.
+        body_time: The seconds spent reading the body.
+
+    :type interactions: list
+    :param interactions: The interactions, in the order they were recorded.
+
+    :type SKIPPED_HEADERS: tuple (const)
+    :param SKIPPED_HEADERS: The headers left out of a recording, since the
+        recorded body is decoded.
+
+    :type VERSION: int (const)
+    :param VERSION: The cassette file format version.
+    """
+
+    SKIPPED_HEADERS = ('content-encoding', 'content-length',
+                       'transfer-encoding')
+    VERSION = 1
+
+    def __init__(self, interactions=None):
+        self.interactions = interactions if interactions is not None else []
+        self._lock = threading.Lock()
+        self._replayed = {}
+
+    @classmethod
+    def load(cls, path):
+        """Load a cassette file.
+
+        :type path: str
+        :param path: The cassette file path.
+
+        :rtype: :class:`Cassette`
+        :return: The cassette.
+
+        :raises: `InvalidCassette` if the file is missing, unreadable or of
+            another version.
+        """
+        try:
+            with gzip.open(path, 'rb') as cassette_file:
+                data = json.loads(cassette_file.read().decode('utf-8'))
+        except (IOError, OSError, ValueError) as e:
+            raise InvalidCassette(
+                'Cannot read cassette {0}: {1}'.format(path, e))
+        if data.get('version') != cls.VERSION:
+            raise InvalidCassette('Unsupported cassette version in ' + path)
+        return cls(data['interactions'])
+
+    def save(self, path):
+        """Save the cassette to a file.
+
+        :type path: str
+        :param path: The cassette file path.
+        """
+        data = {'interactions': self.interactions, 'version': self.VERSION}
+        temp_path = path + '.tmp'
+        with gzip.open(temp_path, 'wb') as cassette_file:
+            cassette_file.write(json.dumps(data).encode('utf-8'))
+        replace_file(temp_path, path)
+
+    def record(self, response, body, latency, body_time):
+        """Record an interaction.
+
+        :type response: :class:`requests.Response`
+        :param response: The response.
+
+        :type body: bytes
+        :param body: The decoded response body.
+
+        :type latency: float
+        :param latency: The seconds until the response headers arrived.
+
+        :type body_time: float
+        :param body_time: The seconds spent reading the body.
+        """
+        headers = dict((name, value)
+                       for name, value in response.headers.items()
+                       if name.lower() not in self.SKIPPED_HEADERS)
+        interaction = {
+            'method': response.request.method,
+            'url': response.request.url,
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': headers,
+            'body': body.decode('latin-1'),
+            'latency': latency,
+            'body_time': body_time,
+        }
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def replay(self, method, url):
+        """Find the next recorded interaction for the given request.
+
+        Repeated requests replay the recorded interactions in order, the
+        last one is replayed once they run out.
+
+        :type method: str
+        :param method: The request method.
+
+        :type url: str
+        :param url: The request url.
+
+        :rtype: dict
+        :return: The interaction, or None if the request was not recorded.
+        """
+        with self._lock:
+            if not self._replayed:
+                for interaction in self.interactions:
+                    key = (interaction['method'], interaction['url'])
+                    self._replayed.setdefault(key, [0, []])[1].append(
+                        interaction)
+            replayed = self._replayed.get((method, url))
+            if replayed is None:
+                return None
+            index, interactions = replayed
+            replayed[0] = min(index + 1, len(interactions) - 1)
+            return interactions[index]
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Send requests over the network and record them to a cassette.
+
+    Bodies are read in full before the response is returned, so streamed
+    pages are not shown while they download during a recording.
+
+    :type cassette: :class:`Cassette`
+    :param cassette: The cassette recording the interactions.
+    """
+
+    def __init__(self, cassette, **kwargs):
+        super(RecordingAdapter, self).__init__(**kwargs)
+        self.cassette = cassette
+
+    def send(self, request, stream=False, **kwargs):
+        start = time.time()
+        response = super(RecordingAdapter, self).send(
+            request, stream=stream, **kwargs)
+        latency = time.time() - start
+        start = time.time()
+        body = response.content
+        body_time = time.time() - start
+        self.cassette.record(response, body, latency, body_time)
+        return response
+
+
+class DelayedBody(io.BytesIO):
+    """A replayed body taking the given seconds to read.
+
+    :type delay: float
+    :param delay: The seconds slept on the first read.
+    """
+
+    def __init__(self, body, delay):
+        io.BytesIO.__init__(self, body)
+        self.delay = delay
+
+    def read(self, *args):
+        if self.delay > 0:
+            time.sleep(self.delay)
+            self.delay = 0
+        return io.BytesIO.read(self, *args)
+
+
+class ReplayAdapter(BaseAdapter):
+    """Serve requests from a cassette, without any network access.
+
+    :type cassette: :class:`Cassette`
+    :param cassette: The cassette holding the interactions.
+
+    :type latency_scale: float
+    :param latency_scale: Multiplies the recorded latencies, 0 replays
+        without any delay.
+    """
+
+    def __init__(self, cassette, latency_scale=1.0):
+        super(ReplayAdapter, self).__init__()
+        self.cassette = cassette
+        self.latency_scale = latency_scale
+
+    def close(self):
+        pass
+
+    def send(self, request, stream=False, **kwargs):
+        interaction = self.cassette.replay(request.method, request.url)
+        if interaction is None:
+            raise requests.exceptions.ConnectionError(
+                'Not in the cassette: ' + request.url, request=request)
+        latency = interaction['latency'] * self.latency_scale
+        if latency > 0:
+            time.sleep(latency)
+        response = requests.Response()
+        response.status_code = interaction['status']
+        response.reason = interaction['reason']
+        response.headers = CaseInsensitiveDict(interaction['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = DelayedBody(
+            interaction['body'].encode('latin-1'),
+            interaction['body_time'] * self.latency_scale)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.elapsed = datetime.timedelta(seconds=latency)
+        return response
+
+
+def mount_cassette(session, adapter):
+    """Send every request of the given session through a cassette adapter.
+
+    :type session: :class:`requests.Session`
+    :param session: The session.
+
+    :type adapter: :class:`requests.adapters.BaseAdapter`
+    :param adapter: A `RecordingAdapter` or `ReplayAdapter`.
+    """
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+import codecs
+import itertools
+import re
+
+try:
+    from requests.compat import chardet
+except ImportError:
+    chardet = None
+
+from .lib import stats
+
+
+class CharsetDetector(object):
+    """Find the encoding of a page from the cheapest evidence first.
+
+    Tries, in order:
+        bom: A byte order mark at the start of the page.
+        header: The charset of the Content-Type header.
+        meta: A <meta> charset in the first META_SNIFF_SIZE bytes.
+        sample: Statistical detection over the first SAMPLE_SIZE bytes.
+        full: Statistical detection over the whole page.
+        default: DEFAULT_ENCODING.
+
+    :type BOMS: tuple (const)
+    :param BOMS: The byte order marks and their encoding.
+
+    :type BOM_SIZE: int (const)
+    :param BOM_SIZE: The length of the longest byte order mark.
+
+    :type DEFAULT_ENCODING: str (const)
+    :param DEFAULT_ENCODING: The encoding used when nothing else worked.
+
+    :type META_SNIFF_SIZE: int (const)
+    :param META_SNIFF_SIZE: The number of bytes searched for a <meta>
+        charset.
+
+    :type MIN_CONFIDENCE: float (const)
+    :param MIN_CONFIDENCE: The minimum confidence of a statistical
+        detection.
+
+    :type REGEX_HEADER_CHARSET: :class:`re.RegexObject` (const)
+    :param REGEX_HEADER_CHARSET: Matches the charset of a Content-Type
+        header.
+
+    :type REGEX_META_CHARSET: :class:`re.RegexObject` (const)
+    :param REGEX_META_CHARSET: Matches the charset of a <meta charset> or
+        <meta http-equiv="Content-Type"> tag.
+
+    :type SAMPLE_SIZE: int (const)
+    :param SAMPLE_SIZE: The number of bytes of the bounded sample.
+    """
+
+    BOMS = (
+        (codecs.BOM_UTF8, 'utf-8-sig'),
+        (codecs.BOM_UTF16_LE, 'utf-16'),
+        (codecs.BOM_UTF16_BE, 'utf-16'),
+    )
+    BOM_SIZE = len(codecs.BOM_UTF8)
+    DEFAULT_ENCODING = 'utf-8'
+    META_SNIFF_SIZE = 4 * 1024
+    MIN_CONFIDENCE = 0.5
+    REGEX_HEADER_CHARSET = re.compile(
+        r'''charset\s*=\s*["']?([\w.:-]+)''', re.IGNORECASE)
+    REGEX_META_CHARSET = re.compile(
+        br'''<meta[^>]+charset\s*=\s*["']?([\w.:-]+)''', re.IGNORECASE)
+    SAMPLE_SIZE = 64 * 1024
+
+    def _lookup(self, encoding):
+        """Get the normalized name of the given encoding.
+
+        :type encoding: str or bytes
+        :param encoding: The encoding label.
+
+        :rtype: str
+        :return: The codec name, or None if Python has no such codec.
+        """
+        if encoding is None:
+            return None
+        if isinstance(encoding, bytes):
+            encoding = encoding.decode('ascii', 'ignore')
+        try:
+            return codecs.lookup(encoding).name
+        except LookupError:
+            return None
+
+    def detect(self, content_type, head, sample=True):
+        """Detect the encoding of a page from its header and first bytes.
+
+        :type content_type: str
+        :param content_type: The Content-Type header, or None.
+
+        :type head: bytes
+        :param head: The first bytes of the page, SAMPLE_SIZE bytes are
+            enough.
+
+        :type sample: bool
+        :param sample: Determines whether to detect the encoding of the
+            head as a sample if nothing declares it.
+
+        :rtype: tuple
+        :return: The encoding and the name of the path that found it, or
+            (None, None) if only a full detection could tell.
+        """
+        for bom, encoding in self.BOMS:
+            if head.startswith(bom):
+                return encoding, 'bom'
+        if content_type:
+            match = self.REGEX_HEADER_CHARSET.search(content_type)
+            if match is not None:
+                encoding = self._lookup(match.group(1))
+                if encoding is not None:
+                    return encoding, 'header'
+        match = self.REGEX_META_CHARSET.search(head[:self.META_SNIFF_SIZE])
+        if match is not None:
+            encoding = self._lookup(match.group(1))
+            if encoding is not None:
+                return encoding, 'meta'
+        if not sample:
+            return None, None
+        encoding = self.detect_sample(head[:self.SAMPLE_SIZE])
+        if encoding is not None:
+            return encoding, 'sample'
+        return None, None
+
+    def detect_full(self, body):
+        """Detect the encoding of a page from all of its bytes.
+
+        :type body: bytes
+        :param body: The page.
+
+        :rtype: tuple
+        :return: The encoding and the name of the path that found it.
+        """
+        encoding = self.detect_statistically(body)
+        if encoding is not None:
+            return encoding, 'full'
+        return self.DEFAULT_ENCODING, 'default'
+
+    def detect_sample(self, sample):
+        """Detect the encoding of a bounded sample of a page.
+
+        Most pages are UTF-8, which a strict decode confirms far faster
+        than statistical detection.
+
+        :type sample: bytes
+        :param sample: The sample, possibly ending inside a character.
+
+        :rtype: str
+        :return: The encoding, or None if the sample was inconclusive.
+        """
+        try:
+            codecs.getincrementaldecoder('utf-8')().decode(sample)
+        except UnicodeDecodeError:
+            return self.detect_statistically(sample)
+        return 'utf-8'
+
+    def detect_statistically(self, data):
+        """Detect the encoding of the given bytes from their statistics.
+
+        :type data: bytes
+        :param data: The bytes.
+
+        :rtype: str
+        :return: The encoding, or None if no detector is installed or it
+            is not confident enough.
+        """
+        if chardet is None or not data:
+            return None
+        result = chardet.detect(data)
+        if result.get('confidence') is None or \
+                result['confidence'] < self.MIN_CONFIDENCE:
+            return None
+        return self._lookup(result.get('encoding'))
+
+    def detect_stream(self, content_type, chunks):
+        """Detect the encoding of a page read in chunks.
+
+        Only reads as many chunks as the detection needs: the first chunk
+        for a byte order mark or the header charset, META_SNIFF_SIZE bytes
+        for a <meta> charset, SAMPLE_SIZE bytes for the sample and the
+        whole page if it comes down to a full detection.  The path taken
+        is counted in `stats` as charset_<path>.
+
+        :type content_type: str
+        :param content_type: The Content-Type header, or None.
+
+        :type chunks: iterable
+        :param chunks: The page as chunks of bytes.
+
+        :rtype: tuple
+        :return: The encoding, the name of the path that found it and the
+            chunks of the page, including the ones read for the detection.
+        """
+        chunks = iter(chunks)
+        head = []
+        encoding, path = None, None
+        for size in (self.BOM_SIZE, self.META_SNIFF_SIZE, self.SAMPLE_SIZE):
+            exhausted = self.read_head(chunks, head, size)
+            encoding, path = self.detect(content_type, b''.join(head),
+                                         sample=size == self.SAMPLE_SIZE or
+                                         exhausted)
+            if encoding is not None or exhausted:
+                break
+        if encoding is None:
+            head = [b''.join(head) + b''.join(chunks)]
+            encoding, path = self.detect_full(head[0])
+        stats.count('charset_' + path)
+        return encoding, path, itertools.chain(head, chunks)
+
+    def read_head(self, chunks, head, size):
+        """Read chunks until the head of a page holds the given size.
+
+        :type chunks: iterator
+        :param chunks: The rest of the page as chunks of bytes.
+
+        :type head: list
+        :param head: The chunks read so far, extended in place.
+
+        :type size: int
+        :param size: The number of bytes wanted.
+
+        :rtype: bool
+        :return: True if the page ended before the size was reached.
+        """
+        read = sum(len(chunk) for chunk in head)
+        while read < size:
+            chunk = next(chunks, None)
+            if chunk is None:
+                return True
+            head.append(chunk)
+            read += len(chunk)
+        return False
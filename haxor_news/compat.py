@@ -15,19 +15,31 @@
 
 import sys
 import urllib
+try:
+    # Python 3.3+
+    from os import replace as replace_file
+except ImportError:
+    # Python 2, not atomic on Windows
+    from os import rename as replace_file
 try:
     # Python 3
     import configparser
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
     from urllib.parse import urlparse
     from urllib.request import urlretrieve
     from urllib.error import URLError
 except ImportError:
     # Python 2
     import ConfigParser as configparser
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
     from urlparse import urlparse
     from urllib import urlretrieve
     from urllib2 import URLError
 if sys.version_info < (3, 3):
     import HTMLParser
+    from HTMLParser import HTMLParser as BaseHTMLParser
 else:
     import html as HTMLParser
+    from html.parser import HTMLParser as BaseHTMLParser
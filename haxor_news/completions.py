@@ -21,22 +21,45 @@ WHO_IS_HIRING_POST_ID = str(who_is_hiring_post_id)
 SUBCOMMANDS = {
     'ask': 'Ask HN posts',
     'best': 'Best of HN weekly posts',
+    'bundle': 'Build bundles to read offline',
     'freelance': "Monthly freelancers post",
     'hiring': "Monthly hiring post",
     'jobs': 'Jobs posts',
     'new': 'Newest posts',
     'onion': 'Onion posts',
+    'read': 'Read the articles of posts',
     'show': 'Show HN posts',
     'top': 'Top posts',
     'user': 'User info',
     'view': 'View specified post',
 }
 ARGS_OPTS_LOOKUP = {
+    'bundle': {
+        'args': 'build',
+        'opts': [
+            '--top 30',
+            '-t 30',
+            '--with_comments',
+            '-wc',
+            '--with_articles',
+            '-wa',
+        ],
+    },
     'freelance': {
         'args': '"(?i)(Python|Django)"',
         'opts': [
             '--id_post ' + FREELANCER_POST_ID,
             '-i ' + FREELANCER_POST_ID,
+            '--rank',
+            '-r',
+            '--limit 10',
+            '-l 10',
+            '--keywords ""',
+            '-k ""',
+            '--months 12',
+            '-m 12',
+            '--where "remote and salary>150k"',
+            '-w "remote and salary>150k"',
         ],
     },
     'hiring': {
@@ -44,8 +67,22 @@ ARGS_OPTS_LOOKUP = {
         'opts': [
             '--id_post ' + WHO_IS_HIRING_POST_ID,
             '-i ' + WHO_IS_HIRING_POST_ID,
+            '--rank',
+            '-r',
+            '--limit 10',
+            '-l 10',
+            '--keywords ""',
+            '-k ""',
+            '--months 12',
+            '-m 12',
+            '--where "remote and salary>150k"',
+            '-w "remote and salary>150k"',
         ],
     },
+    'read': {
+        'args': 'top',
+        'opts': [],
+    },
     'user': {
         'args': '"user"',
         'opts': [
@@ -70,11 +107,14 @@ ARGS_OPTS_LOOKUP = {
             '-cc',
             '--browser',
             '-b',
+            '--main_content',
+            '-mc',
         ],
     },
 }
 META_LOOKUP = {
     '10': 'limit: int (opt) limits the posts displayed',
+    'build': 'build: (req) builds a bundle to read with hn --offline',
     '"(?i)(Python|Django)"': ('regex_query: string (opt) applies a regular '
                               'expression comment filter'),
     '1': 'index: int (req) views the post index',
@@ -96,13 +136,37 @@ META_LOOKUP = {
     '-cc': 'Clear the comment cache before executing.',
     '--browser': 'View in a browser instead of the terminal (flag)',
     '-b': 'View in a browser instead of the terminal (flag)',
+    '--main_content': ('View only the main content of the page, once '
+                       'fully downloaded (flag)'),
+    '-mc': 'View only the main content of the page, once fully downloaded '
+           '(flag)',
+    '--top 30': 'The number of stories bundled from each list (int)',
+    '-t 30': 'The number of stories bundled from each list (int)',
+    '--with_comments': 'Bundle the comment trees (flag)',
+    '-wc': 'Bundle the comment trees (flag)',
+    '--with_articles': 'Bundle the rendered articles (flag)',
+    '-wa': 'Bundle the rendered articles (flag)',
     '--id_post ' + WHO_IS_HIRING_POST_ID: ('View matching comments from '
                                            'the (optional) post id instead'
                                            ' of the latest post (int)'),
     '-i ' + WHO_IS_HIRING_POST_ID: ('View matching comments from '
                                     'the (optional) post id instead'
                                     ' of the latest post (int)'),
-    '--limit 10': 'Limits the number of user submissions displayed (int)',
-    '-l 10': 'Limits the number of user submissions displayed (int)',
+    '--limit 10': 'Limits the number of results displayed (int)',
+    '-l 10': 'Limits the number of results displayed (int)',
+    '--rank': 'Rank comments by relevance to the query keywords (flag)',
+    '-r': 'Rank comments by relevance to the query keywords (flag)',
+    '--keywords ""': ('Match the keywords listed in the file and count '
+                      'matches per keyword (path)'),
+    '-k ""': ('Match the keywords listed in the file and count '
+              'matches per keyword (path)'),
+    '--months 12': 'Search the given number of latest monthly posts (int)',
+    '-m 12': 'Search the given number of latest monthly posts (int)',
+    '--where "remote and salary>150k"': ('Filter on the company, location, '
+                                         'remote, salary and visa header '
+                                         'fields (string)'),
+    '-w "remote and salary>150k"': ('Filter on the company, location, '
+                                    'remote, salary and visa header '
+                                    'fields (string)'),
 }
 META_LOOKUP.update(SUBCOMMANDS)
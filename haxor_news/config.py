@@ -16,12 +16,15 @@
 from __future__ import print_function
 from __future__ import division
 
+import calendar
+from datetime import datetime
 import os
+import time
 
 import click
+import requests
 from .compat import configparser
-from .compat import URLError
-from .compat import urlretrieve
+from .lib.tracing import traced
 from .settings import freelancer_post_id, who_is_hiring_post_id
 
 
@@ -31,6 +34,9 @@ class Config(object):
     :type clr_x: str
     :param clr_x: Various ansi color config colors to use for highlights.
 
+    :type CACHE_DIR: str
+    :param CACHE_DIR: The cache directory name.
+
     :type CONFIG: str
     :param CONFIG: The config file name.
 
@@ -52,6 +58,10 @@ class Config(object):
     :type CONFIG_FREELANCE_ID: str
     :param CONFIG_FREELANCE_ID: The monthly who's hiring post id config label.
 
+    :type CONFIG_HIRING_IDS_EXPIRE: str
+    :param CONFIG_HIRING_IDS_EXPIRE: The hiring and freelance ids expiration
+        config label.
+
     :type CONFIG_SHOW_TIP: bool
     :param CONFIG_SHOW_TIP: determines whether to show the tip.
 
@@ -61,6 +71,20 @@ class Config(object):
     :type hiring_id: int
     :param hiring_id: The monthly who's hiring post id.
 
+    :type hiring_ids_expire: int
+    :param hiring_ids_expire: The epoch timestamp after which the hiring and
+        freelance ids are resolved again.
+
+    :type HIRING_IDS_RETRY_TTL: int
+    :param HIRING_IDS_RETRY_TTL: The seconds to keep ids that are not from
+        the current month, which happens until the new monthly posts are up.
+
+    :type HIRING_IDS_TIMEOUT: int
+    :param HIRING_IDS_TIMEOUT: The seconds to wait for the settings url.
+
+    :type HIRING_IDS_URL: str
+    :param HIRING_IDS_URL: The url of the settings listing the latest ids.
+
     :type item_cache: list
     :param item_cache: A list of seen comment ids.
             TODO: Look into an OrderedSet for improved lookup performance
@@ -75,6 +99,7 @@ class Config(object):
     :param MAX_ITEM_CACHE_SIZE: The maximum size of seen comment ids cache.
     """
 
+    CACHE_DIR = '.haxornewscache'
     CONFIG = '.haxornewsconfig'
     CONFIG_CLR_BOLD = 'clr_bold'
     CONFIG_CLR_CODE = 'clr_code'
@@ -96,7 +121,11 @@ class Config(object):
     CONFIG_CACHE = 'item_cache'
     CONFIG_HIRING_ID = 'hiring_id'
     CONFIG_FREELANCE_ID = 'freelance_id'
+    CONFIG_HIRING_IDS_EXPIRE = 'hiring_ids_expire'
     CONFIG_SHOW_TIP = 'show_tip'
+    HIRING_IDS_RETRY_TTL = 60 * 60
+    HIRING_IDS_TIMEOUT = 10
+    HIRING_IDS_URL = 'https://raw.githubusercontent.com/donnemartin/haxor-news/master/haxor_news/settings.py'  # NOQA
     MAX_ITEM_CACHE_SIZE = 20000
 
     def __init__(self):
@@ -104,6 +133,7 @@ class Config(object):
         self.item_cache = []
         self.hiring_id = 0
         self.freelance_id = 0
+        self.hiring_ids_expire = 0
         self.show_tip = True
         self._init_colors()
         self.load_config([
@@ -111,6 +141,7 @@ class Config(object):
             self.load_config_item_cache,
             self.load_config_colors,
             self.load_config_show_tip,
+            self.load_config_hiring_ids_expire,
         ])
 
     def _init_colors(self):
@@ -136,6 +167,17 @@ class Config(object):
         self.item_cache = []
         self.save_cache()
 
+    def get_cache_path(self, *paths):
+        """Get a path within the cache directory.
+
+        :type paths: tuple
+        :param paths: The path components relative to the cache directory.
+
+        :rtype: str
+        :return: The cache path.
+        """
+        return os.path.join(self.get_config_path(self.CACHE_DIR), *paths)
+
     def get_config_path(self, config_file_name):
         """Get the config file path.
 
@@ -149,6 +191,7 @@ class Config(object):
         config_file_path = os.path.join(home, config_file_name)
         return config_file_path
 
+    @traced('load config', 'config')
     def load_config(self, config_funcs):
         """Load the specified config from ~/.haxornewsconfig.
 
@@ -188,6 +231,24 @@ class Config(object):
         self.freelance_id = parser.getint(self.CONFIG_SECTION,
                                           self.CONFIG_FREELANCE_ID)
 
+    def load_config_hiring_ids_expire(self, parser):
+        """Load the cached hiring and freelance ids from ~/.haxornewsconfig.
+
+        The ids are only kept along with a valid expiration, config files
+        written by older versions resolve the ids again.
+
+        :type parser: :class:`ConfigParser.RawConfigParser`
+        :param parser: An instance of `ConfigParser.RawConfigParser`.
+        """
+        try:
+            self.hiring_ids_expire = parser.getint(
+                self.CONFIG_SECTION, self.CONFIG_HIRING_IDS_EXPIRE)
+            self.load_config_hiring_and_freelance_ids(parser)
+        except (configparser.Error, ValueError):
+            self.hiring_id = 0
+            self.freelance_id = 0
+            self.hiring_ids_expire = 0
+
     def load_config_item_cache(self, parser):
         """Load the item cache from ~/.haxornewsconfig.
 
@@ -305,32 +366,103 @@ class Config(object):
             color_config=self.CONFIG_CLR_VIEW_INDEX,
             default=self.clr_view_index)
 
-    def load_hiring_and_freelance_ids(self, url=None):
+    def get_hiring_ids_expire(self, post_time=None, now=None):
+        """Get the expiration of freshly resolved hiring and freelance ids.
+
+        New monthly posts are submitted at the start of each month, so ids
+        from the current month's posts are kept until the next month begins.
+        Ids from an older post, or of unknown age, are kept for
+        HIRING_IDS_RETRY_TTL seconds until the new posts are found.
+
+        :type post_time: int
+        :param post_time: The resolved post's epoch timestamp, or None if
+            unknown.
+
+        :type now: float
+        :param now: The current epoch timestamp, defaults to time.time().
+
+        :rtype: int
+        :return: The expiration epoch timestamp.
+        """
+        if now is None:
+            now = time.time()
+        current = datetime.utcfromtimestamp(now)
+        if current.month == 12:
+            next_month = datetime(current.year + 1, 1, 1)
+        else:
+            next_month = datetime(current.year, current.month + 1, 1)
+        expire = calendar.timegm(next_month.timetuple())
+        if post_time is not None:
+            posted = datetime.utcfromtimestamp(post_time)
+            if (posted.year, posted.month) == (current.year, current.month):
+                return expire
+        return int(min(expire, now + self.HIRING_IDS_RETRY_TTL))
+
+    def load_hiring_and_freelance_ids(self, url=None, resolve_posts=None):
         """Load the latest who's hiring and freelancer post ids.
 
-        The latest ids are updated monthly on the repo and are then cached.
-        If fetching the latest ids from the repo fails, the cache is checked.
-        If fetching the cache fails, the default ids set during installation
-        are used.
+        The ids are cached in ~/.haxornewsconfig until
+        `get_hiring_ids_expire`, so usually no request is needed at all.
+        Expired ids are resolved with resolve_posts, which looks up the
+        latest posts on Hacker News.  If that fails, the ids listed on the
+        repo are fetched.  If that fails as well, the cache is checked and
+        finally the default ids set during installation are used.
 
         :type url: str
         :param url: The url to load the latest post ids.
+
+        :type resolve_posts: callable
+        :param resolve_posts: Returns the latest hiring and freelance posts
+            as a tuple of dicts with id and time keys, or None on failure.
         """
-        try:
-            if url is None:
-                url = 'https://raw.githubusercontent.com/donnemartin/haxor-news/master/haxor_news/settings.py'  # NOQA
-            file_name = 'downloaded_settings.py'
-            urlretrieve(url, file_name)
-            with open(file_name, 'r') as f:
-                for line in f:
-                    if line.startswith('who_is_hiring_post_id'):
-                        self.hiring_id = line.split(' = ')[1].strip('\n')
-                    if line.startswith('freelancer_post_id'):
-                        self.freelance_id = line.split(' = ')[1].strip('\n')
-            if self.hiring_id == 0 or self.freelance_id == 0:
-                self.load_hiring_and_freelance_ids_from_cache_or_defaults()
-        except (URLError, IOError):
+        now = time.time()
+        if self.hiring_id and self.freelance_id and \
+                now < self.hiring_ids_expire:
+            return
+        posts = resolve_posts() if resolve_posts is not None else None
+        if posts is not None:
+            hiring_post, freelance_post = posts
+            self.hiring_id = hiring_post['id']
+            self.freelance_id = freelance_post['id']
+            self.hiring_ids_expire = self.get_hiring_ids_expire(
+                min(hiring_post['time'], freelance_post['time']), now)
+        elif self.load_hiring_and_freelance_ids_from_url(url):
+            self.hiring_ids_expire = self.get_hiring_ids_expire(now=now)
+        else:
             self.load_hiring_and_freelance_ids_from_cache_or_defaults()
+            return
+        self.save_cache()
+
+    def load_hiring_and_freelance_ids_from_url(self, url=None):
+        """Load the hiring and freelancer post ids listed in a settings file.
+
+        The settings are read in memory, nothing is written to disk.
+
+        :type url: str
+        :param url: The url to load the latest post ids, defaults to
+            HIRING_IDS_URL.
+
+        :rtype: bool
+        :return: Specifies if both ids were loaded.
+        """
+        if url is None:
+            url = self.HIRING_IDS_URL
+        ids = {}
+        try:
+            response = requests.get(url, timeout=self.HIRING_IDS_TIMEOUT)
+            response.raise_for_status()
+            for line in response.text.splitlines():
+                name, _, value = line.partition(' = ')
+                if name in ('who_is_hiring_post_id', 'freelancer_post_id'):
+                    ids[name] = int(value)
+        except (requests.exceptions.RequestException, ValueError):
+            return False
+        if not ids.get('who_is_hiring_post_id') or \
+                not ids.get('freelancer_post_id'):
+            return False
+        self.hiring_id = ids['who_is_hiring_post_id']
+        self.freelance_id = ids['freelancer_post_id']
+        return True
 
     def load_hiring_and_freelance_ids_from_cache_or_defaults(self):
         """Load the hiring and freelancer post ids from cache or defaults.
@@ -364,6 +496,7 @@ class Config(object):
             items_ids = items_ids.replace(exclude, '')
         return items_ids.split(', ')
 
+    @traced('save config', 'config')
     def save_cache(self):
         """Save the current set of item ids and cache to ~/.haxornewsconfig."""
         if self.item_cache is not None and \
@@ -378,6 +511,9 @@ class Config(object):
         parser.set(self.CONFIG_SECTION,
                    self.CONFIG_FREELANCE_ID,
                    self.freelance_id)
+        parser.set(self.CONFIG_SECTION,
+                   self.CONFIG_HIRING_IDS_EXPIRE,
+                   self.hiring_ids_expire)
         parser.set(self.CONFIG_SECTION,
                    self.CONFIG_SHOW_TIP,
                    self.show_tip)
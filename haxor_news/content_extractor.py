@@ -0,0 +1,383 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+import re
+
+from .compat import BaseHTMLParser
+
+
+class Block(object):
+    """An element of the parsed page.
+
+    :type attrs: dict
+    :param attrs: The element attributes.
+
+    :type commas: int
+    :param commas: The number of commas in the element text.
+
+    :type end: int
+    :param end: The offset in the page where the element ends.
+
+    :type has_block_child: bool
+    :param has_block_child: Specifies if the element contains block level
+        elements.
+
+    :type link_length: int
+    :param link_length: The length of the element text inside links.
+
+    :type parent: :class:`Block`
+    :param parent: The enclosing element, or None for the root.
+
+    :type score: float
+    :param score: The content score credited by the enclosed paragraphs.
+
+    :type scored: bool
+    :param scored: Specifies if the element is a main content candidate.
+
+    :type start: int
+    :param start: The offset in the page where the element starts.
+
+    :type tag: str
+    :param tag: The element tag name.
+
+    :type text_length: int
+    :param text_length: The length of the element text.
+    """
+
+    def __init__(self, tag, attrs, parent, start):
+        self.tag = tag
+        self.attrs = attrs
+        self.parent = parent
+        self.start = start
+        self.end = None
+        self.commas = 0
+        self.has_block_child = False
+        self.link_length = 0
+        self.score = 0
+        self.scored = False
+        self.text_length = 0
+
+    def get_link_density(self):
+        """Get the share of the element text inside links.
+
+        :rtype: float
+        :return: The link density, from 0 to 1.
+        """
+        if not self.text_length:
+            return 0
+        return self.link_length / self.text_length
+
+    def get_final_score(self):
+        """Get the content score discounted by the link density.
+
+        :rtype: float
+        :return: The final score.
+        """
+        return self.score * (1 - self.get_link_density())
+
+
+class ContentExtractor(BaseHTMLParser):
+    """Extract the main content of a page, readability style.
+
+    Every paragraph credits a score based on its text length and commas to
+    its enclosing block and half of it to the block above.  A block whose
+    text is mostly links, such as a menu or a list of related posts, has
+    its score discounted accordingly.  The best scoring block, along with
+    its high scoring siblings, is kept as the main content.
+
+    :type blocks: list
+    :param blocks: The content candidates, instances of `Block`, the blocks
+        enclosing a paragraph.
+
+    :type html: str
+    :param html: The page being parsed.
+
+    :type line_offsets: list
+    :param line_offsets: The offset in `html` where each line starts.
+
+    :type link_depth: int
+    :param link_depth: The number of open links.
+
+    :type skip_depth: int
+    :param skip_depth: The number of open elements whose text is ignored.
+
+    :type stack: list
+    :param stack: The open elements, instances of `Block`.
+
+    :type title: :class:`Block`
+    :param title: The first h1 of the page, or None.
+
+    :type BLOCK_TAGS: set (const)
+    :param BLOCK_TAGS: The block level tags.
+
+    :type CLASS_WEIGHT: int (const)
+    :param CLASS_WEIGHT: The score added or removed when the class or id
+        of a block looks like content or like clutter.
+
+    :type MIN_PARAGRAPH_LENGTH: int (const)
+    :param MIN_PARAGRAPH_LENGTH: The minimum text length of a scored
+        paragraph.
+
+    :type MIN_TEXT_LENGTH: int (const)
+    :param MIN_TEXT_LENGTH: The minimum text length of the main content,
+        the whole page is kept if the best block is shorter.
+
+    :type NEGATIVE_REGEX: :class:`re.RegexObject` (const)
+    :param NEGATIVE_REGEX: Matches the class or id of clutter.
+
+    :type PARAGRAPH_TAGS: set (const)
+    :param PARAGRAPH_TAGS: The tags scored as paragraphs.
+
+    :type POSITIVE_REGEX: :class:`re.RegexObject` (const)
+    :param POSITIVE_REGEX: Matches the class or id of content.
+
+    :type SIBLING_SCORE_RATIO: float (const)
+    :param SIBLING_SCORE_RATIO: The share of the best score a sibling block
+        needs to be kept too.
+
+    :type SKIP_TAGS: set (const)
+    :param SKIP_TAGS: The tags whose text is never content.
+
+    :type TAG_SCORES: dict (const)
+    :param TAG_SCORES: Maps a tag to the initial score of the blocks using
+        it, the other tags start at 0.
+
+    :type VOID_TAGS: set (const)
+    :param VOID_TAGS: The tags without an end tag.
+    """
+
+    BLOCK_TAGS = set([
+        'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl',
+        'fieldset', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5',
+        'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre',
+        'section', 'table', 'td', 'ul',
+    ])
+    CLASS_WEIGHT = 25
+    MIN_PARAGRAPH_LENGTH = 25
+    MIN_TEXT_LENGTH = 250
+    NEGATIVE_REGEX = re.compile(
+        r'comment|footer|footnote|masthead|menu|meta|nav|outbrain|promo|'
+        r'related|scroll|share|shoutbox|sidebar|sponsor|shopping|social|'
+        r'tags|tool|widget|banner|combx|disqus|extra|header|popup|ad-',
+        re.IGNORECASE)
+    PARAGRAPH_TAGS = set(['p', 'pre', 'td'])
+    POSITIVE_REGEX = re.compile(
+        r'article|body|content|entry|hentry|main|page|post|text|blog|story',
+        re.IGNORECASE)
+    SIBLING_SCORE_RATIO = 0.2
+    SKIP_TAGS = set([
+        'button', 'iframe', 'noscript', 'script', 'select', 'style', 'svg',
+        'template', 'textarea',
+    ])
+    TAG_SCORES = {
+        'article': 10,
+        'blockquote': 3,
+        'div': 5,
+        'dl': -3,
+        'form': -3,
+        'li': -3,
+        'main': 10,
+        'ol': -3,
+        'pre': 3,
+        'section': 5,
+        'td': 3,
+        'ul': -3,
+    }
+    VOID_TAGS = set([
+        'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link',
+        'meta', 'param', 'source', 'track', 'wbr',
+    ])
+
+    def __init__(self):
+        BaseHTMLParser.__init__(self)
+        self.blocks = []
+        self.html = ''
+        self.line_offsets = [0]
+        self.link_depth = 0
+        self.skip_depth = 0
+        self.stack = []
+        self.title = None
+
+    def _close(self, end):
+        """Close the innermost open element.
+
+        :type end: int
+        :param end: The offset in the page where the element ends.
+        """
+        block = self.stack.pop()
+        block.end = end
+        parent = block.parent
+        if block.tag in self.SKIP_TAGS:
+            self.skip_depth -= 1
+        elif block.tag == 'a':
+            self.link_depth -= 1
+        if parent is None:
+            return
+        parent.text_length += block.text_length
+        parent.link_length += block.link_length
+        parent.commas += block.commas
+        if block.tag in self.BLOCK_TAGS:
+            parent.has_block_child = True
+        if block.tag in self.PARAGRAPH_TAGS or \
+                block.tag == 'div' and not block.has_block_child:
+            self._score_paragraph(block)
+
+    def _get_offset(self):
+        """Get the offset in the page of the current parser position.
+
+        :rtype: int
+        :return: The offset.
+        """
+        line, column = self.getpos()
+        return self.line_offsets[line - 1] + column
+
+    def _score_paragraph(self, block):
+        """Credit the score of a paragraph to the blocks enclosing it.
+
+        :type block: :class:`Block`
+        :param block: The paragraph.
+        """
+        if block.text_length < self.MIN_PARAGRAPH_LENGTH:
+            return
+        score = 1 + block.commas + min(block.text_length // 100, 3)
+        weight = 1
+        for ancestor in (block.parent, block.parent.parent):
+            if ancestor is None:
+                break
+            if not ancestor.scored:
+                self._init_score(ancestor)
+            ancestor.score += score * weight
+            weight = 0.5
+
+    def _init_score(self, block):
+        """Start scoring the given block as a content candidate.
+
+        :type block: :class:`Block`
+        :param block: The block.
+        """
+        block.scored = True
+        block.score = self.TAG_SCORES.get(block.tag, 0)
+        for name in ('class', 'id'):
+            value = block.attrs.get(name)
+            if not value:
+                continue
+            if self.NEGATIVE_REGEX.search(value):
+                block.score -= self.CLASS_WEIGHT
+            if self.POSITIVE_REGEX.search(value):
+                block.score += self.CLASS_WEIGHT
+        self.blocks.append(block)
+
+    def extract(self, html):
+        """Extract the main content of the given page.
+
+        :type html: str
+        :param html: The page.
+
+        :rtype: str
+        :return: The HTML of the main content, or the whole page if no block
+            stands out as the main content.
+        """
+        self.reset()
+        self.blocks = []
+        self.html = html
+        self.line_offsets = [0]
+        self.line_offsets.extend(
+            match.end() for match in re.finditer('\n', html))
+        self.link_depth = 0
+        self.skip_depth = 0
+        self.stack = [Block('#root', {}, None, 0)]
+        self.title = None
+        self.feed(html)
+        BaseHTMLParser.close(self)
+        while len(self.stack) > 1:
+            self._close(len(html))
+        if not self.blocks:
+            return html
+        best = max(self.blocks, key=Block.get_final_score)
+        if best.tag in ('#root', 'body', 'html') or \
+                best.text_length < self.MIN_TEXT_LENGTH or \
+                best.get_final_score() <= 0:
+            return html
+        min_score = max(10, best.get_final_score() * self.SIBLING_SCORE_RATIO)
+        parts = []
+        for block in self.blocks:
+            if block is best or block.parent is best.parent and \
+                    block.parent is not None and \
+                    block.get_final_score() >= min_score:
+                parts.append(block)
+        title = self.title
+        if title is not None and title.end is not None and not any(
+                block.start <= title.start < block.end for block in parts):
+            # Keep the headline, it often sits outside the article body.
+            parts.append(title)
+        parts.sort(key=lambda block: block.start)
+        return '<html><body>{0}</body></html>'.format(
+            ''.join(html[block.start:block.end] for block in parts))
+
+    def handle_charref(self, name):
+        self.handle_data('x')
+
+    def handle_data(self, data):
+        if self.skip_depth:
+            return
+        block = self.stack[-1]
+        length = len(data.strip())
+        block.text_length += length
+        block.commas += data.count(',')
+        if self.link_depth:
+            block.link_length += length
+
+    def handle_endtag(self, tag):
+        tag = tag.lower()
+        for index in range(len(self.stack) - 1, 0, -1):
+            if self.stack[index].tag == tag:
+                break
+        else:
+            # An end tag without a start tag.
+            return
+        start = self._get_offset()
+        end = self.html.find('>', start) + 1 or len(self.html)
+        while len(self.stack) > index + 1:
+            self._close(start)
+        self._close(end)
+
+    def handle_entityref(self, name):
+        self.handle_data('x')
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag.lower() not in self.VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_starttag(self, tag, attrs):
+        tag = tag.lower()
+        if tag in self.VOID_TAGS:
+            return
+        start = self._get_offset()
+        if self.stack[-1].tag == tag and tag in ('li', 'p') or \
+                self.stack[-1].tag == 'p' and tag in self.BLOCK_TAGS:
+            # Close the implied end tag.
+            self._close(start)
+        block = Block(tag, dict(attrs), self.stack[-1], start)
+        self.stack.append(block)
+        if tag == 'h1' and self.title is None and not self.skip_depth:
+            self.title = block
+        if tag in self.SKIP_TAGS:
+            self.skip_depth += 1
+        elif tag == 'a':
+            self.link_depth += 1
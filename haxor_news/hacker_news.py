@@ -16,26 +16,51 @@
 from __future__ import print_function
 from __future__ import division
 
+import itertools
 import platform
 import re
 import sys
+import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 
 import click
+import requests
 from .compat import HTMLParser
 from .compat import urlparse
 
+from .aho_corasick import AhoCorasick
+from .bm25 import Bm25Index
+from .bundle import Bundle, BundleArticleCache, BundleBuilder, \
+    OfflineHackerNewsApi
+from .cassette import RecordingAdapter, ReplayAdapter, mount_cassette
 from .config import Config
+from .hiring_facets import HiringFacets, InvalidWhereExpression, WhereFilter
 from .lib.haxor.haxor import HackerNewsApi, HTTPError, InvalidItemID, \
-    InvalidUserID
+    InvalidUserID, Item
+from .lib import stats
 from .lib.pretty_date_time import pretty_date_time
+from .lib.tracing import span, traced
 from .onions import onions
+from .thread_cache import ThreadCache
 from .web_viewer import WebViewer
 
 
 class HackerNews(object):
     """Encapsulate Hacker News.
 
+        :type bundle: :class:`bundle.Bundle`
+        :param bundle: The bundle serving every command offline, or None
+            when online.
+
+        :type BUNDLE_FILE: str (const)
+        :param BUNDLE_FILE: The default bundle file name in the cache
+            directory.
+
+        :type bundle_path: str
+        :param bundle_path: The bundle file path, or None for BUNDLE_FILE.
+
         :type COMMENT_INDENT: str (const)
         :param COMMENT_INDENT: The comment indent.
 
@@ -46,6 +71,9 @@ class HackerNews(object):
         :type config: :class:`config.Config`
         :param config: An instance of `config.Config`.
 
+        :type hiring_facets: :class:`hiring_facets.HiringFacets`
+        :param hiring_facets: An instance of `hiring_facets.HiringFacets`.
+
         :type html: :class:`HTMLParser`
         :param html: An instance of `HTMLParser`.
 
@@ -59,21 +87,59 @@ class HackerNews(object):
         :param MAX_SNIPPET_LENGTH: The max length of a comment snippet shown
             when filtering comments.
 
+        :type MAX_THREAD_WORKERS: int (const)
+        :param MAX_THREAD_WORKERS: The max number of threads loaded
+            concurrently.
+
+        :type MONTHLY_POSTS_USER: str (const)
+        :param MONTHLY_POSTS_USER: The user submitting the monthly posts.
+
+        :type MONTHLY_POST_TITLES: dict (const)
+        :param MONTHLY_POST_TITLES: Maps a monthly post kind to a regex
+            matching its title.
+
         :type hacker_news_api: :class:`haxor.HackerNewsApi`
         :param hacker_news_api: An instance of `haxor.HackerNewsApi`.
 
         :type QUERY_UNSEEN: str (const)
         :param foo: the query to show unseen comments.
 
+        :type REGEX_TAG: :class:`re.RegexObject` (const)
+        :param REGEX_TAG: Matches html tags.
+
+        :type REGEX_TITLE_MONTH: :class:`re.RegexObject` (const)
+        :param REGEX_TITLE_MONTH: Matches the month of a monthly post title.
+
+        :type STORIES: tuple (const)
+        :param STORIES: The story lists hn read reads from.
+
+        :type THREAD_FINAL_AGE: int (const)
+        :param THREAD_FINAL_AGE: The age in seconds after which a thread is
+            refreshed one last time, then served from the cache.
+
+        :type thread_cache: :class:`thread_cache.ThreadCache`
+        :param thread_cache: An instance of `thread_cache.ThreadCache`.
+
         :type web_viewer: :class:`web_viewer.WebViewer`
         :param web_viewer: An instance of `web_viewer.WebViewer`.
     """
 
+    BUNDLE_FILE = 'bundle.json.gz'
     COMMENT_INDENT = '  '
     COMMENT_UNSEEN = ' [!]'
     MAX_LIST_INDEX = 1000
     MAX_SNIPPET_LENGTH = 60
+    MAX_THREAD_WORKERS = 4
+    MONTHLY_POSTS_USER = 'whoishiring'
+    MONTHLY_POST_TITLES = {
+        'freelance': re.compile(r'Freelancer\? Seeking freelancer\?', re.I),
+        'hiring': re.compile(r'Who is hiring\?', re.I),
+    }
     QUERY_UNSEEN = '\[!\]'
+    REGEX_TAG = re.compile(r'<[^>]*>')
+    REGEX_TITLE_MONTH = re.compile(r'\(([^)]+)\)\s*$')
+    STORIES = ('ask', 'best', 'new', 'show', 'top')
+    THREAD_FINAL_AGE = 31 * 24 * 60 * 60
 
     def __init__(self):
         self.hacker_news_api = HackerNewsApi()
@@ -82,7 +148,12 @@ class HackerNews(object):
         except:
             self.html = HTMLParser
         self.config = Config()
-        self.web_viewer = WebViewer()
+        self.thread_cache = ThreadCache(self.config.get_cache_path('threads'))
+        self.hiring_facets = HiringFacets()
+        self.web_viewer = WebViewer(self.config.get_cache_path('articles'),
+                                    self.config)
+        self.bundle = None
+        self.bundle_path = None
 
     def ask(self, limit):
         """Display Ask HN posts.
@@ -104,6 +175,46 @@ class HackerNews(object):
             message=self.headlines_message('Best'),
             item_ids=self.hacker_news_api.best_stories(limit))
 
+    def build_bundle(self, limit, with_comments, with_articles):
+        """Build a bundle to read Hacker News offline.
+
+        See `bundle.BundleBuilder.build`.
+
+        :type limit: int
+        :param limit: The number of stories bundled from each story list.
+
+        :type with_comments: bool
+        :param with_comments: Specifies if the comment trees are bundled.
+
+        :type with_articles: bool
+        :param with_articles: Specifies if the rendered articles are
+            bundled.
+        """
+        path = self.get_bundle_path()
+        click.secho('Building bundle {0}...'.format(path),
+                    fg=self.config.clr_general)
+        posts = self.resolve_hiring_and_freelance_posts()
+        monthly_posts = None
+        if posts is not None:
+            monthly_posts = (posts[0]['id'], posts[1]['id'])
+        builder = BundleBuilder(self.hacker_news_api, self.web_viewer)
+        counts = builder.build(limit, with_comments, with_articles,
+                               monthly_posts)
+        builder.bundle.save(path)
+        click.secho('Bundled {stories} stories, {comments} comments and '
+                    '{articles} articles.'.format(**counts),
+                    fg=self.config.clr_general)
+
+    def get_bundle_path(self):
+        """Get the bundle file path.
+
+        :rtype: str
+        :return: The bundle file path.
+        """
+        if self.bundle_path is not None:
+            return self.bundle_path
+        return self.config.get_cache_path(self.BUNDLE_FILE)
+
     def headlines_message(self, message):
         """Create the "Fetching [message] Headlines..." string.
 
@@ -141,6 +252,198 @@ class HackerNews(object):
         except IOError:
             sys.stderr.close()
 
+    def hiring_and_freelance_months(self, regex_query, kind, months):
+        """Display comments matching the last few monthly posts.
+
+        Threads are loaded concurrently through the thread cache while the
+        results are streamed month by month, newest first.
+
+        :type regex_query: str
+        :param regex_query: The regex query to match.
+
+        :type kind: str
+        :param kind: The monthly post kind, a key of MONTHLY_POST_TITLES.
+
+        :type months: int
+        :param months: The number of monthly posts to search.
+        """
+        try:
+            posts = self.find_monthly_posts(kind, months)
+        except InvalidUserID:
+            self.print_item_not_found(self.MONTHLY_POSTS_USER)
+            return
+        executor = ThreadPoolExecutor(max_workers=self.MAX_THREAD_WORKERS)
+        try:
+            futures = [executor.submit(self.load_thread, post['id'])
+                       for post in posts]
+            for post, future in zip(posts, futures):
+                click.secho('\n' + self.format_month(post),
+                            fg=self.config.clr_header)
+                try:
+                    thread = future.result()
+                except (InvalidItemID, HTTPError):
+                    self.print_item_not_found(post['id'])
+                    continue
+                self.print_thread_comments(thread, regex_query)
+        except IOError:
+            sys.stderr.close()
+        finally:
+            executor.shutdown(wait=False)
+
+    def hiring_and_freelance_keywords(self, keywords, post_id,
+                                      regex_query=None):
+        """Display comments matching any of the keywords with counts.
+
+        Scans each top level comment of the cached thread once for all
+        keywords, lists the keywords each matching comment hits, then the
+        number of comments hit by each keyword.
+
+        :type keywords: list
+        :param keywords: The keywords to match, case insensitive.
+
+        :type post_id: int
+        :param post_id: the who is hiring post id.
+
+        :type regex_query: str
+        :param regex_query: An optional regex query comments must also match.
+        """
+        try:
+            thread = self.load_thread(post_id)
+            matcher = AhoCorasick(keywords)
+            keyword_counts = dict((keyword, 0) for keyword in keywords)
+            for comment in thread['comments']:
+                item = Item(comment)
+                if regex_query and not self.match_regex(item, regex_query):
+                    continue
+                text = self.html.unescape(
+                    self.REGEX_TAG.sub(' ', item.text))
+                matched_keywords = matcher.matches(text)
+                if not matched_keywords:
+                    continue
+                for keyword in matched_keywords:
+                    keyword_counts[keyword] += 1
+                formatted_heading, formatted_comment = self.format_comment(
+                    item,
+                    depth=0,
+                    header_color='magenta',
+                    header_adornment=' [{0}]'.format(
+                        ', '.join(matched_keywords)))
+                click.echo(formatted_heading, color=True)
+                click.echo(formatted_comment, color=True)
+            self.print_keyword_counts(keyword_counts)
+        except InvalidItemID:
+            self.print_item_not_found(post_id)
+        except IOError:
+            sys.stderr.close()
+
+    def hiring_and_freelance_ranked(self, query, post_id, limit):
+        """Display the comments best matching the query, best match first.
+
+        Ranks the top level comments of the cached thread with BM25 instead
+        of listing regex matches in thread order.
+
+        :type query: str
+        :param query: The free text query, such as "python remote".
+
+        :type post_id: int
+        :param post_id: the who is hiring post id.
+
+        :type limit: int
+        :param limit: the number of comments to show.
+        """
+        try:
+            thread = self.load_thread(post_id)
+            if thread['index'].get('version') != Bm25Index.VERSION:
+                thread['index'] = Bm25Index.build(
+                    comment['text'] for comment in thread['comments']).to_dict()
+                self.thread_cache.save(thread)
+            index = Bm25Index.from_dict(thread['index'])
+            results = index.top_k(query, limit)
+            if not results:
+                click.secho('No comments match ' + query, fg='red')
+            for doc_index, score in results:
+                item = Item(thread['comments'][doc_index])
+                formatted_heading, formatted_comment = self.format_comment(
+                    item,
+                    depth=0,
+                    header_color='magenta',
+                    header_adornment=' [{0:.2f}]'.format(score))
+                click.echo(formatted_heading, color=True)
+                click.echo(formatted_comment, color=True)
+        except InvalidItemID:
+            self.print_item_not_found(post_id)
+        except IOError:
+            sys.stderr.close()
+
+    def hiring_and_freelance_where(self, where, post_id, regex_query=None):
+        """Display comments whose header fields match the where expression.
+
+        The expression runs on the columns extracted from the comment headers
+        of the cached thread, see :class:`hiring_facets.WhereFilter`.
+
+        :type where: str
+        :param where: The filter expression, such as "remote and salary>150k".
+
+        :type post_id: int
+        :param post_id: the who is hiring post id.
+
+        :type regex_query: str
+        :param regex_query: An optional regex query comments must also match.
+        """
+        try:
+            where_filter = WhereFilter(where)
+        except InvalidWhereExpression as e:
+            click.secho('Error: Invalid --where expression: ' + str(e),
+                        fg='red')
+            return
+        try:
+            thread = self.load_thread(post_id)
+            if 'facets' not in thread:
+                # Cached before facets were extracted.
+                thread['facets'] = self.hiring_facets.extract(
+                    thread['comments'])
+                self.thread_cache.save(thread)
+            facets = thread['facets']
+            num_matches = 0
+            for row in where_filter.filter(facets):
+                item = Item(thread['comments'][row])
+                if regex_query and not self.match_regex(item, regex_query):
+                    continue
+                num_matches += 1
+                formatted_heading, formatted_comment = self.format_comment(
+                    item,
+                    depth=0,
+                    header_color='magenta',
+                    header_adornment=self.format_facets(facets, row))
+                click.echo(formatted_heading, color=True)
+                click.echo(formatted_comment, color=True)
+            click.secho('\n{0} matching comments'.format(num_matches),
+                        fg=self.config.clr_general)
+        except InvalidItemID:
+            self.print_item_not_found(post_id)
+        except IOError:
+            sys.stderr.close()
+
+    def item_to_dict(self, item):
+        """Convert an item to the raw dict format returned by the api.
+
+        :type item: :class:`haxor.Item`
+        :param item: An instance of `haxor.Item`.
+
+        :rtype: dict
+        :return: The item's id, author, submission time and text.
+        """
+        submission_time = 0
+        if item.submission_time is not None:
+            submission_time = int(time.mktime(
+                item.submission_time.timetuple()))
+        return {
+            'id': item.item_id,
+            'by': item.by,
+            'time': submission_time,
+            'text': item.text,
+        }
+
     def jobs(self, limit):
         """Display job posts.
 
@@ -151,6 +454,97 @@ class HackerNews(object):
             message=self.headlines_message('Jobs'),
             item_ids=self.hacker_news_api.job_stories(limit))
 
+    def load_bundle(self):
+        """Serve every command from the bundle, without any request.
+
+        :raises: `bundle.InvalidBundle` if the bundle cannot be read.
+        """
+        self.bundle = Bundle.load(self.get_bundle_path())
+        self.hacker_news_api = OfflineHackerNewsApi(self.bundle)
+        self.web_viewer.article_cache = BundleArticleCache(self.bundle)
+        self.web_viewer.offline = True
+
+    def load_hiring_and_freelance_ids(self):
+        """Load the latest who's hiring and freelancer post ids.
+
+        See :meth:`Config.load_hiring_and_freelance_ids`.  Offline, the
+        bundled post ids are used, or the cached or default ids if the
+        bundle has none, without any request.
+        """
+        if self.bundle is not None:
+            if self.bundle.hiring_id:
+                self.config.hiring_id = self.bundle.hiring_id
+                self.config.freelance_id = self.bundle.freelance_id
+            else:
+                self.config \
+                    .load_hiring_and_freelance_ids_from_cache_or_defaults()
+            return
+        self.config.load_hiring_and_freelance_ids(
+            resolve_posts=self.resolve_hiring_and_freelance_posts)
+
+    def load_thread(self, post_id):
+        """Load the top level comments of the given thread.
+
+        Comments are served from the thread cache, only comments posted since
+        the thread was last cached are fetched.  The search index is rebuilt
+        whenever new comments arrive.  Threads last fetched once they were
+        older than THREAD_FINAL_AGE are served from the cache without any
+        request.
+
+        :type post_id: int
+        :param post_id: The post id.
+
+        :rtype: dict
+        :return: The thread, see :class:`thread_cache.ThreadCache`.
+
+        :raises: `InvalidItemID` if the post does not exist.
+        """
+        with span('load thread cache', 'cache', post_id=post_id):
+            thread = self.thread_cache.load(post_id)
+        if thread is not None and thread['time'] and \
+                thread.get('fetched', 0) - thread['time'] > \
+                self.THREAD_FINAL_AGE:
+            stats.count('thread_cache_hits')
+            return thread
+        now = time.time()
+        item = self.hacker_news_api.get_item(post_id)
+        kids = item.kids or []
+        comments = {}
+        handled_ids = set()
+        if thread is not None:
+            comments = dict((comment['id'], comment)
+                            for comment in thread['comments'])
+            handled_ids = set(thread['kids'])
+        new_ids = [kid for kid in kids if kid not in handled_ids]
+        if thread is not None and not new_ids:
+            stats.count('thread_cache_hits')
+            if thread['time'] and now - thread['time'] > self.THREAD_FINAL_AGE:
+                # The final refresh, no request is sent for it anymore.
+                thread['fetched'] = now
+                self.thread_cache.save(thread)
+            return thread
+        stats.count('thread_cache_misses')
+        # Comments that failed to fetch are left out and retried next run.
+        for comment in self.hacker_news_api.get_items(new_ids):
+            handled_ids.add(comment.item_id)
+            # Deleted and dead comments have no text.
+            if comment.text is not None:
+                comments[comment.item_id] = self.item_to_dict(comment)
+        thread = self.item_to_dict(item)
+        thread['title'] = item.title
+        thread['fetched'] = now
+        thread['kids'] = [kid for kid in kids if kid in handled_ids]
+        thread['comments'] = [comments[kid] for kid in kids
+                              if kid in comments]
+        with span('index thread', 'parse', comments=len(thread['comments'])):
+            thread['index'] = Bm25Index.build(
+                comment['text'] for comment in thread['comments']).to_dict()
+            thread['facets'] = self.hiring_facets.extract(
+                thread['comments'])
+        with span('save thread cache', 'cache', post_id=post_id):
+            self.thread_cache.save(thread)
+        return thread
+
     def new(self, limit):
         """Display the latest posts.
 
@@ -176,6 +570,28 @@ class HackerNews(object):
             index += 1
         click.echo('')
 
+    def parse_keywords(self, lines):
+        """Parse a keywords file, one keyword per line.
+
+        Blank lines, lines starting with # and duplicates are skipped.
+
+        :type lines: iterable
+        :param lines: The lines of the keywords file.
+
+        :rtype: list
+        :return: The keywords, in file order.
+        """
+        keywords = []
+        seen = set()
+        for line in lines:
+            keyword = line.strip()
+            if not keyword or keyword.startswith('#') or \
+                    keyword.lower() in seen:
+                continue
+            seen.add(keyword.lower())
+            keywords.append(keyword)
+        return keywords
+
     def print_comment(self, item, regex_query='',
                       comments_hide_non_matching=False, depth=0):
         """Print the comments for the given item.
@@ -211,17 +627,19 @@ class HackerNews(object):
                 show_comment = False
         formatted_heading, formatted_comment = self.format_comment(
             item, depth, header_color, header_adornment)
-        if show_comment:
-            click.echo(formatted_heading, color=True)
-            click.echo(formatted_comment, color=True)
-        elif comments_hide_non_matching:
-            click.secho('.', nl=False)
-        else:
-            click.echo(formatted_heading, color=True)
-            num_chars = len(formatted_comment)
-            if num_chars > self.MAX_SNIPPET_LENGTH:
-                num_chars = self.MAX_SNIPPET_LENGTH
-            click.echo(formatted_comment[0:num_chars] + ' [...]', color=True)
+        with span('write', 'output'):
+            if show_comment:
+                click.echo(formatted_heading, color=True)
+                click.echo(formatted_comment, color=True)
+            elif comments_hide_non_matching:
+                click.secho('.', nl=False)
+            else:
+                click.echo(formatted_heading, color=True)
+                num_chars = len(formatted_comment)
+                if num_chars > self.MAX_SNIPPET_LENGTH:
+                    num_chars = self.MAX_SNIPPET_LENGTH
+                click.echo(formatted_comment[0:num_chars] + ' [...]',
+                           color=True)
 
     def print_comments(self, item, regex_query='',
                        comments_hide_non_matching=False, depth=0):
@@ -258,6 +676,51 @@ class HackerNews(object):
                 click.echo('')
                 self.print_item_not_found(comment_id)
 
+    def find_monthly_posts(self, kind, months):
+        """Find the latest monthly posts of the given kind.
+
+        Walks the submissions of MONTHLY_POSTS_USER, newest first.  Titles of
+        submissions seen in previous runs are kept in the thread cache so
+        they are never fetched twice.
+
+        :type kind: str
+        :param kind: The monthly post kind, a key of MONTHLY_POST_TITLES.
+
+        :type months: int
+        :param months: The number of monthly posts to find.
+
+        :rtype: list
+        :return: The posts as dicts with id, title and time keys, newest
+            first.
+
+        :raises: `InvalidUserID` if MONTHLY_POSTS_USER does not exist.
+        """
+        user = self.hacker_news_api.get_user(self.MONTHLY_POSTS_USER)
+        submitted = user.submitted or []
+        title_regex = self.MONTHLY_POST_TITLES[kind]
+        known_posts = self.thread_cache.load_monthly_posts()
+        posts = []
+        # MONTHLY_POSTS_USER submits three posts a month.
+        batch_size = 3 * months
+        for start in range(0, len(submitted), batch_size):
+            batch = submitted[start:start+batch_size]
+            unknown_ids = [post_id for post_id in batch
+                           if str(post_id) not in known_posts]
+            for item in self.hacker_news_api.get_items(unknown_ids):
+                known_posts[str(item.item_id)] = {
+                    'title': item.title or '',
+                    'time': self.item_to_dict(item)['time'],
+                }
+            for post_id in batch:
+                post = known_posts.get(str(post_id))
+                if post is not None and title_regex.search(post['title']):
+                    posts.append(dict(post, id=post_id))
+            if len(posts) >= months:
+                break
+        self.thread_cache.save_monthly_posts(known_posts)
+        return posts[:months]
+
+    @traced('format_comment', 'format')
     def format_comment(self, item, depth, header_color, header_adornment):
         """Format a given item's comment.
 
@@ -277,6 +740,7 @@ class HackerNews(object):
         :return: * A string representing the formatted comment header.
                  * A string representing the formatted comment.
         """
+        stats.count('items_rendered')
         indent = self.COMMENT_INDENT * depth
         formatted_heading = click.style(
             '\n{i}{b} - {d}{h}'.format(
@@ -300,6 +764,45 @@ class HackerNews(object):
                                             subsequent_indent=indent)
         return formatted_heading, formatted_comment
 
+    def format_month(self, post):
+        """Format the month of a monthly post.
+
+        :type post: dict
+        :param post: The post's id, title and time.
+
+        :rtype: str
+        :return: The month from the post title, such as 'March 2021'.
+            Falls back to the post's submission month.
+        """
+        match = self.REGEX_TITLE_MONTH.search(post['title'])
+        if match:
+            return match.group(1)
+        return datetime.fromtimestamp(post['time']).strftime('%B %Y')
+
+    def format_facets(self, facets, row):
+        """Format the extracted header fields of a comment.
+
+        :type facets: dict
+        :param facets: The column store, see
+            :class:`hiring_facets.HiringFacets`.
+
+        :type row: int
+        :param row: The comment's row.
+
+        :rtype: str
+        :return: The fields, such as ' [Acme | NYC | remote | 150k-200k]'.
+        """
+        fields = [facets['company'][row], facets['location'][row]]
+        if facets['remote'][row]:
+            fields.append('remote')
+        if facets['salary_min'][row] is not None:
+            fields.append('{0}k-{1}k'.format(
+                facets['salary_min'][row] // 1000,
+                facets['salary_max'][row] // 1000))
+        if facets['visa'][row]:
+            fields.append('visa')
+        return ' [{0}]'.format(' | '.join(field for field in fields if field))
+
     def format_index_title(self, index, title):
         """Format and item's index and title.
 
@@ -321,6 +824,24 @@ class HackerNews(object):
                                              fg=self.config.clr_title)
         return formatted_index_title
 
+    @traced('echo_via_pager', 'output')
+    def echo_via_pager(self, contents):
+        """Page the given contents, or print them on Windows.
+
+        :type contents: iterable
+        :param contents: The contents as chunks of text.
+        """
+        if platform.system() == 'Windows':
+            try:
+                # Strip out Unicode, which seems to have issues on Windows
+                contents = re.sub(r'[^\x00-\x7F]+', '', ''.join(contents))
+                click.echo(contents)
+            except IOError:
+                sys.stderr.close()
+        else:
+            click.echo_via_pager(contents)
+
+    @traced('format_item', 'format')
     def format_item(self, item, index):
         """Format an item.
 
@@ -334,6 +855,7 @@ class HackerNews(object):
         :rtype: str
         :return: The formatted item.
         """
+        stats.count('items_rendered')
         formatted_item = self.format_index_title(index, item.title)
         if item.url is not None:
             netloc = urlparse(item.url).netloc
@@ -361,6 +883,42 @@ class HackerNews(object):
         """
         click.secho('Item with id {0} not found.'.format(item_id), fg='red')
 
+    def print_keyword_counts(self, keyword_counts):
+        """Print the number of matching comments per keyword.
+
+        :type keyword_counts: dict
+        :param keyword_counts: Maps a keyword to its number of matches.
+        """
+        click.secho('\nKeyword counts:', fg=self.config.clr_general)
+        for keyword, count in sorted(keyword_counts.items(),
+                                     key=lambda pair: (-pair[1], pair[0])):
+            click.echo(click.style('  ' + keyword + ': ',
+                                   fg=self.config.clr_general) +
+                       click.style(str(count),
+                                   fg=self.config.clr_num_comments))
+
+    def print_thread_comments(self, thread, regex_query=None):
+        """Print the cached top level comments matching the regex query.
+
+        :type thread: dict
+        :param thread: The thread, see :class:`thread_cache.ThreadCache`.
+
+        :type regex_query: str
+        :param regex_query: The regex query to match, None matches all.
+        """
+        num_matches = 0
+        for comment in thread['comments']:
+            item = Item(comment)
+            if regex_query and not self.match_regex(item, regex_query):
+                continue
+            num_matches += 1
+            formatted_heading, formatted_comment = self.format_comment(
+                item, depth=0, header_color='magenta', header_adornment='')
+            click.echo(formatted_heading, color=True)
+            click.echo(formatted_comment, color=True)
+        click.secho('\n{0} matching comments'.format(num_matches),
+                    fg=self.config.clr_general)
+
     def print_items(self, message, item_ids):
         """Print the items.
 
@@ -380,7 +938,8 @@ class HackerNews(object):
                 if item.title:
                     formatted_item = self.format_item(item, index)
                     self.config.item_ids.append(item.item_id)
-                    click.echo(formatted_item)
+                    with span('write', 'output'):
+                        click.echo(formatted_item)
                     index += 1
             except InvalidItemID:
                 self.print_item_not_found(item_id)
@@ -450,6 +1009,63 @@ class HackerNews(object):
         else:
             return True
 
+    def read(self, stories, limit):
+        """Fetch and page the articles of the given stories.
+
+        The articles are fetched and rendered in parallel, see
+        `web_viewer.WebViewer.render_many`, and paged in the order they
+        finish.  Stories without an url, such as Ask HN posts, are skipped.
+
+        :type stories: str
+        :param stories: The stories to read, one of STORIES.
+
+        :type limit: int
+        :param limit: The number of stories to read.
+        """
+        get_story_ids = {
+            'ask': self.hacker_news_api.ask_stories,
+            'best': self.hacker_news_api.best_stories,
+            'new': self.hacker_news_api.new_stories,
+            'show': self.hacker_news_api.show_stories,
+            'top': self.hacker_news_api.top_stories,
+        }[stories]
+        click.secho(self.headlines_message(stories.title()),
+                    fg=self.config.clr_general)
+        items = {}
+        urls = []
+        for item in self.hacker_news_api.get_items(get_story_ids(limit)):
+            if item.url and item.url not in items:
+                items[item.url] = item
+                urls.append(item.url)
+        if not urls:
+            click.secho('No articles to read.', fg=self.config.clr_general)
+            return
+
+        def generate_contents():
+            for url, contents in self.web_viewer.render_many(urls):
+                yield click.style('\n' + items[url].title + '\n',
+                                  fg=self.config.clr_title)
+                yield click.style(url + '\n\n', fg=self.config.clr_general)
+                yield contents
+        self.echo_via_pager(generate_contents())
+
+    def resolve_hiring_and_freelance_posts(self):
+        """Resolve the latest hiring and freelance posts.
+
+        :rtype: tuple
+        :return: The latest hiring and freelance posts as dicts with id,
+            title and time keys, or None if either could not be found.
+        """
+        try:
+            hiring_posts = self.find_monthly_posts('hiring', 1)
+            freelance_posts = self.find_monthly_posts('freelance', 1)
+        except (InvalidUserID, HTTPError,
+                requests.exceptions.RequestException):
+            return None
+        if not hiring_posts or not freelance_posts:
+            return None
+        return hiring_posts[0], freelance_posts[0]
+
     def show(self, limit):
         """Display Show HN posts.
 
@@ -493,6 +1109,34 @@ class HackerNews(object):
         except InvalidUserID:
             self.print_item_not_found(user_id)
 
+    def use_cassette(self, cassette, record=False, latency_scale=1.0):
+        """Send the API and article requests through a cassette.
+
+        See `cassette.RecordingAdapter` and `cassette.ReplayAdapter`.
+
+        :type cassette: :class:`cassette.Cassette`
+        :param cassette: The cassette.
+
+        :type record: bool
+        :param record: Specifies if the requests are sent and recorded
+            instead of replayed.
+
+        :type latency_scale: float
+        :param latency_scale: Multiplies the replayed latencies, 0 replays
+            without any delay.
+        """
+        sessions = [
+            (self.hacker_news_api.session,
+             self.hacker_news_api.MAX_CONCURRENCY),
+            (self.web_viewer.session, self.web_viewer.POOL_SIZE),
+        ]
+        for session, pool_size in sessions:
+            if record:
+                adapter = RecordingAdapter(cassette, pool_maxsize=pool_size)
+            else:
+                adapter = ReplayAdapter(cassette, latency_scale)
+            mount_cassette(session, adapter)
+
     def view(self, index, comments_query, comments,
              comments_hide_non_matching, browser):
         """View the given index contents.
@@ -546,6 +1190,9 @@ class HackerNews(object):
             if browser:
                 webbrowser.open(comments_url)
             else:
+                # The text of an Ask HN post is printed with its comments.
+                rendered = stats.registry.get('items_rendered') + \
+                    (item.text is not None)
                 try:
                     self.print_comments(
                         item,
@@ -554,6 +1201,8 @@ class HackerNews(object):
                     click.echo('')
                 except IOError:
                     sys.stderr.close()
+                stats.observe('comment_tree_size',
+                              stats.registry.get('items_rendered') - rendered)
                 self.config.save_cache()
         else:
             click.secho('\nOpening ' + item.url + ' ...',
@@ -561,31 +1210,27 @@ class HackerNews(object):
             if browser:
                 webbrowser.open(item.url)
             else:
-                contents = self.web_viewer.generate_url_contents(item.url)
                 header = click.style('Viewing ' + item.url + '\n\n',
                                      fg=self.config.clr_general)
-                contents = header + contents
-                contents += click.style(('\nView this article in a browser with'
-                                         ' the -b/--browser flag.\n'),
-                                        fg=self.config.clr_general)
-                contents += click.style(('\nPress q to quit viewing this '
-                                         'article.\n'),
-                                        fg=self.config.clr_general)
-                if platform.system() == 'Windows':
-                    try:
-                        # Strip out Unicode, which seems to have issues on
-                        # Windows
-                        contents = re.sub(r'[^\x00-\x7F]+', '', contents)
-                        click.echo(contents)
-                    except IOError:
-                        sys.stderr.close()
-                else:
-                    click.echo_via_pager(contents)
+                footer = click.style(('\nView this article in a browser with'
+                                      ' the -b/--browser flag.\n'),
+                                     fg=self.config.clr_general)
+                footer += click.style(('\nPress q to quit viewing this '
+                                       'article.\n'),
+                                      fg=self.config.clr_general)
+                # Stream the article so the pager shows the first paragraphs
+                # while the rest is still downloading.
+                contents = itertools.chain(
+                    [header],
+                    self.web_viewer.stream_url_contents(item.url),
+                    [footer])
+                self.echo_via_pager(contents)
             click.echo('')
 
     def view_setup(self, index, comments_regex_query, comments,
                    comments_recent, comments_unseen,
-                   comments_hide_non_matching, clear_cache, browser):
+                   comments_hide_non_matching, clear_cache, browser,
+                   main_content=False):
         """Set up the call to view the given index comments or url.
 
         This method is meant to be called after a command that outputs a
@@ -620,7 +1265,12 @@ class HackerNews(object):
         :type browser: bool
         :param browser: Determines whether to clear the comment cache before
             running the view command.
+
+        :type main_content: bool
+        :param main_content: Determines whether to view only the main
+            content of the page instead of streaming the whole page.
         """
+        self.web_viewer.extract_content = main_content
         if comments_regex_query is not None:
             comments = True
         if comments_recent:
@@ -18,28 +18,220 @@ from __future__ import division
 
 import click
 
+from .bundle import InvalidBundle
+from .cassette import Cassette, InvalidCassette
 from .hacker_news import HackerNews
+from .lib import stats, tracing
+from .lib.metrics import write_metrics
+from .lib.profiling import CommandProfiler
 
 
 pass_hacker_news = click.make_pass_decorator(HackerNews)
 
 
+def start_trace(ctx, path):
+    """Trace the invoked command, saving the trace once it completes.
+
+    :type ctx: :class:`click.core.Context`
+    :param ctx: The context of the command group.
+
+    :type path: str
+    :param path: The trace file path.
+    """
+    tracer = tracing.start_tracing()
+    command_span = tracing.span(
+        'hn {0}'.format(ctx.invoked_subcommand or ''), 'command')
+    command_span.__enter__()
+
+    def save_trace():
+        command_span.__exit__(None, None, None)
+        tracing.stop_tracing()
+        tracer.save(path)
+
+    ctx.call_on_close(save_trace)
+
+
+def start_profile(ctx, kind, path):
+    """Create the profiler of the invoked command.
+
+    The profile is written once the command completes, before the other
+    close callbacks run, so it only covers the command.
+
+    :type ctx: :class:`click.core.Context`
+    :param ctx: The context of the command group.
+
+    :type kind: str
+    :param kind: cpu or mem.
+
+    :type path: str
+    :param path: The profile file path, or None for the default.
+
+    :rtype: :class:`profiling.CommandProfiler`
+    :return: The profiler, to start once the setup is done.
+    """
+    if path is None:
+        path = CommandProfiler.get_default_path(kind,
+                                                ctx.invoked_subcommand)
+    try:
+        profiler = CommandProfiler(kind, path)
+    except ValueError as e:
+        click.secho('Error: {0}'.format(e), fg='red')
+        ctx.exit(1)
+
+    def save_profile():
+        if profiler.stop():
+            click.echo('Profile saved to ' + path, err=True)
+
+    ctx.call_on_close(save_profile)
+    return profiler
+
+
 class HackerNewsCli(object):
     """Encapsulate the Hacker News Command Line Interface."""
 
     @click.group()
+    @click.option('--offline', is_flag=True, envvar='HAXOR_OFFLINE')
+    @click.option('--bundle', 'bundle_path', required=False, default=None,
+                  envvar='HAXOR_BUNDLE')
+    @click.option('--record', required=False, default=None,
+                  envvar='HAXOR_RECORD')
+    @click.option('--replay', required=False, default=None,
+                  envvar='HAXOR_REPLAY')
+    @click.option('--replay_latency', required=False, default=1.0,
+                  envvar='HAXOR_REPLAY_LATENCY')
+    @click.option('--trace', required=False, default=None,
+                  envvar='HAXOR_TRACE')
+    @click.option('--hedge', is_flag=True, envvar='HAXOR_HEDGE')
+    @click.option('--stats', 'show_stats', is_flag=True, envvar='HAXOR_STATS')
+    @click.option('--metrics', required=False, default=None,
+                  envvar='HAXOR_METRICS')
+    @click.option('--profile', required=False, default=None,
+                  type=click.Choice(sorted(CommandProfiler.KINDS)),
+                  envvar='HAXOR_PROFILE')
+    @click.option('--profile_file', required=False, default=None,
+                  envvar='HAXOR_PROFILE_FILE')
     @click.pass_context
-    def cli(ctx):
+    def cli(ctx, offline, bundle_path, record, replay, replay_latency,
+            trace, hedge, show_stats, metrics, profile, profile_file):
         """Main entry point for HackerNewsCli.
 
+        Example(s):
+            hn --offline top
+            HAXOR_OFFLINE=1 hn view 3
+            hn --bundle flight.json.gz --offline hiring "(?i)python"
+            hn --record top.json.gz top
+            hn --replay top.json.gz --replay_latency 0 top
+            hn --trace view.trace.json view 3 -c
+            hn --hedge view 3 -c
+            hn --stats top 30 > top.txt
+            hn --metrics /var/lib/node_exporter/textfile/hn.prom top
+            hn --profile cpu view 3 -c
+            hn --profile mem --profile_file view.txt view 3 -c
+
         :type ctx: :class:`click.core.Context`
         :param ctx: An instance of click.core.Context that stores an instance
             of `hacker_news.HackerNews`.
+
+        :type offline: bool
+        :param offline: Determines whether to serve every command from the
+            bundle built by hn bundle build, without any request.  Also set
+            by the HAXOR_OFFLINE environment variable.
+
+        :type bundle_path: str
+        :param bundle_path: The bundle file path, also set by the
+            HAXOR_BUNDLE environment variable.  Optional, defaults to
+            bundle.json.gz in the cache directory.
+
+        :type record: str
+        :param record: The cassette file recording the API and article
+            requests, also set by the HAXOR_RECORD environment variable.
+
+        :type replay: str
+        :param replay: The cassette file replaying the API and article
+            requests without any network access, also set by the
+            HAXOR_REPLAY environment variable.
+
+        :type replay_latency: float
+        :param replay_latency: Multiplies the replayed latencies, 0 replays
+            without any delay.  Also set by the HAXOR_REPLAY_LATENCY
+            environment variable.  Optional, defaults to 1.
+
+        :type trace: str
+        :param trace: The file the command's timing spans are saved to as
+            Chrome trace-event JSON, to open in Perfetto or
+            chrome://tracing.  Also set by the HAXOR_TRACE environment
+            variable.
+
+        :type hedge: bool
+        :param hedge: Determines whether to duplicate the item requests that
+            are slower than most, taking whichever answers first.  Hedges
+            add at most a few percent of requests.  Also set by the
+            HAXOR_HEDGE environment variable.
+
+        :type show_stats: bool
+        :param show_stats: Determines whether to print a summary of the
+            requests, cache lookups and renders of the command to stderr
+            once it completes.  Also set by the HAXOR_STATS environment
+            variable.
+
+        :type metrics: str
+        :param metrics: The metrics file the command's requests, errors,
+            cache lookups and comment tree sizes are added to, in the
+            Prometheus text format read by node-exporter's textfile
+            collector.  Also set by the HAXOR_METRICS environment variable.
+
+        :type profile: str
+        :param profile: cpu to profile the command with cProfile, or mem to
+            report its top allocations with tracemalloc.  Startup is left
+            out of the profile.  Also set by the HAXOR_PROFILE environment
+            variable.
+
+        :type profile_file: str
+        :param profile_file: The profile file, also set by the
+            HAXOR_PROFILE_FILE environment variable.  Optional, defaults to
+            hn-<command>.pstats for cpu and hn-<command>.mem.txt for mem.
         """
+        profiler = None
+        if profile is not None:
+            profiler = start_profile(ctx, profile, profile_file)
+        if trace is not None:
+            start_trace(ctx, trace)
+        if show_stats or metrics is not None:
+            registry = stats.reset()
+        if show_stats:
+            ctx.call_on_close(
+                lambda: click.echo(registry.summary(), err=True))
+        if metrics is not None:
+            command = ctx.invoked_subcommand or ''
+            ctx.call_on_close(
+                lambda: write_metrics(metrics, registry, command))
         # Create a HackerNews object and remember it as the context object.
         # From this point onwards other commands can refer to it by using the
         # @pass_hacker_news decorator.
         ctx.obj = HackerNews()
+        ctx.obj.bundle_path = bundle_path
+        if offline:
+            try:
+                ctx.obj.load_bundle()
+            except InvalidBundle as e:
+                click.secho('Error: {0}, run hn bundle build first'.format(e),
+                            fg='red')
+                ctx.exit(1)
+        if record is not None:
+            cassette = Cassette()
+            ctx.obj.use_cassette(cassette, record=True)
+            ctx.call_on_close(lambda: cassette.save(record))
+        elif replay is not None:
+            try:
+                cassette = Cassette.load(replay)
+            except InvalidCassette as e:
+                click.secho('Error: {0}'.format(e), fg='red')
+                ctx.exit(1)
+            ctx.obj.use_cassette(cassette, latency_scale=replay_latency)
+        if hedge and not offline:
+            ctx.obj.hacker_news_api.enable_hedging()
+        if profiler is not None:
+            profiler.start()
 
     @cli.command()
     @click.argument('limit', required=False, default=10)
@@ -79,17 +271,68 @@ class HackerNewsCli(object):
         """
         hacker_news.best(limit)
 
+    @cli.group()
+    def bundle():
+        """Build bundles to read Hacker News offline, hn bundle --help."""
+
+    @bundle.command()
+    @click.option('-t', '--top', required=False, default=30)
+    @click.option('-wc', '--with_comments', is_flag=True)
+    @click.option('-wa', '--with_articles', is_flag=True)
+    @pass_hacker_news
+    def build(hacker_news, top, with_comments, with_articles):
+        """Build a bundle to read Hacker News offline.
+
+        Bundles the first stories of the ask, best, jobs, new, show and top
+        lists with their authors, and the latest hiring and freelance posts
+        with their top level comments.  Comment trees and articles are
+        fetched concurrently.  Read the bundle with hn --offline.
+
+        Example(s):
+            hn bundle build
+            hn bundle build --top 50 --with_comments --with_articles
+            hn --bundle flight.json.gz bundle build -t 20 -wc -wa
+
+        :type hacker_news: :class:`hacker_news.HackerNews`
+        :param hacker_news: An instance of `hacker_news.HackerNews`.
+
+        :type top: int
+        :param top: specifies the number of stories bundled from each list.
+            Optional, defaults to 30.
+
+        :type with_comments: bool
+        :param with_comments: Determines whether to bundle the full comment
+            trees of the stories and monthly posts.
+
+        :type with_articles: bool
+        :param with_articles: Determines whether to bundle the rendered
+            articles of the stories.
+        """
+        if hacker_news.bundle is not None:
+            click.secho('Error: Cannot build a bundle offline', fg='red')
+            return
+        hacker_news.build_bundle(top, with_comments, with_articles)
+
     @cli.command()
     @click.argument('regex_query', required=False)
     @click.option('-i', '--id_post', required=False, default=0)
+    @click.option('-r', '--rank', is_flag=True)
+    @click.option('-l', '--limit', required=False, default=10)
+    @click.option('-k', '--keywords', required=False, type=click.File('r'))
+    @click.option('-m', '--months', required=False, default=1)
+    @click.option('-w', '--where', required=False, default=None)
     @pass_hacker_news
-    def freelance(hacker_news, regex_query, id_post):
+    def freelance(hacker_news, regex_query, id_post, rank, limit, keywords,
+                  months, where):
         """Display comments from the seeking freelancer posts.
 
         Searches the monthly Hacker News seeking freelancer post for comments
         matching the given regex_query.  Defaults to searching the latest
         post.
 
+        Ranks with --rank, counts keyword hits with --keywords or filters on
+        the comment headers with --where, one of them at a time.
+
         You can search any post by providing a freelancer_post_id:
             Example: https://news.ycombinator.com/item?id=10492087
             freelancer_post_id = 10492087
@@ -100,6 +343,11 @@ class HackerNewsCli(object):
             hn freelance "(?i)Python|JavaScript"  # (?i) case insensitive
             hn freelance "(?i)Python" -i 8394339  # search post 8394339
             hn freelance "(?i)(Python|JavaScript).*(rockstar)" > rockstars.txt
+            hn freelance "python django" --rank  # best matches first
+            hn freelance "python django" -r -l 20
+            hn freelance --keywords keywords.txt  # one keyword per line
+            hn freelance "(?i)Python" --months 6  # search the last 6 posts
+            hn freelance --where "remote and location~europe"
 
         :type hacker_news: :class:`hacker_news.HackerNews`
         :param hacker_news: An instance of `hacker_news.HackerNews`.
@@ -111,23 +359,81 @@ class HackerNewsCli(object):
         :param id_post: The who is hiring post id.
                 Optional, defaults to the latest post based on your installed
                 version of haxor-news.
+
+        :type rank: bool
+        :param rank: Determines whether to treat regex_query as keywords and
+                show the best matching comments first, ranked with BM25.
+
+        :type limit: int
+        :param limit: specifies the number of ranked comments to show.
+            Optional, defaults to 10.
+
+        :type keywords: file
+        :param keywords: A file listing keywords, one per line.  Shows the
+                keywords hit by each comment and the number of comments hit
+                per keyword.  regex_query, if given, must also match.
+
+        :type months: int
+        :param months: specifies the number of monthly posts to search,
+                starting with the latest.  Optional, defaults to 1.
+
+        :type where: str
+        :param where: A filter on the fields parsed from the comment
+                headers, combining remote, visa, salary<>=number,
+                company/location=text and company/location~text with and,
+                or, not and parentheses.  regex_query, if given, must also
+                match.
         """
+        if rank and not regex_query:
+            click.secho('Error: Expected a query to rank', fg='red')
+            return
+        if [rank, keywords is not None, bool(where)].count(True) > 1:
+            click.secho('Error: --rank, --keywords and --where cannot be '
+                        'combined', fg='red')
+            return
+        if months > 1:
+            if id_post != 0 or rank or keywords is not None or where:
+                click.secho('Error: --months only supports a regex query',
+                            fg='red')
+                return
+            hacker_news.hiring_and_freelance_months(regex_query, 'freelance',
+                                                    months)
+            return
         if id_post == 0:
-            hacker_news.config.load_hiring_and_freelance_ids()
+            hacker_news.load_hiring_and_freelance_ids()
             id_post = hacker_news.config.freelance_id
-        hacker_news.hiring_and_freelance(regex_query, id_post)
+        if where:
+            hacker_news.hiring_and_freelance_where(where, id_post,
+                                                   regex_query)
+        elif keywords is not None:
+            hacker_news.hiring_and_freelance_keywords(
+                hacker_news.parse_keywords(keywords), id_post, regex_query)
+        elif rank:
+            hacker_news.hiring_and_freelance_ranked(regex_query, id_post,
+                                                    limit)
+        else:
+            hacker_news.hiring_and_freelance(regex_query, id_post)
 
     @cli.command()
     @click.argument('regex_query', required=False)
     @click.option('-i', '--id_post', required=False, default=0)
+    @click.option('-r', '--rank', is_flag=True)
+    @click.option('-l', '--limit', required=False, default=10)
+    @click.option('-k', '--keywords', required=False, type=click.File('r'))
+    @click.option('-m', '--months', required=False, default=1)
+    @click.option('-w', '--where', required=False, default=None)
     @pass_hacker_news
-    def hiring(hacker_news, regex_query, id_post):
+    def hiring(hacker_news, regex_query, id_post, rank, limit, keywords,
+               months, where):
         """Display comments from the who is hiring posts.
 
         Searches the monthly Hacker News who is hiring post for comments
         matching the given regex_query.  Defaults to searching the latest
         post.
 
+        Ranks with --rank, counts keyword hits with --keywords or filters on
+        the comment headers with --where, one of them at a time.
+
         You can search any post by providing a who_is_hiring_post_id:
             Example: https://news.ycombinator.com/item?id=10492086
             who_is_hiring_post_id = 10492086
@@ -138,6 +444,13 @@ class HackerNewsCli(object):
             hn hiring "(?i)Python|JavaScript"  # (?i) case insensitive
             hn hiring "(?i)Python|JavaScript" -i 8394339  # search post 8394339
             hn hiring "(?i)(Python|JavaScript).*(rockstar)" > rockstars.txt
+            hn hiring "python remote" --rank  # best matches first
+            hn hiring "python remote" -r -l 20
+            hn hiring --keywords keywords.txt  # one keyword per line
+            hn hiring "(?i)remote" -k keywords.txt
+            hn hiring "(?i)Rust" --months 12  # search the last 12 posts
+            hn hiring --where "remote and salary>150k"
+            hn hiring "(?i)python" -w 'location~"new york" or visa'
 
         :type hacker_news: :class:`hacker_news.HackerNews`
         :param hacker_news: An instance of `hacker_news.HackerNews`.
@@ -149,11 +462,60 @@ class HackerNewsCli(object):
         :param id_post: The who is hiring post id.
                 Optional, defaults to the latest post based on your installed
                 version of haxor-news.
+
+        :type rank: bool
+        :param rank: Determines whether to treat regex_query as keywords and
+                show the best matching comments first, ranked with BM25.
+
+        :type limit: int
+        :param limit: specifies the number of ranked comments to show.
+            Optional, defaults to 10.
+
+        :type keywords: file
+        :param keywords: A file listing keywords, one per line.  Shows the
+                keywords hit by each comment and the number of comments hit
+                per keyword.  regex_query, if given, must also match.
+
+        :type months: int
+        :param months: specifies the number of monthly posts to search,
+                starting with the latest.  Optional, defaults to 1.
+
+        :type where: str
+        :param where: A filter on the fields parsed from the comment
+                headers, combining remote, visa, salary<>=number,
+                company/location=text and company/location~text with and,
+                or, not and parentheses.  regex_query, if given, must also
+                match.
         """
+        if rank and not regex_query:
+            click.secho('Error: Expected a query to rank', fg='red')
+            return
+        if [rank, keywords is not None, bool(where)].count(True) > 1:
+            click.secho('Error: --rank, --keywords and --where cannot be '
+                        'combined', fg='red')
+            return
+        if months > 1:
+            if id_post != 0 or rank or keywords is not None or where:
+                click.secho('Error: --months only supports a regex query',
+                            fg='red')
+                return
+            hacker_news.hiring_and_freelance_months(regex_query, 'hiring',
+                                                    months)
+            return
         if id_post == 0:
-            hacker_news.config.load_hiring_and_freelance_ids()
+            hacker_news.load_hiring_and_freelance_ids()
             id_post = hacker_news.config.hiring_id
-        hacker_news.hiring_and_freelance(regex_query, id_post)
+        if where:
+            hacker_news.hiring_and_freelance_where(where, id_post,
+                                                   regex_query)
+        elif keywords is not None:
+            hacker_news.hiring_and_freelance_keywords(
+                hacker_news.parse_keywords(keywords), id_post, regex_query)
+        elif rank:
+            hacker_news.hiring_and_freelance_ranked(regex_query, id_post,
+                                                    limit)
+        else:
+            hacker_news.hiring_and_freelance(regex_query, id_post)
 
     @cli.command()
     @click.argument('limit', required=False, default=10)
@@ -212,6 +574,35 @@ class HackerNewsCli(object):
         """
         hacker_news.onion(limit)
 
+    @cli.command()
+    @click.argument('stories', required=False, default='top',
+                    type=click.Choice(HackerNews.STORIES))
+    @click.argument('limit', required=False, default=10)
+    @pass_hacker_news
+    def read(hacker_news, stories, limit):
+        """Read the articles of the given posts, hn read --help.
+
+        The articles are fetched and rendered in parallel and shown as they
+        are ready.  Recently fetched articles are read from the cache.
+
+        Example(s):
+            hn read
+            hn read top 30
+            hn read show 5
+
+        :type hacker_news: :class:`hacker_news.HackerNews`
+        :param hacker_news: An instance of `hacker_news.HackerNews`.
+
+        :type stories: str
+        :param stories: The posts to read: ask, best, new, show or top.
+            Optional, defaults to top.
+
+        :type limit: int
+        :param limit: specifies the number of articles to read.
+            Optional, defaults to 10.
+        """
+        hacker_news.read(stories, limit)
+
     @cli.command()
     @click.argument('limit', required=False, default=10)
     @pass_hacker_news
@@ -282,10 +673,12 @@ class HackerNewsCli(object):
     @click.option('-b', '--browser', is_flag=True)
     @click.option('-cc', '--clear_cache', is_flag=True)
     @click.option('-ch', '--comments_hide_non_matching', is_flag=True)
+    @click.option('-mc', '--main_content', is_flag=True)
     @pass_hacker_news
     def view(hacker_news, index, comments_regex_query, comments,
              comments_recent, comments_unseen,
-             comments_hide_non_matching, clear_cache, browser):
+             comments_hide_non_matching, clear_cache, browser,
+             main_content):
         """View the post index or id, hn view --help.
 
         Example(s):
@@ -300,6 +693,7 @@ class HackerNewsCli(object):
             hn view 3 -cu -ch
             hn view 3 --comments_unseen --comments_hide_non_matching
             hn view 3 --browser
+            hn view 3 --main_content
             hn view 3 -b -c
             hn view 3 -comments -clear_cache
             hn view 3 "(?i)case insensitive match" --comments
@@ -353,6 +747,12 @@ class HackerNewsCli(object):
         :type browser: bool
         :param browser: Determines whether to view the url
                 in a browser.
+
+        :type main_content: bool
+        :param main_content: Determines whether to view only the main
+                content of the page, without its navigation, sidebars and
+                footers.  The page is shown once fully downloaded instead
+                of as it streams in.
         """
         try:
             post_index = int(index)
@@ -366,4 +766,5 @@ class HackerNewsCli(object):
                                    comments_unseen,
                                    comments_hide_non_matching,
                                    clear_cache,
-                                   browser)
+                                   browser,
+                                   main_content)
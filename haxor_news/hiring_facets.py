@@ -0,0 +1,412 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+import re
+
+from .compat import HTMLParser
+
+
+class InvalidWhereExpression(Exception):
+    pass
+
+
+class HiringFacets(object):
+    """Extract structured fields from hiring post headers.
+
+    Hiring comments loosely follow a "Company | Location | REMOTE | Salary"
+    header convention on their first line.  The extracted fields are stored
+    as a column store, a dict mapping each field to a list with one value
+    per comment, so filters run on the columns instead of regex scanning
+    every comment body.
+
+    Columns:
+        company: The company name, the first header field.
+        location: The first header field that looks like a location.
+        remote: True if the header mentions remote work.
+        salary_min: The lower bound of the salary range, or None.
+        salary_max: The upper bound of the salary range, or None.
+        visa: True if the header mentions visa sponsorship.
+
+    :type COLUMNS: tuple (const)
+    :param COLUMNS: The column names.
+    """
+
+    COLUMNS = ('company', 'location', 'remote', 'salary_min', 'salary_max',
+               'visa')
+    REGEX_AMOUNT = re.compile(
+        u'(?P<currency>[$\u20ac\u00a3]|usd|eur|gbp)?\\s*'
+        r'(?P<number>\d{1,3}(?:,\d{3})+|\d+(?:\.\d+)?)\s*'
+        r'(?P<suffix>k\b|m\b)?', re.I)
+    REGEX_HEADER_END = re.compile(r'<p>|\n', re.I)
+    REGEX_NO_REMOTE = re.compile(r'\b(no|not|non)[ -]remote\b', re.I)
+    REGEX_NO_VISA = re.compile(
+        r'\bno visa|\bvisa sponsorship not|\bnot sponsor|\bcannot sponsor|'
+        r'\bcan\'t sponsor|\bunable to sponsor', re.I)
+    REGEX_RANGE_SEPARATOR = re.compile(
+        u'^\\s*(-|\u2013|\u2014|to)\\s*$', re.I)
+    REGEX_REMOTE = re.compile(r'\bremote\b', re.I)
+    REGEX_ROLE = re.compile(
+        r'\b(engineers?|developers?|designers?|managers?|scientists?|'
+        r'analysts?|architects?|devops|sre|full[ -]?time|part[ -]?time|'
+        r'intern(ship)?s?|contract(or)?|onsite|on-site|hybrid|'
+        r'front[ -]?end|back[ -]?end|full[ -]?stack|staff|senior|lead|'
+        r'head of|director|cto|vp)\b', re.I)
+    REGEX_TAG = re.compile(r'<[^>]*>')
+    REGEX_URL = re.compile(r'https?://|www\.|\.(com|io|ai|co|org)\b', re.I)
+    REGEX_VISA = re.compile(r'\bvisas?\b|\bh-?1b\b|\bsponsorship\b', re.I)
+
+    def __init__(self):
+        try:
+            self.html = HTMLParser.HTMLParser()
+        except AttributeError:
+            self.html = HTMLParser
+
+    def extract(self, comments):
+        """Extract the columns from the given comments.
+
+        :type comments: list
+        :param comments: The comments as raw api dicts.
+
+        :rtype: dict
+        :return: Maps each column name to a list of values, one per comment.
+        """
+        columns = dict((column, []) for column in self.COLUMNS)
+        for comment in comments:
+            fields = self.parse_header(comment.get('text'))
+            for column in self.COLUMNS:
+                columns[column].append(fields[column])
+        return columns
+
+    def get_header(self, text):
+        """Get the plain text header line of a comment.
+
+        :type text: str
+        :param text: The comment html.
+
+        :rtype: str
+        :return: The text before the first paragraph break.
+        """
+        if not text:
+            return ''
+        header = self.REGEX_HEADER_END.split(text, 1)[0]
+        header = self.REGEX_TAG.sub('', header)
+        return self.html.unescape(header).strip()
+
+    def parse_header(self, text):
+        """Parse the header fields of a comment.
+
+        :type text: str
+        :param text: The comment html.
+
+        :rtype: dict
+        :return: Maps each column name to the comment's value.
+        """
+        header = self.get_header(text)
+        fields = [field.strip() for field in header.split('|')]
+        salary_min, salary_max = self.parse_salary(header)
+        return {
+            'company': fields[0] if '|' in header else '',
+            'location': self.parse_location(fields[1:]),
+            'remote': bool(self.REGEX_REMOTE.search(header)) and
+            not self.REGEX_NO_REMOTE.search(header),
+            'salary_min': salary_min,
+            'salary_max': salary_max,
+            'visa': bool(self.REGEX_VISA.search(header)) and
+            not self.REGEX_NO_VISA.search(header),
+        }
+
+    def parse_location(self, fields):
+        """Find the header field that most likely holds the location.
+
+        :type fields: list
+        :param fields: The header fields following the company name.
+
+        :rtype: str
+        :return: The location, or '' if none of the fields look like one.
+        """
+        for field in fields:
+            if not field or self.REGEX_URL.search(field) or \
+                    self.REGEX_ROLE.search(field) or \
+                    self.REGEX_VISA.search(field) or \
+                    self.parse_salary(field)[0] is not None:
+                continue
+            if self.REGEX_REMOTE.sub('', field).strip(' ,;/()-'):
+                return field
+        return ''
+
+    def parse_salary(self, header):
+        """Parse a salary range such as "$150k - $200k" or "120-160K EUR".
+
+        Only amounts with a currency, a k/m suffix or thousands separators
+        are considered, other numbers are more likely team sizes or years.
+
+        :type header: str
+        :param header: The header text.
+
+        :rtype: tuple
+        :return: The (min, max) salary, (None, None) if there is none.
+        """
+        amounts = []
+        for match in self.REGEX_AMOUNT.finditer(header):
+            number = float(match.group('number').replace(',', ''))
+            suffix = (match.group('suffix') or '').lower()
+            if number == 401 and suffix == 'k':
+                # A retirement plan, not a salary.
+                continue
+            amounts.append({
+                'start': match.start(),
+                'end': match.end(),
+                'number': number,
+                'multiplier': {'k': 1000, 'm': 1000000}.get(suffix, 1),
+                'explicit': bool(match.group('currency') or suffix or
+                                 ',' in match.group('number')),
+            })
+        for amount, next_amount in zip(amounts, amounts[1:] + [None]):
+            is_range = next_amount is not None and \
+                self.REGEX_RANGE_SEPARATOR.match(
+                    header[amount['end']:next_amount['start']])
+            if not amount['explicit'] and \
+                    not (is_range and next_amount['explicit']):
+                continue
+            low = amount['number'] * amount['multiplier']
+            high = low
+            if is_range:
+                # "150-200k" and "150k-200", the suffix applies to both.
+                multiplier = max(amount['multiplier'],
+                                 next_amount['multiplier'])
+                if amount['multiplier'] == 1 and amount['number'] < 1000:
+                    low = amount['number'] * multiplier
+                if next_amount['multiplier'] == 1 and \
+                        next_amount['number'] < 1000:
+                    high = next_amount['number'] * multiplier
+                else:
+                    high = next_amount['number'] * \
+                        next_amount['multiplier']
+            if low < 1000:
+                continue
+            return int(min(low, high)), int(max(low, high))
+        return None, None
+
+
+class WhereFilter(object):
+    """Filter the rows of a :class:`HiringFacets` column store.
+
+    Expressions combine terms with and, or, not and parentheses:
+        remote
+        visa
+        salary>150k, salary>=120000, salary<200k
+        location~"new york", company~acme, location=NYC
+
+    salary > x matches rows whose salary range reaches above x, salary < x
+    matches rows whose range starts below x.  ~ is a case insensitive
+    substring match and = a case insensitive exact match.
+
+    Each term is evaluated over a whole column and yields a set of row
+    indices, which are then combined with set operations.
+
+    :type expression: str
+    :param expression: The filter expression.
+    """
+
+    FLAGS = ('remote', 'visa')
+    NUMERIC_FIELDS = ('salary',)
+    REGEX_TOKEN = re.compile(
+        r'\s*(?:(?P<paren>[()])|(?P<op>>=|<=|!=|>|<|=|~)|'
+        r'"(?P<quoted>[^"]*)"|\'(?P<single>[^\']*)\'|'
+        r'(?P<word>[^\s()<>=!~"\']+))')
+    TEXT_FIELDS = ('company', 'location')
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.tokens = self._tokenize(expression)
+        self.position = 0
+        self.tree = self._parse_or()
+        if self.position != len(self.tokens):
+            raise InvalidWhereExpression(
+                'Unexpected {0}'.format(self.tokens[self.position][1]))
+
+    def _tokenize(self, expression):
+        """Split the expression into (kind, value) tokens.
+
+        :type expression: str
+        :param expression: The filter expression.
+
+        :rtype: list
+        :return: The tokens.
+
+        :raises: `InvalidWhereExpression` on unexpected characters.
+        """
+        tokens = []
+        position = 0
+        expression = expression.rstrip()
+        while position < len(expression):
+            match = self.REGEX_TOKEN.match(expression, position)
+            if match is None or match.end() == position:
+                raise InvalidWhereExpression(
+                    'Unexpected {0}'.format(expression[position:]))
+            position = match.end()
+            if match.group('quoted') is not None:
+                tokens.append(('value', match.group('quoted')))
+            elif match.group('single') is not None:
+                tokens.append(('value', match.group('single')))
+            else:
+                kind = match.lastgroup
+                tokens.append((kind, match.group(kind)))
+        return tokens
+
+    def _peek(self):
+        """Get the current token without consuming it."""
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return (None, None)
+
+    def _next(self):
+        """Consume and get the current token."""
+        token = self._peek()
+        if token[0] is None:
+            raise InvalidWhereExpression('Unexpected end of expression')
+        self.position += 1
+        return token
+
+    def _parse_or(self):
+        """Parse a disjunction, the lowest precedence."""
+        node = self._parse_and()
+        while self._peek() == ('word', 'or'):
+            self.position += 1
+            node = ('or', node, self._parse_and())
+        return node
+
+    def _parse_and(self):
+        """Parse a conjunction."""
+        node = self._parse_not()
+        while self._peek() == ('word', 'and'):
+            self.position += 1
+            node = ('and', node, self._parse_not())
+        return node
+
+    def _parse_not(self):
+        """Parse a negation."""
+        if self._peek() == ('word', 'not'):
+            self.position += 1
+            return ('not', self._parse_not())
+        return self._parse_term()
+
+    def _parse_term(self):
+        """Parse a parenthesized expression, a flag or a comparison."""
+        kind, value = self._next()
+        if (kind, value) == ('paren', '('):
+            node = self._parse_or()
+            if self._next() != ('paren', ')'):
+                raise InvalidWhereExpression('Expected )')
+            return node
+        if kind != 'word':
+            raise InvalidWhereExpression('Unexpected {0}'.format(value))
+        field = value.lower()
+        if field in self.FLAGS:
+            return ('flag', field)
+        if field not in self.NUMERIC_FIELDS + self.TEXT_FIELDS:
+            raise InvalidWhereExpression('Unknown field {0}'.format(value))
+        op_kind, op = self._next()
+        if op_kind != 'op':
+            raise InvalidWhereExpression(
+                'Expected a comparison after {0}'.format(value))
+        _, operand = self._next()
+        if field in self.NUMERIC_FIELDS:
+            if op == '~':
+                raise InvalidWhereExpression(
+                    '~ does not apply to {0}'.format(field))
+            return ('compare', field, op, self.parse_number(operand))
+        if op not in ('=', '!=', '~'):
+            raise InvalidWhereExpression(
+                '{0} does not apply to {1}'.format(op, field))
+        return ('text', field, op, operand.lower())
+
+    def parse_number(self, value):
+        """Parse a number such as 150k, 1.2m or 120,000.
+
+        :type value: str
+        :param value: The number.
+
+        :rtype: float
+        :return: The parsed number.
+
+        :raises: `InvalidWhereExpression` if value is not a number.
+        """
+        text = value.lower().replace(',', '').lstrip('$')
+        multiplier = 1
+        if text.endswith('k'):
+            multiplier, text = 1000, text[:-1]
+        elif text.endswith('m'):
+            multiplier, text = 1000000, text[:-1]
+        try:
+            return float(text) * multiplier
+        except ValueError:
+            raise InvalidWhereExpression('Expected a number, got ' + value)
+
+    def _evaluate(self, node, columns, rows):
+        """Evaluate a parse tree node to the set of matching rows."""
+        kind = node[0]
+        if kind == 'or':
+            return self._evaluate(node[1], columns, rows) | \
+                self._evaluate(node[2], columns, rows)
+        if kind == 'and':
+            return self._evaluate(node[1], columns, rows) & \
+                self._evaluate(node[2], columns, rows)
+        if kind == 'not':
+            return rows - self._evaluate(node[1], columns, rows)
+        if kind == 'flag':
+            return set(row for row, value in enumerate(columns[node[1]])
+                       if value)
+        if kind == 'compare':
+            return self._compare_salary(node[2], node[3], columns)
+        _, field, op, operand = node
+        values = [(value or '').lower() for value in columns[field]]
+        if op == '~':
+            return set(row for row, value in enumerate(values)
+                       if operand in value)
+        matches = set(row for row, value in enumerate(values)
+                      if value == operand)
+        return matches if op == '=' else rows - matches
+
+    def _compare_salary(self, op, number, columns):
+        """Get the rows whose salary range satisfies the comparison."""
+        matches = set()
+        for row, (low, high) in enumerate(zip(columns['salary_min'],
+                                              columns['salary_max'])):
+            if low is None:
+                continue
+            if (op == '>' and high > number) or \
+                    (op == '>=' and high >= number) or \
+                    (op == '<' and low < number) or \
+                    (op == '<=' and low <= number) or \
+                    (op == '=' and low <= number <= high) or \
+                    (op == '!=' and not low <= number <= high):
+                matches.add(row)
+        return matches
+
+    def filter(self, columns):
+        """Get the rows matching the expression.
+
+        :type columns: dict
+        :param columns: The column store, see :class:`HiringFacets`.
+
+        :rtype: list
+        :return: The matching row indices, in order.
+        """
+        rows = set(range(len(columns['company'])))
+        return sorted(self._evaluate(self.tree, columns, rows))
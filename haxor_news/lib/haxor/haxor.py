@@ -32,18 +32,26 @@ from __future__ import unicode_literals
 import datetime
 import json
 import sys
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, \
+    wait
 
 import requests
 
+from .. import stats
+from ..tracing import counter, span
 from .settings import supported_api_versions
 
 __all__ = [
+    'AdaptiveConcurrency',
     'User',
     'Item',
     'HackerNewsApi',
     'InvalidAPIVersion',
     'InvalidItemID',
-    'InvalidUserID']
+    'InvalidUserID',
+    'RequestHedger']
 
 
 class InvalidItemID(Exception):
@@ -59,31 +67,267 @@ class InvalidAPIVersion(Exception):
 
 
 class HTTPError(Exception):
-    pass
+
+    def __init__(self, status_code=None):
+        super(HTTPError, self).__init__(status_code)
+        self.status_code = status_code
+
+
+class AdaptiveConcurrency(object):
+    """
+    Limits the number of requests in flight with additive increase and
+    multiplicative decrease (AIMD).
+
+    The limit grows by about one request per round of `limit` requests that
+    answered without error, while at least half of the limit was in use and
+    the latency stayed within `LATENCY_TOLERANCE` times the fastest recent
+    latency.  A timeout, connection error, 429 or 5xx halves the limit, at
+    most once per round: requests sent before the last backoff do not back
+    off again.
+
+    Every change of the limit is kept in `history` and recorded as a
+    concurrency_limit trace counter, graphed by `hn --trace`.
+    """
+
+    BACKOFF = 0.5
+    BASELINE_DRIFT = 1.01
+    LATENCY_TOLERANCE = 2.0
+    OK = 'ok'
+    OVERLOADED = 'overloaded'
+    NEUTRAL = 'neutral'
+
+    def __init__(self, initial, minimum=1, maximum=32):
+        """
+        Args:
+            initial (int): the limit to start with.
+            minimum (int): the limit never backs off below it.
+            maximum (int): the limit never grows above it.
+
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = float(initial)
+        self.in_flight = 0
+        self.backoffs = 0
+        self.baseline = None
+        self.start = stats.timer()
+        self.last_backoff = self.start
+        # The (seconds since start, limit) of every change of the limit.
+        self.history = [(0.0, int(self.limit))]
+        counter('concurrency_limit', 'fetch', limit=int(self.limit))
+        self._condition = threading.Condition()
+
+    def acquire(self, cap=None):
+        """Waits until a request may be sent.
+
+        Args:
+            cap (int): caps the limit, such as the `max_workers` of a batch.
+
+        Returns:
+            `float` timer value the request was allowed at, passed to
+            `release`.
+        """
+        with self._condition:
+            while self.in_flight >= min(int(self.limit), cap or self.maximum):
+                self._condition.wait()
+            self.in_flight += 1
+            return stats.timer()
+
+    def release(self, start, outcome):
+        """Records the outcome of a request and adapts the limit.
+
+        Args:
+            start (float): the value returned by `acquire`.
+            outcome (string): `OK`, `OVERLOADED` or `NEUTRAL` for failures
+                that say nothing about the load, such as a 404.
+        """
+        now = stats.timer()
+        latency = now - start
+        with self._condition:
+            # Only grow a limit in use, a small batch says nothing about it.
+            saturated = self.in_flight * 2 >= self.limit
+            self.in_flight -= 1
+            self._condition.notify_all()
+            previous = int(self.limit)
+            if outcome == self.OK:
+                # Let the baseline rise slowly so it follows a slower link.
+                if self.baseline is None or \
+                        latency < self.baseline * self.BASELINE_DRIFT:
+                    self.baseline = latency
+                else:
+                    self.baseline *= self.BASELINE_DRIFT
+                if saturated and \
+                        latency <= self.baseline * self.LATENCY_TOLERANCE:
+                    self.limit = min(self.maximum,
+                                     self.limit + 1 / self.limit)
+            elif outcome == self.OVERLOADED and start >= self.last_backoff:
+                self.limit = max(self.minimum, self.limit * self.BACKOFF)
+                self.last_backoff = now
+                self.backoffs += 1
+                stats.count('concurrency_backoffs')
+            if int(self.limit) != previous:
+                self.history.append((now - self.start, int(self.limit)))
+                counter('concurrency_limit', 'fetch', limit=int(self.limit))
+
+    @classmethod
+    def get_outcome(cls, error):
+        """Classifies a request error.
+
+        Args:
+            error (Exception): the error raised by the request, or None.
+
+        Returns:
+            `OVERLOADED` for timeouts, connection errors, 429 and 5xx,
+            `NEUTRAL` for other errors and `OK` if there was none.
+        """
+        if error is None:
+            return cls.OK
+        if isinstance(error, (requests.exceptions.Timeout,
+                              requests.exceptions.ConnectionError)):
+            return cls.OVERLOADED
+        if isinstance(error, HTTPError) and error.status_code is not None \
+                and (error.status_code == 429 or error.status_code >= 500):
+            return cls.OVERLOADED
+        return cls.NEUTRAL
+
+
+class RequestHedger(object):
+    """
+    Decides when to hedge a request: send a duplicate if the first one has
+    not answered within the `PERCENTILE` of the latencies seen recently.
+
+    Hedges are capped at `BUDGET` of the requests, so they add at most a few
+    percent of traffic even when the API slows down as a whole.
+    """
+
+    BUDGET = 0.05
+    MIN_SAMPLES = 20
+    PERCENTILE = 0.95
+    WINDOW = 256
+
+    def __init__(self, percentile=PERCENTILE, budget=BUDGET):
+        """
+        Args:
+            percentile (float): the latency percentile a request may take
+                before it is hedged.
+            budget (float): the maximum number of hedges per request.
+
+        """
+        self.percentile = percentile
+        self.budget = budget
+        self.requests = 0
+        self.hedges = 0
+        self.latencies = deque(maxlen=self.WINDOW)
+        self._lock = threading.Lock()
+
+    def get_delay(self):
+        """Counts a request and gets the time to wait before hedging it.
+
+        Returns:
+            `float` seconds, or None while too few latencies were seen.
+        """
+        with self._lock:
+            self.requests += 1
+            if len(self.latencies) < self.MIN_SAMPLES:
+                return None
+            latencies = sorted(self.latencies)
+        return latencies[int(self.percentile * (len(latencies) - 1))]
+
+    def record(self, latency):
+        """Records the latency of a successful request.
+
+        Args:
+            latency (float): the seconds the request took.
+        """
+        with self._lock:
+            self.latencies.append(latency)
+
+    def try_hedge(self):
+        """Takes a hedge from the budget.
+
+        Returns:
+            `bool` True if the request may be hedged.
+        """
+        with self._lock:
+            if self.hedges + 1 > self.budget * self.requests:
+                return False
+            self.hedges += 1
+            return True
+
+
+def submit_daemon(function, *args):
+    """Calls a function in a new daemon thread.
+
+    Unlike the workers of a `ThreadPoolExecutor`, which are joined when the
+    interpreter exits, a daemon thread left running does not delay the exit.
+
+    Args:
+        function (callable): the function to call.
+        args (tuple): the function arguments.
+
+    Returns:
+        `concurrent.futures.Future` of the function result.
+    """
+    future = Future()
+
+    def run():
+        try:
+            result = function(*args)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    thread = threading.Thread(target=run)
+    thread.daemon = True
+    thread.start()
+    return future
 
 
 class HackerNewsApi(object):
 
-    def __init__(self, version='v0'):
+    CONNECT_TIMEOUT = 5
+    HEDGE_READ_TIMEOUT = 2
+    MAX_CONCURRENCY = 32
+    MAX_WORKERS = 8
+    READ_TIMEOUT = 15
+
+    def __init__(self, version='v0', base_url=None):
         """
         Args:
             version (string): specifies Hacker News API version. Default is `v0`.
+            base_url (string): overrides the url of the API version, such as
+                the url of a local stand-in server.
 
         Raises:
           InvalidAPIVersion: If Hacker News version is not supported.
 
         """
         self.session = requests.Session()
+        # Batch fetches start at MAX_WORKERS requests in flight and adapt.
+        self.concurrency = AdaptiveConcurrency(
+            self.MAX_WORKERS, maximum=self.MAX_CONCURRENCY)
+        # Size the connection pool for the largest concurrency limit, with
+        # room for hedged requests.
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=2 * self.MAX_CONCURRENCY)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         try:
             self.base_url = supported_api_versions[version]
         except KeyError:
             raise InvalidAPIVersion
+        if base_url is not None:
+            self.base_url = base_url
+        self.hedger = None
 
-    def _get(self, url):
+    def _get(self, url, timeout=None):
         """Internal method used for GET requests
 
         Args:
             url (string): URL to send GET.
+            timeout (tuple): the connect and read timeouts in seconds.
+                Default is `CONNECT_TIMEOUT` and `READ_TIMEOUT`.
 
         Returns:
             requests' response object
@@ -92,17 +336,82 @@ class HackerNewsApi(object):
           HTTPError: If HTTP request failed.
 
         """
-        response = self.session.get(url)
-        if response.status_code == requests.codes.ok:
+        # The endpoint of item/8863.json is item.
+        endpoint = url[len(self.base_url):].split('/')[0].split('.')[0]
+        with span('GET', 'http', url=url) as request_span:
+            start = stats.timer()
+            try:
+                response = self.session.get(
+                    url, timeout=timeout or (self.CONNECT_TIMEOUT,
+                                             self.READ_TIMEOUT))
+            except requests.exceptions.RequestException as e:
+                stats.record_request(url, stats.timer() - start, 0, endpoint,
+                                     stats.request_error(e))
+                raise
+            request_span.set(status=response.status_code)
+        ok = response.status_code == requests.codes.ok
+        stats.record_request(
+            url, stats.timer() - start, len(response.content), endpoint,
+            None if ok else 'http_{0}'.format(response.status_code))
+        if ok:
             return response
         else:
-            raise HTTPError
+            raise HTTPError(response.status_code)
+
+    def _get_hedged(self, page, param):
+        """Internal method used for GET requests hedged by `hedger`
+
+        The request is sent from a daemon thread.  If it has not answered
+        within the delay learned by `hedger`, a duplicate is sent with a
+        read timeout of `HEDGE_READ_TIMEOUT` and the first successful
+        response is returned.  The other request is left to finish in its
+        thread, which does not hold up the exit of the process.
+
+        Args:
+            page (string): the page, such as item.
+            param (int or string): the page parameter, such as an item id.
+
+        Returns:
+            requests' response object
+
+        Raises:
+          HTTPError: If every HTTP request sent failed.
+
+        """
+        def get(timeout=None):
+            start = stats.timer()
+            response = self._get_page_param(page, param, timeout)
+            self.hedger.record(stats.timer() - start)
+            return response
+
+        delay = self.hedger.get_delay()
+        if delay is None:
+            return get()
+        primary = submit_daemon(get)
+        if wait([primary], timeout=delay).done or \
+                not self.hedger.try_hedge():
+            return primary.result()
+        stats.count('hedged_requests')
+        hedge = submit_daemon(
+            get, (self.CONNECT_TIMEOUT, self.HEDGE_READ_TIMEOUT))
+        pending = set([primary, hedge])
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        stats.count('hedge_wins')
+                    return future.result()
+            if not pending:
+                # Both failed, raise the error of the first request.
+                return primary.result()
 
     def _get_page(self, page):
         return self._get('{0}{1}.json'.format(self.base_url, page))
 
-    def _get_page_param(self, page, param):
-        return self._get('{0}{1}/{2}.json'.format(self.base_url, page, param))
+    def _get_page_param(self, page, param, timeout=None):
+        return self._get('{0}{1}/{2}.json'.format(self.base_url, page, param),
+                         timeout)
 
     def get_item(self, item_id):
         """Returns Hacker News `Item` object.
@@ -117,14 +426,73 @@ class HackerNewsApi(object):
           InvalidItemID: If corresponding Hacker News story does not exist.
 
         """
-
-        response = self._get_page_param('item', item_id).json()
+        with span('get_item', 'fetch', item_id=item_id):
+            if self.hedger is None:
+                response = self._get_page_param('item', item_id)
+            else:
+                response = self._get_hedged('item', item_id)
+            with span('json decode', 'parse'):
+                response = response.json()
 
         if not response:
             raise InvalidItemID
 
         return Item(response)
 
+    def enable_hedging(self, hedger=None):
+        """Hedges the requests of `get_item` to cut its tail latency.
+
+        Args:
+            hedger (RequestHedger): decides when to hedge.  Default is a
+                `RequestHedger` with the default percentile and budget.
+
+        """
+        self.hedger = hedger or RequestHedger()
+
+    def get_items(self, item_ids, max_workers=None):
+        """Returns Hacker News `Item` objects, fetched concurrently.
+
+        The number of requests in flight adapts to the latency and errors of
+        the API, see `AdaptiveConcurrency`.
+
+        Args:
+            item_ids (list): Unique item ids of Hacker News stories, comments etc.
+            max_workers (int): The maximum number of concurrent requests.
+                Default is the adaptive limit of `concurrency`.
+
+        Returns:
+            `list` of `Item` objects in the order of `item_ids`.  Items that
+            do not exist or failed to fetch are left out.
+
+        """
+        item_ids = list(item_ids)
+        if not item_ids:
+            return []
+        max_workers = min(max_workers or self.concurrency.maximum,
+                          len(item_ids))
+
+        def get_item_or_none(item_id):
+            start = self.concurrency.acquire(max_workers)
+            error = None
+            try:
+                return self.get_item(item_id)
+            except InvalidItemID:
+                return None
+            except (HTTPError, requests.exceptions.RequestException) as e:
+                error = e
+                return None
+            finally:
+                self.concurrency.release(
+                    start, AdaptiveConcurrency.get_outcome(error))
+
+        with span('get_items', 'fetch', count=len(item_ids)) as items_span, \
+                ThreadPoolExecutor(max_workers=max_workers) as executor:
+            items = list(executor.map(get_item_or_none, item_ids))
+            limit = int(self.concurrency.limit)
+            items_span.set(concurrency_limit=limit)
+        stats.observe('concurrency_limit', limit)
+        return [item for item in items if item is not None]
+
     def get_user(self, user_id):
         """Returns Hacker News `User` object.
 
@@ -138,7 +506,8 @@ class HackerNewsApi(object):
           InvalidUserID: If no such user exists on Hacker News.
 
         """
-        response = self._get_page_param('user', user_id).json()
+        with span('get_user', 'fetch', user_id=user_id):
+            response = self._get_page_param('user', user_id).json()
 
         if not response:
             raise InvalidUserID
@@ -19,4 +19,10 @@
 # IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
 # CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
-supported_api_versions = {'v0': 'https://hacker-news.firebaseio.com/v0/' }
+import os
+
+# HAXOR_API_URL points v0 at another server, such as haxor_news.api_server.
+supported_api_versions = {
+    'v0': os.environ.get('HAXOR_API_URL',
+                         'https://hacker-news.firebaseio.com/v0/'),
+}
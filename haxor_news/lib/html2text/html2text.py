@@ -15,8 +15,7 @@ except NameError:
     setattr(__builtins__, 'False', 0)
 
 def has_key(x, y):
-    if hasattr(x, 'has_key'): return x.has_key(y)
-    else: return y in x
+    return y in x
 
 try:
     import htmlentitydefs
@@ -35,6 +34,9 @@ import optparse, re, sys, codecs, types
 try: from textwrap import wrap
 except: pass
 
+try: from lxml import etree as lxml_etree
+except ImportError: lxml_etree = None
+
 # Use Unicode characters instead of their ascii psuedo-replacements
 UNICODE_SNOB = 0
 
@@ -61,6 +63,10 @@ IGNORE_ANCHORS = False
 IGNORE_IMAGES = False
 IGNORE_EMPHASIS = False
 
+# Tokenize with 'lxml' (C, optional) or 'html.parser' (the standard library).
+# 'auto' picks lxml when it is installed.  Both give the same output.
+TOKENIZER = 'auto'
+
 ### Entity Nonsense ###
 
 def name2cp(k):
@@ -178,6 +184,95 @@ def list_numbering_start(attrs):
     else:
         return 0
 
+def resolve_tokenizer(name):
+    """return the tokenizer a TOKENIZER setting stands for"""
+    if name == 'auto':
+        if lxml_etree is None: return 'html.parser'
+        return 'lxml'
+    if name == 'lxml' and lxml_etree is None:
+        raise ImportError('The lxml tokenizer needs lxml installed')
+    if name not in ('lxml', 'html.parser'):
+        raise ValueError('Unknown tokenizer: ' + name)
+    return name
+
+def unescape_attribute(value):
+    """decode the character references of an attribute value"""
+    if hasattr(HTMLParser, 'unescape'): # Python 3.4+
+        return HTMLParser.unescape(value)
+    return HTMLParser.HTMLParser().unescape(value)
+
+class LxmlTokenizer(object):
+    """Tokenize HTML with lxml's C parser for an HTMLParser handler.
+
+    Reports the same handle_* calls as HTMLParser.  lxml decodes character
+    references itself, so they are masked before parsing and reported
+    through handle_charref and handle_entityref, which html2text relies on
+    to pick ascii replacements.  lxml holds back the text at the end of a
+    chunk until the next feed() or close(), as HTML2Text.feed() does for
+    HTMLParser.
+    """
+    cdata_tags = ('script', 'style')
+    reference = re.compile(r'&(#[0-9]+|#[xX][0-9a-fA-F]+|[a-zA-Z][-.a-zA-Z0-9]*)(;?)')
+    partial_reference = re.compile(r'&#?[-.a-zA-Z0-9]*$')
+    masked_reference = re.compile(u'\ue000([^\ue001]*)\ue001')
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.cdata = 0
+        self.pending = ''
+        self.parser = lxml_etree.HTMLParser(target=self, recover=True)
+
+    def mask(self, data):
+        return self.reference.sub(u'\ue000\\1\\2\ue001', data)
+
+    def unmask(self, data):
+        return self.masked_reference.sub(r'&\1', data)
+
+    def feed(self, data):
+        data = self.pending + data
+        # Hold back a reference cut by the end of the chunk.
+        match = self.partial_reference.search(data)
+        if match is None:
+            self.pending = ''
+        else:
+            self.pending = data[match.start():]
+            data = data[:match.start()]
+        if data: self.parser.feed(self.mask(data))
+
+    def close(self):
+        if self.pending: self.parser.feed(self.mask(self.pending))
+        self.pending = ''
+        try: self.parser.close()
+        except lxml_etree.XMLSyntaxError: pass # an empty document
+
+    # lxml parser target interface
+
+    def start(self, tag, attrib):
+        attrs = [(name, unescape_attribute(self.unmask(value)))
+                 for name, value in attrib.items()]
+        self.handler.handle_starttag(tag, attrs)
+        if tag in self.cdata_tags: self.cdata += 1
+
+    def end(self, tag):
+        if tag in self.cdata_tags and self.cdata: self.cdata -= 1
+        self.handler.handle_endtag(tag)
+
+    def data(self, data):
+        if self.cdata:
+            self.handler.handle_data(self.unmask(data))
+            return
+        index = 0
+        for match in self.masked_reference.finditer(data):
+            if match.start() > index:
+                self.handler.handle_data(data[index:match.start()])
+            name = match.group(1).rstrip(';')
+            if name.startswith('#'): self.handler.handle_charref(name[1:])
+            else: self.handler.handle_entityref(name)
+            index = match.end()
+        if index < len(data): self.handler.handle_data(data[index:])
+
+    def comment(self, text): pass
+
 class HTML2Text(HTMLParser.HTMLParser):
     def __init__(self, out=None, baseurl=''):
         try:
@@ -196,6 +291,9 @@ class HTML2Text(HTMLParser.HTMLParser):
         self.ignore_links = IGNORE_ANCHORS
         self.ignore_images = IGNORE_IMAGES
         self.ignore_emphasis = IGNORE_EMPHASIS
+        self.tokenizer = TOKENIZER
+        self.lxml_tokenizer = None  # created on the first feed()
+        self.pending = ''  # text held back until the next tag boundary
         self.google_doc = False
         self.ul_item_mark = '*'
         self.emphasis_mark = '_'
@@ -219,6 +317,7 @@ class HTML2Text(HTMLParser.HTMLParser):
         self.start = 1
         self.space = 0
         self.a = []
+        self.a_index = {}  # maps link_key() to the link's index in self.a
         self.astack = []
         self.maybe_automatic_link = None
         self.absolute_url_matcher = re.compile(r'^[a-zA-Z+]+://')
@@ -249,7 +348,20 @@ class HTML2Text(HTMLParser.HTMLParser):
 
     def feed(self, data):
         data = data.replace("</' + 'script>", "</ignore>")
-        HTMLParser.HTMLParser.feed(self, data)
+        if self.lxml_tokenizer is None and \
+                resolve_tokenizer(self.tokenizer) == 'lxml':
+            self.lxml_tokenizer = LxmlTokenizer(self)
+        if self.lxml_tokenizer is None:
+            # HTMLParser reports the text at the end of a chunk right away,
+            # so a text node cut by a chunk boundary would be handled in
+            # two parts.  Hold it back until the next tag, as lxml does.
+            data = self.pending + data
+            end = data.rfind('<')
+            if end == -1: end = 0
+            self.pending = data[end:]
+            if end: HTMLParser.HTMLParser.feed(self, data[:end])
+        else:
+            self.lxml_tokenizer.feed(data)
 
     def handle(self, data):
         self.feed(data)
@@ -261,19 +373,40 @@ class HTML2Text(HTMLParser.HTMLParser):
         if s: self.lastWasNL = s[-1] == '\n'
 
     def close(self):
-        HTMLParser.HTMLParser.close(self)
+        if self.lxml_tokenizer is None:
+            if self.pending: HTMLParser.HTMLParser.feed(self, self.pending)
+            self.pending = ''
+            HTMLParser.HTMLParser.close(self)
+        else:
+            self.lxml_tokenizer.close()
 
         self.pbr()
         self.o('', 0, 'end')
 
         self.outtext = self.outtext.join(self.outtextlist)
+        self.outtext = self.replace_nbsp(self.outtext)
+
+        return self.outtext
+
+    def flush(self):
+        """Return the complete lines output since the last flush.
+
+        Lets a caller feed() a document in chunks and consume the text as it
+        is produced.  The text is not wrapped, and the incomplete last line
+        stays buffered until the next flush() or close(), as does the text
+        after the last tag fed.
+        """
+        text = ''.join(self.outtextlist)
+        end = text.rfind('\n') + 1
+        self.outtextlist = [text[end:]]
+        return self.replace_nbsp(text[:end])
+
+    def replace_nbsp(self, text):
         if self.unicode_snob:
             nbsp = unichr(name2cp('nbsp'))
         else:
             nbsp = u' '
-        self.outtext = self.outtext.replace(u'&nbsp_place_holder;', nbsp)
-
-        return self.outtext
+        return text.replace(u'&nbsp_place_holder;', nbsp)
 
     def handle_charref(self, c):
         self.o(self.charref(c), 1)
@@ -294,21 +427,12 @@ class HTML2Text(HTMLParser.HTMLParser):
             If the set of attributes is not found, returns None
         """
         if not has_key(attrs, 'href'): return None
+        return self.a_index.get(link_key(attrs))
 
-        i = -1
-        for a in self.a:
-            i += 1
-            match = 0
-
-            if has_key(a, 'href') and a['href'] == attrs['href']:
-                if has_key(a, 'title') or has_key(attrs, 'title'):
-                        if (has_key(a, 'title') and has_key(attrs, 'title') and
-                            a['title'] == attrs['title']):
-                            match = True
-                else:
-                    match = True
-
-            if match: return i
+    def append_link(self, attrs):
+        """ adds a link to the self.a list, indexing it for previousIndex """
+        self.a_index.setdefault(link_key(attrs), len(self.a))
+        self.a.append(attrs)
 
     def drop_last(self, nLetters):
         if not self.quiet:
@@ -493,7 +617,7 @@ class HTML2Text(HTMLParser.HTMLParser):
                                 self.acount += 1
                                 a['count'] = self.acount
                                 a['outcount'] = self.outcount
-                                self.a.append(a)
+                                self.append_link(a)
                             self.o("][" + str(a['count']) + "]")
 
         if tag == "img" and start and not self.ignore_images:
@@ -512,7 +636,7 @@ class HTML2Text(HTMLParser.HTMLParser):
                         self.acount += 1
                         attrs['count'] = self.acount
                         attrs['outcount'] = self.outcount
-                        self.a.append(attrs)
+                        self.append_link(attrs)
                     self.o("[" + str(attrs['count']) + "]")
 
         if tag == 'dl' and start: self.p()
@@ -589,7 +713,7 @@ class HTML2Text(HTMLParser.HTMLParser):
                     self.drop_white_space = 0
 
             if puredata and not self.pre:
-                data = re.sub('\s+', ' ', data)
+                data = whitespace_matcher.sub(' ', data)
                 if data and data[0] == ' ':
                     self.space = 1
                     data = data[1:]
@@ -650,7 +774,10 @@ class HTML2Text(HTMLParser.HTMLParser):
 
                 if self.a != newa: self.out("\n") # Don't need an extra line when nothing was done.
 
-                self.a = newa
+                self.a = []
+                self.a_index = {}
+                for link in newa:
+                    self.append_link(link)
 
             if self.abbr_list and force == "end":
                 for abbr, definition in self.abbr_list.items():
@@ -687,7 +814,7 @@ class HTML2Text(HTMLParser.HTMLParser):
         else:
             c = int(name)
 
-        if not self.unicode_snob and c in unifiable_n.keys():
+        if not self.unicode_snob and c in unifiable_n:
             return unifiable_n[c]
         else:
             try:
@@ -696,7 +823,7 @@ class HTML2Text(HTMLParser.HTMLParser):
                 return chr(c)
 
     def entityref(self, c):
-        if not self.unicode_snob and c in unifiable.keys():
+        if not self.unicode_snob and c in unifiable:
             return unifiable[c]
         else:
             try: name2cp(c)
@@ -731,28 +858,31 @@ class HTML2Text(HTMLParser.HTMLParser):
             return text
 
         assert wrap, "Requires Python 2.3."
-        result = ''
+        # Collect the pieces and join them once, repeated concatenation is
+        # quadratic on large documents.
+        result = []
         newlines = 0
         for para in text.split("\n"):
             if len(para) > 0:
                 if not skipwrap(para):
-                    result += "\n".join(wrap(para, self.body_width))
+                    result.append("\n".join(wrap(para, self.body_width)))
                     if para.endswith('  '):
-                        result += "  \n"
+                        result.append("  \n")
                         newlines = 1
                     else:
-                        result += "\n\n"
+                        result.append("\n\n")
                         newlines = 2
                 else:
                     if not onlywhite(para):
-                        result += para + "\n"
+                        result.append(para + "\n")
                         newlines = 1
             else:
                 if newlines < 2:
-                    result += "\n"
+                    result.append("\n")
                     newlines += 1
-        return result
+        return ''.join(result)
 
+whitespace_matcher = re.compile(r'\s+')
 ordered_list_matcher = re.compile(r'\d+\.\s')
 unordered_list_matcher = re.compile(r'[-\*\+]\s')
 md_chars_matcher = re.compile(r"([\\\[\]\(\)])")
@@ -783,6 +913,14 @@ md_backslash_matcher = re.compile(r'''
     ''' % re.escape(slash_chars),
     flags=re.VERBOSE)
 
+def link_key(attrs):
+    """returns the key under which HTML2Text.previousIndex finds a link
+
+    Links match if their hrefs match and either neither has a title or both
+    have the same title.
+    """
+    return (attrs['href'], has_key(attrs, 'title'), attrs.get('title'))
+
 def skipwrap(para):
     # If the text begins with four spaces or one tab, it's a code block; don't wrap
     if para[0:4] == '    ' or para[0] == '\t':
@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""Export the `stats` registry as a metrics textfile for node-exporter.
+
+The file is read back and added to on every run, so the counters and
+histograms are cumulative across cron runs.  Concurrent runs take turns
+through an exclusive lock on <path>.lock, which the textfile collector
+ignores:
+
+    hn --metrics /var/lib/node_exporter/textfile/hn.prom top
+"""
+
+from __future__ import print_function
+from __future__ import division
+
+import contextlib
+import io
+import os
+import re
+import time
+try:
+    import fcntl
+except ImportError:
+    # Windows has no fcntl, concurrent runs may lose updates there.
+    fcntl = None
+
+from ..compat import replace_file
+from .stats import Stats
+
+
+class MetricsFile(object):
+    """Cumulative metrics in the Prometheus text exposition format.
+
+    Samples are keyed by metric name and label string, such as
+    ('hn_requests_total', 'endpoint="item"').  Counters and histograms are
+    summed across runs, the cache hit ratios and the last run timestamp are
+    derived on every write.
+
+    :type COMMENT_TREE_BUCKETS: tuple (const)
+    :param COMMENT_TREE_BUCKETS: The upper bounds of the comment tree size
+        histogram buckets.
+
+    :type HELP: dict (const)
+    :param HELP: Maps a metric family to its type and help text.
+
+    :type LATENCY_BUCKETS: tuple (const)
+    :param LATENCY_BUCKETS: The upper bounds in seconds of the request
+        latency histogram buckets.
+
+    :type REGEX_LE: :class:`re.RegexObject` (const)
+    :param REGEX_LE: Matches the le label of a histogram bucket.
+
+    :type REGEX_SAMPLE: :class:`re.RegexObject` (const)
+    :param REGEX_SAMPLE: Matches a sample line.
+
+    :type samples: dict
+    :param samples: Maps a (name, labels) tuple to the sample value.
+    """
+
+    COMMENT_TREE_BUCKETS = (10, 50, 100, 250, 500, 1000, 2500, 5000)
+    HELP = {
+        'hn_bytes_downloaded': ('counter', 'Response body bytes downloaded.'),
+        'hn_cache_hit_ratio': ('gauge', 'Cache hits over cache lookups.'),
+        'hn_cache_lookups': ('counter', 'Cache lookups by result.'),
+        'hn_charset_detections': (
+            'counter', 'Article encodings found by detection path.'),
+        'hn_comment_tree_size': (
+            'histogram', 'Comments printed per viewed comment tree.'),
+        'hn_concurrency_backoffs': (
+            'counter', 'Cuts of the batch fetch concurrency limit.'),
+        'hn_concurrency_limit': (
+            'gauge', 'Batch fetch concurrency limit after the last batch.'),
+        'hn_hedge_wins': (
+            'counter', 'Hedged requests answering before the first one.'),
+        'hn_hedged_requests': (
+            'counter', 'Item requests duplicated after a slow answer.'),
+        'hn_last_run_timestamp_seconds': (
+            'gauge', 'When the metrics were last written.'),
+        'hn_request_duration_seconds': (
+            'histogram', 'Request latency by endpoint.'),
+        'hn_request_errors': ('counter', 'Failed requests by error type.'),
+        'hn_runs': ('counter', 'Commands run.'),
+    }
+    LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+    REGEX_LE = re.compile(r',?le="([^"]*)"')
+    REGEX_SAMPLE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)'
+                              r'(?:\{(.*)\})?\s+(\S+)')
+
+    def __init__(self):
+        self.samples = {}
+
+    @classmethod
+    def load(cls, path):
+        """Load the samples of a metrics file written before.
+
+        :type path: str
+        :param path: The metrics file path.
+
+        :rtype: :class:`MetricsFile`
+        :return: The metrics, empty if the file is missing or unreadable.
+        """
+        metrics = cls()
+        try:
+            with io.open(path, encoding='utf-8') as metrics_file:
+                lines = metrics_file.readlines()
+        except (IOError, OSError):
+            return metrics
+        for line in lines:
+            match = cls.REGEX_SAMPLE.match(line)
+            if line.startswith('#') or match is None:
+                continue
+            name, labels, value = match.groups()
+            try:
+                metrics.samples[(name, labels or '')] = float(value)
+            except ValueError:
+                continue
+        return metrics
+
+    def add(self, name, labels, value):
+        """Add to a sample.
+
+        :type name: str
+        :param name: The sample name.
+
+        :type labels: str
+        :param labels: The label string, such as endpoint="item".
+
+        :type value: float
+        :param value: The value added.
+        """
+        key = (name, labels)
+        self.samples[key] = self.samples.get(key, 0) + value
+
+    def add_histogram(self, name, labels, buckets, values):
+        """Add observed values to a histogram.
+
+        :type name: str
+        :param name: The histogram family name.
+
+        :type labels: str
+        :param labels: The label string, or '' for none.
+
+        :type buckets: tuple
+        :param buckets: The bucket upper bounds.
+
+        :type values: list
+        :param values: The observed values.
+        """
+        prefix = labels + ',' if labels else ''
+        for bound in buckets:
+            self.add(name + '_bucket', '{0}le="{1}"'.format(prefix, bound),
+                     sum(1 for value in values if value <= bound))
+        self.add(name + '_bucket', prefix + 'le="+Inf"', len(values))
+        self.add(name + '_sum', labels, sum(values))
+        self.add(name + '_count', labels, len(values))
+
+    def add_stats(self, registry, command):
+        """Add the stats of a command run.
+
+        :type registry: :class:`stats.Stats`
+        :param registry: The stats of the run.
+
+        :type command: str
+        :param command: The command name, such as top.
+        """
+        self.add('hn_runs_total', 'command="{0}"'.format(command), 1)
+        self.add('hn_bytes_downloaded_total', '', registry.get('bytes'))
+        for endpoint, latencies in registry.latencies.items():
+            self.add_histogram('hn_request_duration_seconds',
+                               'endpoint="{0}"'.format(endpoint),
+                               self.LATENCY_BUCKETS, latencies)
+        for error, count in registry.errors.items():
+            self.add('hn_request_errors_total', 'type="{0}"'.format(error),
+                     count)
+        for cache in registry.CACHES:
+            for result in ('hit', 'miss'):
+                count = registry.get('{0}_cache_{1}'.format(
+                    cache, 'hits' if result == 'hit' else 'misses'))
+                self.add('hn_cache_lookups_total',
+                         'cache="{0}",result="{1}"'.format(cache, result),
+                         count)
+        for name, count in registry.counters.items():
+            if name.startswith('charset_'):
+                self.add('hn_charset_detections_total',
+                         'path="{0}"'.format(name[len('charset_'):]), count)
+        self.add_histogram('hn_comment_tree_size', '',
+                           self.COMMENT_TREE_BUCKETS,
+                           registry.observations.get('comment_tree_size', []))
+        self.add('hn_concurrency_backoffs_total', '',
+                 registry.get('concurrency_backoffs'))
+        self.add('hn_hedged_requests_total', '',
+                 registry.get('hedged_requests'))
+        self.add('hn_hedge_wins_total', '', registry.get('hedge_wins'))
+        limits = registry.observations.get('concurrency_limit')
+        if limits:
+            self.samples[('hn_concurrency_limit', '')] = limits[-1]
+
+    def derive(self, now=None):
+        """Update the cache hit ratios and the last run timestamp.
+
+        :type now: float
+        :param now: The epoch timestamp of the run, defaults to now.
+        """
+        for cache in Stats.CACHES:
+            hits = self.samples.get(
+                ('hn_cache_lookups_total',
+                 'cache="{0}",result="hit"'.format(cache)), 0)
+            misses = self.samples.get(
+                ('hn_cache_lookups_total',
+                 'cache="{0}",result="miss"'.format(cache)), 0)
+            if hits + misses:
+                self.samples[('hn_cache_hit_ratio',
+                              'cache="{0}"'.format(cache))] = \
+                    hits / (hits + misses)
+        self.samples[('hn_last_run_timestamp_seconds', '')] = \
+            now if now is not None else time.time()
+
+    def format(self):
+        """Format the samples, grouped by metric family.
+
+        :rtype: str
+        :return: The metrics text.
+        """
+        lines = []
+        for family in sorted(self.HELP):
+            metric_type, help_text = self.HELP[family]
+            keys = sorted((key for key in self.samples
+                           if self.get_family(key[0]) == family),
+                          key=self.get_sort_key)
+            if not keys:
+                continue
+            # The Prometheus text format names counters with their suffix.
+            name = family + '_total' if metric_type == 'counter' else family
+            lines.append('# HELP {0} {1}'.format(name, help_text))
+            lines.append('# TYPE {0} {1}'.format(name, metric_type))
+            for sample_name, labels in keys:
+                value = self.samples[(sample_name, labels)]
+                if value == int(value):
+                    value = int(value)
+                lines.append('{0}{1} {2}'.format(
+                    sample_name, '{' + labels + '}' if labels else '',
+                    value))
+        return '\n'.join(lines) + '\n'
+
+    def get_family(self, name):
+        """Get the metric family of a sample.
+
+        :type name: str
+        :param name: The sample name, such as hn_runs_total.
+
+        :rtype: str
+        :return: The family, a key of HELP, or None if unknown.
+        """
+        for suffix in ('_total', '_bucket', '_count', '_sum', ''):
+            family = name[:len(name) - len(suffix)]
+            if name.endswith(suffix) and family in self.HELP:
+                return family
+        return None
+
+    def get_sort_key(self, key):
+        """Order the samples of a family by labels, then histogram buckets
+        by bound followed by the sum and count.
+
+        :type key: tuple
+        :param key: The (name, labels) sample key.
+
+        :rtype: tuple
+        :return: The sort key.
+        """
+        name, labels = key
+        match = self.REGEX_LE.search(labels)
+        bound = float(match.group(1)) if match else float('inf')
+        order = ('_bucket', '_sum', '_count').index(name[name.rfind('_'):]) \
+            if name.endswith(('_bucket', '_sum', '_count')) else 0
+        return self.REGEX_LE.sub('', labels), order, bound
+
+    def save(self, path):
+        """Write the metrics file atomically.
+
+        The textfile collector may read the file at any time, so it is
+        written to a temporary file in the same directory and renamed.
+
+        :type path: str
+        :param path: The metrics file path.
+        """
+        temp_path = '{0}.{1}.tmp'.format(path, os.getpid())
+        with io.open(temp_path, 'w', encoding='utf-8') as metrics_file:
+            metrics_file.write(self.format())
+        replace_file(temp_path, path)
+
+
+@contextlib.contextmanager
+def lock_metrics(path):
+    """Hold an exclusive lock on a metrics file while updating it.
+
+    The lock is taken on a separate <path>.lock file, since the metrics file
+    itself is replaced on every write.
+
+    :type path: str
+    :param path: The metrics file path.
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(path + '.lock', 'a') as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def write_metrics(path, registry, command):
+    """Add the stats of a command run to a metrics file.
+
+    The whole read, add and write runs under `lock_metrics`, so the counters
+    of concurrent runs are all kept.
+
+    :type path: str
+    :param path: The metrics file path.
+
+    :type registry: :class:`stats.Stats`
+    :param registry: The stats of the run.
+
+    :type command: str
+    :param command: The command name, such as top.
+    """
+    with lock_metrics(path):
+        metrics = MetricsFile.load(path)
+        metrics.add_stats(registry, command)
+        metrics.derive()
+        metrics.save(path)
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""Profile a single command with cProfile or tracemalloc.
+
+    hn --profile cpu view 3 -c
+    python -m pstats hn-view.pstats
+    hn --profile mem --profile_file view.txt view 3 -c
+"""
+
+from __future__ import print_function
+from __future__ import division
+
+import cProfile
+import io
+import linecache
+try:
+    import tracemalloc
+except ImportError:
+    # Python 2 has no tracemalloc.
+    tracemalloc = None
+
+from ..compat import replace_file
+
+
+class CommandProfiler(object):
+    """Profile the CPU time or the allocations of a command.
+
+    The CPU profile only covers the thread that started it, work done in
+    the thread pools of the batch fetches shows up as waits.
+
+    :type kind: str
+    :param kind: cpu or mem, a key of KINDS.
+
+    :type KINDS: dict (const)
+    :param KINDS: Maps a profile kind to the extension of its file.
+
+    :type path: str
+    :param path: The file the profile is written to.
+
+    :type TOP_ALLOCATIONS: int (const)
+    :param TOP_ALLOCATIONS: The number of lines listed by the memory report.
+    """
+
+    KINDS = {
+        'cpu': '.pstats',
+        'mem': '.mem.txt',
+    }
+    TOP_ALLOCATIONS = 25
+
+    def __init__(self, kind, path):
+        if kind == 'mem' and tracemalloc is None:
+            raise ValueError('Memory profiles need Python 3.4 or later')
+        self.kind = kind
+        self.path = path
+        self._profile = None
+        self._running = False
+
+    @classmethod
+    def get_default_path(cls, kind, command):
+        """Get the default profile file name of a command.
+
+        :type kind: str
+        :param kind: cpu or mem.
+
+        :type command: str
+        :param command: The command name, such as view.
+
+        :rtype: str
+        :return: hn-<command> with the extension of the kind.
+        """
+        return 'hn-{0}{1}'.format(command or 'hn', cls.KINDS[kind])
+
+    def format_allocations(self, snapshot, peak):
+        """Format the lines allocating the most memory.
+
+        :type snapshot: :class:`tracemalloc.Snapshot`
+        :param snapshot: The allocations still alive when the command ended.
+
+        :type peak: int
+        :param peak: The peak traced memory in bytes.
+
+        :rtype: str
+        :return: The report.
+        """
+        statistics = snapshot.statistics('lineno')
+        lines = [
+            'Peak traced memory: {0:.1f} KiB'.format(peak / 1024),
+            'Still allocated: {0:.1f} KiB in {1} blocks'.format(
+                sum(stat.size for stat in statistics) / 1024,
+                sum(stat.count for stat in statistics)),
+            '',
+            'Top {0} lines by allocated size:'.format(self.TOP_ALLOCATIONS),
+        ]
+        for index, stat in enumerate(statistics[:self.TOP_ALLOCATIONS]):
+            frame = stat.traceback[0]
+            lines.append('#{0}: {1}:{2}: {3:.1f} KiB in {4} blocks'.format(
+                index + 1, frame.filename, frame.lineno, stat.size / 1024,
+                stat.count))
+            source = linecache.getline(frame.filename, frame.lineno).strip()
+            if source:
+                lines.append('    ' + source)
+        return '\n'.join(lines) + '\n'
+
+    def start(self):
+        """Start profiling."""
+        if self.kind == 'cpu':
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            tracemalloc.start()
+        self._running = True
+
+    def stop(self):
+        """Stop profiling and write the profile, if it was started.
+
+        :rtype: bool
+        :return: True if a profile was written.
+        """
+        if not self._running:
+            return False
+        self._running = False
+        temp_path = self.path + '.tmp'
+        if self.kind == 'cpu':
+            self._profile.disable()
+            self._profile.dump_stats(temp_path)
+        else:
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            snapshot = snapshot.filter_traces([
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, linecache.__file__),
+            ])
+            with io.open(temp_path, 'w', encoding='utf-8') as report_file:
+                report_file.write(self.format_allocations(snapshot, peak))
+        replace_file(temp_path, self.path)
+        return True
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""Count the requests, cache lookups and renders of a command.
+
+The API, the caches and the web viewer report into the module level
+`registry`, hn --stats prints its summary once the command completes.
+"""
+
+from __future__ import print_function
+from __future__ import division
+
+import threading
+import time
+
+import requests
+
+
+timer = getattr(time, 'perf_counter', time.time)
+
+
+class Stats(object):
+    """A registry of named counters, request latencies and observations.
+
+    Counters used:
+        articles_rendered: Articles converted to text.
+        bytes: Response body bytes downloaded.
+        charset_<path>: Article encodings found by each path of
+            `charset_detector.CharsetDetector`, such as charset_header.
+        concurrency_backoffs: Times the batch fetch concurrency limit was
+            cut after timeouts, 429 or 5xx responses.
+        hedged_requests, hedge_wins: Item requests duplicated after a slow
+            first answer, and the duplicates answering first.
+        items_rendered: Stories and comments formatted.
+        requests: HTTP requests sent, including failed ones.
+        request_errors: Requests that failed or returned an error status.
+        <cache>_cache_hits, <cache>_cache_misses: Lookups per cache in
+            CACHES.
+
+    :type CACHES: tuple (const)
+    :param CACHES: The caches reporting hits and misses.
+
+    :type counters: dict
+    :param counters: Maps a counter name to its value.
+
+    :type errors: dict
+    :param errors: Maps a request error type, such as timeout or http_429,
+        to its count.
+
+    :type latencies: dict
+    :param latencies: Maps a request endpoint, such as item or article, to
+        the seconds each request to it took.
+
+    :type observations: dict
+    :param observations: Maps a name, such as comment_tree_size or
+        concurrency_limit, to the observed values.
+
+    :type slowest_request: tuple
+    :param slowest_request: The seconds and url of the slowest request, or
+        None.
+
+    :type start: float
+    :param start: The `timer` value the registry was created at.
+    """
+
+    CACHES = ('article', 'thread')
+
+    def __init__(self):
+        self.counters = {}
+        self.errors = {}
+        self.latencies = {}
+        self.observations = {}
+        self.slowest_request = None
+        self.start = timer()
+        self._lock = threading.Lock()
+
+    def count(self, name, value=1):
+        """Increment a counter.
+
+        :type name: str
+        :param name: The counter name.
+
+        :type value: int
+        :param value: The increment.
+        """
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def get(self, name):
+        return self.counters.get(name, 0)
+
+    def observe(self, name, value):
+        """Record an observed value, such as the size of a comment tree.
+
+        :type name: str
+        :param name: The observation name.
+
+        :type value: float
+        :param value: The observed value.
+        """
+        with self._lock:
+            self.observations.setdefault(name, []).append(value)
+
+    def record_request(self, url, seconds, size, endpoint='other',
+                       error=None):
+        """Count a finished request.
+
+        :type url: str
+        :param url: The requested url.
+
+        :type seconds: float
+        :param seconds: The seconds the request took, body included.
+
+        :type size: int
+        :param size: The number of body bytes downloaded.
+
+        :type endpoint: str
+        :param endpoint: The kind of request, such as item, topstories or
+            article.
+
+        :type error: str
+        :param error: The error type if the request failed, see
+            `request_error` and `status_error`, else None.
+        """
+        with self._lock:
+            self.counters['requests'] = self.get('requests') + 1
+            self.counters['bytes'] = self.get('bytes') + size
+            self.latencies.setdefault(endpoint, []).append(seconds)
+            if error is not None:
+                self.counters['request_errors'] = \
+                    self.get('request_errors') + 1
+                self.errors[error] = self.errors.get(error, 0) + 1
+            if self.slowest_request is None or \
+                    seconds > self.slowest_request[0]:
+                self.slowest_request = (seconds, url)
+
+    def summary(self):
+        """Summarize the counters on one line.
+
+        :rtype: str
+        :return: The wall time, requests, bytes downloaded, cache lookups,
+            renders, charset detection paths, batch fetch concurrency,
+            hedges and slowest request.
+        """
+        hits = sum(self.get(cache + '_cache_hits') for cache in self.CACHES)
+        misses = sum(self.get(cache + '_cache_misses')
+                     for cache in self.CACHES)
+        parts = [
+            '{0:.2f}s wall'.format(timer() - self.start),
+            '{0} requests ({1} failed)'.format(self.get('requests'),
+                                               self.get('request_errors')),
+            '{0:.1f} KB downloaded'.format(self.get('bytes') / 1024),
+            'cache {0} hits {1} misses'.format(hits, misses),
+            '{0} items rendered'.format(self.get('items_rendered')),
+        ]
+        if self.get('articles_rendered'):
+            parts.append('{0} articles rendered'.format(
+                self.get('articles_rendered')))
+        charsets = ['{0} {1}'.format(name[len('charset_'):], value)
+                    for name, value in sorted(self.counters.items())
+                    if name.startswith('charset_')]
+        if charsets:
+            parts.append('charset ' + ' '.join(charsets))
+        limits = self.observations.get('concurrency_limit')
+        if limits:
+            parts.append('concurrency limit {0} ({1}-{2}, {3} backoffs)'.format(
+                limits[-1], min(limits), max(limits),
+                self.get('concurrency_backoffs')))
+        if self.get('hedged_requests'):
+            parts.append('{0} hedged ({1} won)'.format(
+                self.get('hedged_requests'), self.get('hedge_wins')))
+        if self.slowest_request is not None:
+            parts.append('slowest request {0:.2f}s {1}'.format(
+                *self.slowest_request))
+        return 'Stats: ' + ', '.join(parts)
+
+
+registry = Stats()
+
+
+def count(name, value=1):
+    """Increment a counter of the registry, see `Stats.count`."""
+    registry.count(name, value)
+
+
+def observe(name, value):
+    """Record an observed value, see `Stats.observe`."""
+    registry.observe(name, value)
+
+
+def record_request(url, seconds, size, endpoint='other', error=None):
+    """Count a finished request, see `Stats.record_request`."""
+    registry.record_request(url, seconds, size, endpoint, error)
+
+
+def request_error(error):
+    """Get the error type of a failed request.
+
+    :type error: :class:`requests.exceptions.RequestException`
+    :param error: The request exception.
+
+    :rtype: str
+    :return: timeout, connection or request.
+    """
+    if isinstance(error, requests.exceptions.Timeout):
+        return 'timeout'
+    if isinstance(error, requests.exceptions.ConnectionError):
+        return 'connection'
+    return 'request'
+
+
+def reset():
+    """Replace the registry with an empty one.
+
+    :rtype: :class:`Stats`
+    :return: The new registry.
+    """
+    global registry
+    registry = Stats()
+    return registry
+
+
+def status_error(status_code):
+    """Get the error type of a response status.
+
+    :type status_code: int
+    :param status_code: The HTTP status code.
+
+    :rtype: str
+    :return: http_<status_code> for a 4xx or 5xx status, else None.
+    """
+    if status_code >= 400:
+        return 'http_{0}'.format(status_code)
+    return None
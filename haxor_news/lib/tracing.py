@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""Record nested timing spans and export them as Chrome trace events.
+
+Tracing is off unless `start_tracing` was called, `span` then returns a
+shared no-op span so the instrumented code pays almost nothing:
+
+    with span('get_item', 'fetch', item_id=item_id):
+        ...
+
+Values that change over time, such as a limit, are recorded with `counter`
+and drawn as a graph.  The saved file opens in Perfetto or chrome://tracing,
+spans nest by thread.
+"""
+
+from __future__ import print_function
+from __future__ import division
+
+import functools
+import json
+import os
+import threading
+import time
+
+from ..compat import replace_file
+
+
+timer = getattr(time, 'perf_counter', time.time)
+
+
+class Span(object):
+    """A timed section of code, recorded when it exits.
+
+    :type args: dict
+    :param args: The span arguments shown in the trace viewer.
+
+    :type category: str
+    :param category: The span category, such as fetch or render.
+
+    :type name: str
+    :param name: The span name.
+
+    :type start: float
+    :param start: The `timer` value the span started at.
+
+    :type tracer: :class:`Tracer`
+    :param tracer: The tracer recording the span.
+    """
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = None
+
+    def __enter__(self):
+        self.start = timer()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.tracer.add(self, timer())
+
+    def set(self, **args):
+        """Add arguments known once the span is running.
+
+        :type args: dict
+        :param args: The span arguments.
+        """
+        self.args.update(args)
+
+
+class NullSpan(object):
+    """The span returned while tracing is off."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def set(self, **args):
+        pass
+
+
+class Tracer(object):
+    """Collect spans from every thread as Chrome trace events.
+
+    :type events: list
+    :param events: The complete (ph X) and counter (ph C) trace events, in
+        the order the spans ended or the counters changed.
+
+    :type pid: int
+    :param pid: The traced process id.
+
+    :type start: float
+    :param start: The `timer` value the timestamps are relative to.
+    """
+
+    def __init__(self):
+        self.events = []
+        self.pid = os.getpid()
+        self.start = timer()
+        self._lock = threading.Lock()
+        self._thread_names = {}
+
+    def add(self, span, end):
+        """Record a finished span.
+
+        :type span: :class:`Span`
+        :param span: The span.
+
+        :type end: float
+        :param end: The `timer` value the span ended at.
+        """
+        thread = threading.current_thread()
+        event = {
+            'name': span.name,
+            'cat': span.category,
+            'ph': 'X',
+            'ts': (span.start - self.start) * 1e6,
+            'dur': (end - span.start) * 1e6,
+            'pid': self.pid,
+            'tid': thread.ident,
+        }
+        if span.args:
+            event['args'] = span.args
+        self._append(event)
+
+    def add_counter(self, name, category, values):
+        """Record the current values of a counter.
+
+        :type name: str
+        :param name: The counter name.
+
+        :type category: str
+        :param category: The counter category, such as fetch.
+
+        :type values: dict
+        :param values: Maps a series of the counter to its value.
+        """
+        self._append({
+            'name': name,
+            'cat': category,
+            'ph': 'C',
+            'ts': (timer() - self.start) * 1e6,
+            'pid': self.pid,
+            'tid': threading.current_thread().ident,
+            'args': values,
+        })
+
+    def _append(self, event):
+        thread = threading.current_thread()
+        with self._lock:
+            self.events.append(event)
+            self._thread_names[thread.ident] = thread.name
+
+    def save(self, path):
+        """Save the trace as Chrome trace-event JSON.
+
+        :type path: str
+        :param path: The trace file path.
+        """
+        with self._lock:
+            events = list(self.events)
+            thread_names = dict(self._thread_names)
+        for tid, name in sorted(thread_names.items()):
+            events.append({
+                'name': 'thread_name',
+                'ph': 'M',
+                'pid': self.pid,
+                'tid': tid,
+                'args': {'name': name},
+            })
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w') as trace_file:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'},
+                      trace_file, default=str)
+        replace_file(temp_path, path)
+
+
+NULL_SPAN = NullSpan()
+tracer = None
+
+
+def span(name, category='hn', **args):
+    """Create a span recorded by the active tracer.
+
+    :type name: str
+    :param name: The span name.
+
+    :type category: str
+    :param category: The span category, such as fetch or render.
+
+    :type args: dict
+    :param args: The span arguments shown in the trace viewer.
+
+    :rtype: :class:`Span`
+    :return: The span, or NULL_SPAN while tracing is off.
+    """
+    if tracer is None:
+        return NULL_SPAN
+    return Span(tracer, name, category, args)
+
+
+def counter(name, category='hn', **values):
+    """Record the current values of a counter with the active tracer.
+
+    :type name: str
+    :param name: The counter name.
+
+    :type category: str
+    :param category: The counter category, such as fetch.
+
+    :type values: dict
+    :param values: Maps a series of the counter to its value.
+    """
+    if tracer is not None:
+        tracer.add_counter(name, category, values)
+
+
+def start_tracing():
+    """Start recording spans.
+
+    :rtype: :class:`Tracer`
+    :return: The active tracer.
+    """
+    global tracer
+    tracer = Tracer()
+    return tracer
+
+
+def stop_tracing():
+    """Stop recording spans.
+
+    :rtype: :class:`Tracer`
+    :return: The tracer that was active, or None.
+    """
+    global tracer
+    stopped, tracer = tracer, None
+    return stopped
+
+
+def traced(name, category='hn'):
+    """Decorate a function to run in a span.
+
+    :type name: str
+    :param name: The span name.
+
+    :type category: str
+    :param category: The span category.
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with span(name, category):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
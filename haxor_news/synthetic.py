@@ -0,0 +1,332 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+"""Generate synthetic Hacker News item graphs for scale testing.
+
+The pages use the format of `bundle.Bundle.pages`, so they can be served
+by `api_server.ApiServer`, wrapped in an in-memory
+`bundle.OfflineHackerNewsApi`, or saved as a bundle for hn --offline:
+
+    python -m haxor_news.synthetic --comments 3000 --chain_depth 40 \\
+        --submissions 50000 -o synthetic.json.gz
+    hn --bundle synthetic.json.gz --offline view 1 -c
+"""
+
+from __future__ import print_function
+from __future__ import division
+
+import math
+import random
+
+import click
+
+from .bundle import Bundle
+
+
+class SyntheticGenerator(object):
+    """Generate realistic synthetic stories, comment threads and users.
+
+    Comment depths follow a geometric distribution, most comments are top
+    level or shallow replies, and an optional reply chain reaches a given
+    depth.  Comment lengths follow a lognormal distribution of words.
+
+    :type dead_ratio: float
+    :param dead_ratio: The fraction of comments that are dead.
+
+    :type deleted_ratio: float
+    :param deleted_ratio: The fraction of comments that are deleted.
+
+    :type next_id: int
+    :param next_id: The id of the next generated item.
+
+    :type pages: dict
+    :param pages: Maps an API path, such as item/8863, to its JSON.
+
+    :type random: :class:`random.Random`
+    :param random: The random number generator.
+
+    :type text_words: int
+    :param text_words: The median number of words of a comment.
+
+    :type time: int
+    :param time: The epoch timestamp of the next generated item.
+
+    :type USERS: int (const)
+    :param USERS: The number of generated user names.
+
+    :type WORDS: tuple (const)
+    :param WORDS: The words the texts are made of.
+    """
+
+    USERS = 500
+    WORDS = (
+        'the', 'a', 'of', 'to', 'and', 'in', 'is', 'it', 'that', 'for',
+        'you', 'this', 'but', 'with', 'are', 'not', 'on', 'be', 'have',
+        'as', 'we', 'can', 'if', 'or', 'they', 'at', 'from', 'just',
+        'like', 'more', 'people', 'would', 'think', 'about', 'use', 'time',
+        'code', 'python', 'rust', 'remote', 'salary', 'startup', 'data',
+        'latency', 'cache', 'thread', 'compiler', 'database', 'browser',
+        'server', 'kernel', 'team', 'product', 'market', 'users', 'work',
+    )
+
+    def __init__(self, seed=None, text_words=40, deleted_ratio=0.02,
+                 dead_ratio=0.01, start_id=1, start_time=1500000000):
+        self.random = random.Random(seed)
+        self.text_words = text_words
+        self.deleted_ratio = deleted_ratio
+        self.dead_ratio = dead_ratio
+        self.next_id = start_id
+        self.time = start_time
+        self.pages = {}
+
+    def create_item(self, item_type, parent=None, **fields):
+        """Create an item page.
+
+        :type item_type: str
+        :param item_type: The item type, such as story or comment.
+
+        :type parent: int
+        :param parent: The parent item id, or None for a story.
+
+        :rtype: dict
+        :return: The item.
+        """
+        item = {'id': self.next_id, 'type': item_type, 'time': self.time}
+        if parent is not None:
+            item['parent'] = parent
+        item.update(fields)
+        self.pages['item/{0}'.format(item['id'])] = item
+        self.next_id += 1
+        self.time += self.random.randint(1, 120)
+        return item
+
+    def create_user_name(self):
+        return 'user{0}'.format(self.random.randrange(self.USERS))
+
+    def create_text(self):
+        """Create the HTML text of a comment.
+
+        :rtype: str
+        :return: Escaped paragraphs with the odd link, code span and
+            emphasis, like the API returns.
+        """
+        words = max(1, int(self.random.lognormvariate(
+            math.log(self.text_words), 0.8)))
+        paragraphs = []
+        while words > 0:
+            size = min(words, self.random.randint(10, 80))
+            words -= size
+            paragraph = [self.random.choice(self.WORDS)
+                         for _ in range(size)]
+            draw = self.random.random()
+            if draw < 0.1:
+                paragraph.append('<a href="https://example.com/{0}" '
+                                 'rel="nofollow">https:&#x2F;&#x2F;example'
+                                 '.com&#x2F;{0}</a>'.format(self.next_id))
+            elif draw < 0.15:
+                paragraph.insert(0, '<i>I&#x27;d</i>')
+            elif draw < 0.2:
+                paragraph.append('<code>x = &quot;y&quot;</code>')
+            paragraphs.append(' '.join(paragraph))
+        return '<p>'.join(paragraphs)
+
+    def draw_depth(self, max_depth, depth_decay):
+        """Draw the depth of the parent of a new comment.
+
+        :type max_depth: int
+        :param max_depth: The maximum depth.
+
+        :type depth_decay: float
+        :param depth_decay: The probability of a comment being one level
+            deeper, P(depth = d) is proportional to depth_decay ** d.
+
+        :rtype: int
+        :return: The depth of the parent, 0 for the story.
+        """
+        depth = 0
+        while depth < max_depth - 1 and self.random.random() < depth_decay:
+            depth += 1
+        return depth
+
+    def thread(self, comments=300, max_depth=40, depth_decay=0.5,
+               chain_depth=0, title=None):
+        """Generate a story with a comment thread.
+
+        :type comments: int
+        :param comments: The number of comments, including the chain.
+
+        :type max_depth: int
+        :param max_depth: The maximum number of comment levels.
+
+        :type depth_decay: float
+        :param depth_decay: See `draw_depth`.
+
+        :type chain_depth: int
+        :param chain_depth: The depth of a single reply chain added to the
+            thread, regardless of max_depth, or 0 for none.
+
+        :type title: str
+        :param title: The story title, or None for a generated one.
+
+        :rtype: int
+        :return: The story id.
+        """
+        story = self.create_item(
+            'story',
+            by=self.create_user_name(),
+            title=title or 'Synthetic story {0}'.format(self.next_id),
+            url='https://example.com/story/{0}'.format(self.next_id),
+            score=self.random.randint(1, 1000),
+            descendants=comments,
+            kids=[])
+        depths = {story['id']: 0}
+        # levels[d] lists the items at depth d that can get replies.
+        levels = [[story]]
+        chain_parent = story
+        for index in range(comments):
+            if index < chain_depth:
+                parent = chain_parent
+            else:
+                depth = min(self.draw_depth(max_depth, depth_decay),
+                            len(levels) - 1)
+                # A deleted chain comment leaves the levels under it empty.
+                while not levels[depth]:
+                    depth -= 1
+                # Recent comments get most of the replies.
+                parent = self.random.choice(levels[depth][-20:])
+            comment = self.comment(parent['id'])
+            parent.setdefault('kids', []).append(comment['id'])
+            depth = depths[parent['id']] + 1
+            depths[comment['id']] = depth
+            if index < chain_depth:
+                chain_parent = comment
+            if depth < max_depth and not comment.get('deleted'):
+                while len(levels) <= depth:
+                    levels.append([])
+                levels[depth].append(comment)
+        return story['id']
+
+    def comment(self, parent):
+        """Generate a comment, deleted or dead at the configured ratios.
+
+        :type parent: int
+        :param parent: The parent item id.
+
+        :rtype: dict
+        :return: The comment.
+        """
+        draw = self.random.random()
+        if draw < self.deleted_ratio:
+            return self.create_item('comment', parent, deleted=True)
+        comment = self.create_item('comment', parent,
+                                   by=self.create_user_name(),
+                                   text=self.create_text())
+        if draw < self.deleted_ratio + self.dead_ratio:
+            comment['dead'] = True
+        return comment
+
+    def story_list(self, name, story_ids):
+        """Set a story list, such as topstories.
+
+        :type name: str
+        :param name: The story list page name.
+
+        :type story_ids: list
+        :param story_ids: The story ids.
+        """
+        self.pages[name] = list(story_ids)
+
+    def to_bundle(self):
+        """Create a bundle of the generated pages.
+
+        :rtype: :class:`bundle.Bundle`
+        :return: The bundle.
+        """
+        bundle = Bundle()
+        bundle.pages = self.pages
+        return bundle
+
+    def user(self, user_id, submissions=100, with_items=False):
+        """Generate a user with the given number of submissions.
+
+        :type user_id: str
+        :param user_id: The user id.
+
+        :type submissions: int
+        :param submissions: The number of submissions.
+
+        :type with_items: bool
+        :param with_items: Specifies if the submissions are generated as
+            stories, otherwise only their ids are listed.
+
+        :rtype: dict
+        :return: The user.
+        """
+        if with_items:
+            submitted = [self.create_item(
+                'story', by=user_id,
+                title='Submission {0}'.format(self.next_id),
+                score=self.random.randint(1, 100), descendants=0)['id']
+                for _ in range(submissions)]
+        else:
+            submitted = list(range(self.next_id, self.next_id + submissions))
+            self.next_id += submissions
+        user = {
+            'id': user_id,
+            'created': self.time,
+            'karma': self.random.randint(1, 100000),
+            'submitted': submitted[::-1],
+        }
+        self.pages['user/' + user_id] = user
+        return user
+
+
+@click.command()
+@click.option('-o', '--output', required=True,
+              help='The bundle file to write.')
+@click.option('--stories', default=30)
+@click.option('--comments', default=300,
+              help='The number of comments of the first story.')
+@click.option('--max_depth', default=40)
+@click.option('--depth_decay', default=0.5)
+@click.option('--chain_depth', default=0,
+              help='The depth of a reply chain in the first story.')
+@click.option('--text_words', default=40)
+@click.option('--deleted_ratio', default=0.02)
+@click.option('--dead_ratio', default=0.01)
+@click.option('--submissions', default=0,
+              help='The submissions of a generated user named heavy.')
+@click.option('--seed', default=0)
+def main(output, stories, comments, max_depth, depth_decay, chain_depth,
+         text_words, deleted_ratio, dead_ratio, submissions, seed):
+    """Write a bundle of synthetic stories and threads."""
+    generator = SyntheticGenerator(seed, text_words, deleted_ratio,
+                                   dead_ratio)
+    story_ids = [generator.thread(comments, max_depth, depth_decay,
+                                  chain_depth)]
+    for _ in range(stories - 1):
+        story_ids.append(generator.thread(
+            generator.random.randint(0, 200), max_depth, depth_decay))
+    for name in ('topstories', 'newstories', 'beststories'):
+        generator.story_list(name, story_ids)
+    if submissions:
+        generator.user('heavy', submissions)
+    generator.to_bundle().save(output)
+    click.echo('Wrote {0} pages to {1}'.format(
+        len(generator.pages), output))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+import json
+import os
+
+from .compat import replace_file
+
+
+class ThreadCache(object):
+    """Cache the top level comments of a thread on disk.
+
+    The hiring and freelance commands search the same monthly threads over
+    and over, so their comments and search indices are kept between runs.
+
+    A cached thread is a dict with the following keys:
+        id: The post id.
+        title: The post title.
+        time: The post submission time as an epoch timestamp.
+        fetched: When the thread was last fetched, as an epoch timestamp.
+        kids: The top level comment ids, in thread order.
+        comments: The top level comments as raw api dicts, in thread order.
+        index: The serialized :class:`bm25.Bm25Index` over the comments.
+
+    :type cache_dir: str
+    :param cache_dir: The directory holding one json file per thread.
+
+    :type MONTHLY_POSTS: str (const)
+    :param MONTHLY_POSTS: The file name of the monthly posts registry.
+    """
+
+    MONTHLY_POSTS = 'monthly_posts'
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def _write(self, name, data):
+        """Write json data to the cache.
+
+        Writes to a temporary file first so a concurrent reader never sees a
+        partially written file.
+
+        :type name: str
+        :param name: The cache entry name.
+
+        :type data: dict
+        :param data: The data to write.
+        """
+        if not os.path.isdir(self.cache_dir):
+            try:
+                os.makedirs(self.cache_dir)
+            except OSError:
+                # Another thread may have created it in the meantime.
+                if not os.path.isdir(self.cache_dir):
+                    raise
+        path = self.get_thread_path(name)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w') as cache_file:
+            json.dump(data, cache_file)
+        replace_file(temp_path, path)
+
+    def get_thread_path(self, post_id):
+        """Get the cache file path for the given thread.
+
+        :type post_id: int
+        :param post_id: The post id.
+
+        :rtype: str
+        :return: The cache file path.
+        """
+        return os.path.join(self.cache_dir, '{0}.json'.format(post_id))
+
+    def load(self, post_id):
+        """Load the given thread from the cache.
+
+        :type post_id: int
+        :param post_id: The post id.
+
+        :rtype: dict
+        :return: The cached thread, or None if it is not cached or the
+            cache file is unreadable.
+        """
+        try:
+            with open(self.get_thread_path(post_id)) as thread_file:
+                return json.load(thread_file)
+        except (IOError, ValueError):
+            return None
+
+    def load_monthly_posts(self):
+        """Load the registry of known monthly post candidates.
+
+        :rtype: dict
+        :return: Maps a post id string to a dict with title and time keys.
+        """
+        return self.load(self.MONTHLY_POSTS) or {}
+
+    def save(self, thread):
+        """Save the given thread to the cache.
+
+        :type thread: dict
+        :param thread: The thread to save.
+        """
+        self._write(thread['id'], thread)
+
+    def save_monthly_posts(self, posts):
+        """Save the registry of known monthly post candidates.
+
+        :type posts: dict
+        :param posts: Maps a post id string to a dict with title and time
+            keys.
+        """
+        self._write(self.MONTHLY_POSTS, posts)
@@ -15,10 +15,25 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+import codecs
+import hashlib
+import json
+import multiprocessing
 import re
+import threading
+import time
+from concurrent import futures
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
+from .article_cache import ArticleCache
+from .charset_detector import CharsetDetector
 from .compat import HTMLParser
-from .lib.html2text.html2text import HTML2Text
+from .compat import urlparse
+from .config import Config
+from .content_extractor import ContentExtractor
+from .lib.html2text.html2text import HTML2Text, resolve_tokenizer
+from .lib import stats
+from .lib.tracing import span, traced
 import click
 import requests
 
@@ -26,20 +41,160 @@ import requests
 class WebViewer(object):
     """Handle viewing of web content within the terminal.
 
+    :type article_cache: :class:`article_cache.ArticleCache`
+    :param article_cache: An instance of `article_cache.ArticleCache`, or
+        None to disable caching.
+
+    :type ARTICLE_FRESH_AGE: int (const)
+    :param ARTICLE_FRESH_AGE: The age in seconds during which a cached
+        article is shown without revalidating it.
+
+    :type CHUNK_SIZE: int (const)
+    :param CHUNK_SIZE: The number of bytes read at a time.
+
+    :type charset_detector: :class:`charset_detector.CharsetDetector`
+    :param charset_detector: An instance of
+        `charset_detector.CharsetDetector`.
+
+    :type config: :class:`config.Config`
+    :param config: An instance of `config.Config`, supplies the colors of
+        the markdown elements.
+
+    :type CONNECT_TIMEOUT: int (const)
+    :param CONNECT_TIMEOUT: The seconds to wait for a connection.
+
+    :type extract_content: bool
+    :param extract_content: Specifies if only the main content of a page is
+        converted, see `content_extractor.ContentExtractor`.  Off by
+        default: finding the main content takes the whole page, so the
+        first screen of an article waits for its last byte instead of
+        being shown as the page streams in.
+
+    :type HEADERS: dict (const)
+    :param HEADERS: The request headers.
+
+    :type host_semaphores: dict
+    :param host_semaphores: Maps a host to the semaphore limiting the
+        concurrent requests to it.
+
     :type html: :class:`HTMLParser.HTMLParser`
     :param html: An instance of `HTMLParser.HTMLParser`.
 
     :type html_to_text: :class:`html2text.html2text.HTML2Text`
     :param html_to_text: An instance of `html2text.html2text.HTML2Text`.
+
+    :type markdown_styles: dict
+    :param markdown_styles: Maps a markdown element to the ansi codes
+        starting and ending its color.
+
+    :type MARKDOWN_ELEMENTS: tuple (const)
+    :param MARKDOWN_ELEMENTS: The colored markdown elements, each has a
+        matching clr_<element> color in `config.Config`.
+
+    :type MAX_BODY_SIZE: int (const)
+    :param MAX_BODY_SIZE: The maximum number of bytes read from a page, the
+        rest of a larger page is left out.
+
+    :type MAX_FETCH_TIME: int (const)
+    :param MAX_FETCH_TIME: The maximum seconds spent reading a page, the
+        rest of a slower page is left out.
+
+    :type MAX_HOST_REQUESTS: int (const)
+    :param MAX_HOST_REQUESTS: The maximum concurrent requests to a host.
+
+    :type offline: bool
+    :param offline: Specifies if articles are only served from the article
+        cache, whatever their age, without any request.
+
+    :type OFFLINE_MESSAGE: str (const)
+    :param OFFLINE_MESSAGE: The error for an article missing offline.
+
+    :type POOL_SIZE: int (const)
+    :param POOL_SIZE: The number of kept alive connections per host.
+
+    :type READ_TIMEOUT: int (const)
+    :param READ_TIMEOUT: The seconds to wait for the server to send data.
+
+    :type REGEX_HEADER: :class:`re.RegexObject` (const)
+    :param REGEX_HEADER: Matches a markdown header.
+
+    :type REGEX_INLINE: :class:`re.RegexObject` (const)
+    :param REGEX_INLINE: Matches a markdown link, reference link, bold or
+        code span, whichever starts first.
+
+    :type REGEX_INLINE_EMPHASIS: :class:`re.RegexObject` (const)
+    :param REGEX_INLINE_EMPHASIS: Matches a markdown bold or code span.
+
+    :type RENDER_SETTINGS: tuple (const)
+    :param RENDER_SETTINGS: The HTML2Text options affecting the output.
+
+    :type RENDER_VERSION: int (const)
+    :param RENDER_VERSION: Bump to invalidate the cached renders whenever
+        the rendering code changes.
+
+    :type TRUNCATED_MESSAGE: str (const)
+    :param TRUNCATED_MESSAGE: The note ending a page that was cut short.
+
+    :type session: :class:`requests.Session`
+    :param session: The session pooling the connections.
     """
 
-    def __init__(self):
+    ARTICLE_FRESH_AGE = 60 * 60
+    CHUNK_SIZE = 64 * 1024
+    CONNECT_TIMEOUT = 5
+    HEADERS = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_10_1) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/39.0.2171.95 Safari/537.36'}  # NOQA
+    MAX_BODY_SIZE = 4 * 1024 * 1024
+    MAX_FETCH_TIME = 30
+    MARKDOWN_ELEMENTS = ('bold', 'code', 'header', 'link', 'list')
+    MAX_HOST_REQUESTS = 2
+    OFFLINE_MESSAGE = 'Not available offline: {0}'
+    POOL_SIZE = 4
+    READ_TIMEOUT = 15
+    REGEX_HEADER = re.compile(r'(#+) (.*)')
+    REGEX_INLINE = re.compile(r'!*\[[^]]*\]\(\s*[^)]+\s*\)|'
+                              r'!*\[[^]]*\]\[\s*[^]]+\s*\]|'
+                              r'(\*\*|__)(?P<bold>.*?)\1|'
+                              r'`(?P<code>.*?)`')
+    REGEX_INLINE_EMPHASIS = re.compile(r'(\*\*|__)(?P<bold>.*?)\1|'
+                                       r'`(?P<code>.*?)`')
+    RENDER_SETTINGS = (
+        'body_width',
+        'ignore_emphasis',
+        'ignore_images',
+        'ignore_links',
+        'inline_links',
+        'links_each_paragraph',
+        'skip_internal_links',
+        'tokenizer',
+    )
+    RENDER_VERSION = 2
+    TRUNCATED_MESSAGE = ('\n[Page too large or too slow, the rest was left '
+                         'out. Try running hn view # with the --browser/-b '
+                         'flag]\n')
+
+    def __init__(self, cache_dir=None, config=None):
+        self.config = config if config is not None else Config()
+        self.markdown_styles = {}
+        self._init_markdown_styles()
+        self.extract_content = False
+        self.offline = False
+        self.charset_detector = CharsetDetector()
         try:
             self.html = HTMLParser.HTMLParser()
         except:
             self.html = HTMLParser
+        self.article_cache = None
+        if cache_dir is not None:
+            self.article_cache = ArticleCache(cache_dir)
         self.html_to_text = None
         self._init_html_to_text()
+        self.host_semaphores = {}
+        self._host_semaphores_lock = threading.Lock()
+        self.session = requests.Session()
+        self.session.headers.update(self.HEADERS)
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.POOL_SIZE)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
     def _init_html_to_text(self):
         """Initialize HTML2Text."""
@@ -51,45 +206,134 @@ class WebViewer(object):
         self.html_to_text.skip_internal_links = False
         self.html_to_text.inline_links = False
         self.html_to_text.links_each_paragraph = False
+        self.html_to_text.tokenizer = resolve_tokenizer('auto')
+
+    def _init_markdown_styles(self):
+        """Initialize the ansi codes wrapping each markdown element.
+
+        The codes are computed once with click.style so the colorizer only
+        has to concatenate strings.
+        """
+        self.markdown_styles = {}
+        for element in self.MARKDOWN_ELEMENTS:
+            color = getattr(self.config, 'clr_' + element)
+            start, end = click.style('\0', fg=color).split('\0')
+            self.markdown_styles[element] = (start, end)
+
+    def _style_inline(self, match):
+        """Color a link, reference link, bold or code markdown match.
+
+        The text inside a match is colored too, so nested elements keep the
+        colors they would have gotten on their own.
+
+        :type match: :class:`re.MatchObject`
+        :param match: A REGEX_INLINE match.
+
+        :rtype: str
+        :return: The colored match.
+        """
+        if match.group('bold') is not None:
+            start, end = self.markdown_styles['bold']
+            return start + self.format_inline(match.group('bold')) + end
+        if match.group('code') is not None:
+            start, end = self.markdown_styles['code']
+            return start + '`' + self.format_inline(
+                match.group('code')) + '`' + end
+        start, end = self.markdown_styles['link']
+        return start + self.REGEX_INLINE_EMPHASIS.sub(
+            self._style_inline, match.group(0)) + end
+
+    def format_error(self, error):
+        """Format the error of a failed article request.
+
+        :type error: Exception
+        :param error: The error, such as a
+            :class:`requests.exceptions.RequestException`.
+
+        :rtype: str
+        :return: The error message.
+        """
+        return ('Error: ' + str(error) + '\n'
+                'Try running hn view # with the --browser/-b flag\n')
+
+    def format_inline(self, text):
+        """Color the links, reference links, bold and code in a line.
+
+        :type text: str
+        :param text: A line of markdown.
+
+        :rtype: str
+        :return: The colored line.
+        """
+        if '[' in text or '`' in text or '**' in text or '__' in text:
+            return self.REGEX_INLINE.sub(self._style_inline, text)
+        return text
 
     def format_markdown(self, text):
         """Add color to the input markdown using click.style.
 
+        Colors links, reference links, lists, headers, bold and code in a
+        single pass over the lines of the text, then collapses runs of blank
+        lines into a single blank line.
+
         :type text: str
         :param text: The markdown text.
 
         :rtype: str
         :return: The input `text`, formatted.
         """
-        pattern_url_name = r'[^]]*'
-        pattern_url_link = r'[^)]+'
-        pattern_url = r'([!]*\[{0}]\(\s*{1}\s*\))'.format(
-            pattern_url_name,
-            pattern_url_link)
-        regex_url = re.compile(pattern_url)
-        text = regex_url.sub(click.style(r'\1', fg='green'), text)
-        pattern_url_ref_name = r'[^]]*'
-        pattern_url_ref_link = r'[^]]+'
-        pattern_url_ref = r'([!]*\[{0}]\[\s*{1}\s*\])'.format(
-            pattern_url_ref_name,
-            pattern_url_ref_link)
-        regex_url_ref = re.compile(pattern_url_ref)
-        text = regex_url_ref.sub(click.style(r'\1', fg='green'),
-                                 text)
-        regex_list = re.compile(r'(  \*.*)')
-        text = regex_list.sub(click.style(r'\1', fg='cyan'),
-                              text)
-        regex_header = re.compile(r'(#+) (.*)')
-        text = regex_header.sub(click.style(r'\2', fg='yellow'),
-                                text)
-        regex_bold = re.compile(r'(\*\*|__)(.*?)\1')
-        text = regex_bold.sub(click.style(r'\2', fg='cyan'),
-                              text)
-        regex_code = re.compile(r'(`)(.*?)\1')
-        text = regex_code.sub(click.style(r'\1\2\1', fg='cyan'),
-                              text)
-        text = re.sub(r'(\s*\r?\n\s*){2,}', r'\n\n', text)
-        return text
+        list_start, list_end = self.markdown_styles['list']
+        header_start, header_end = self.markdown_styles['header']
+        lines = []
+        blank_lines = []
+        for line in text.split('\n'):
+            if not line or line.isspace():
+                blank_lines.append(line)
+                continue
+            line = self.format_inline(line)
+            index = line.find('  *')
+            if index != -1:
+                line = line[:index] + list_start + line[index:] + list_end
+            if '# ' in line:
+                match = self.REGEX_HEADER.search(line)
+                if match is not None:
+                    line = (line[:match.start()] + header_start +
+                            match.group(2) + header_end +
+                            line[match.end():])
+            if blank_lines:
+                # Emulate collapsing every whitespace run spanning two or
+                # more newlines into a single blank line.
+                if lines:
+                    lines[-1] = lines[-1].rstrip() + '\n'
+                    line = line.lstrip()
+                elif len(blank_lines) > 1:
+                    lines.append('\n')
+                    line = line.lstrip()
+                else:
+                    lines.extend(blank_lines)
+                blank_lines = []
+            lines.append(line)
+        if not lines:
+            return '\n\n' if len(blank_lines) > 2 else text
+        if len(blank_lines) > 1:
+            lines[-1] = lines[-1].rstrip() + '\n'
+            lines.append('')
+        else:
+            lines.extend(blank_lines)
+        return '\n'.join(lines)
+
+    def format_text(self, text):
+        """Strip out Unicode and add color to the converted text.
+
+        :type text: str
+        :param text: The text converted by HTML2Text.
+
+        :rtype: str
+        :return: The formatted text.
+        """
+        # Strip out Unicode, which seems to have issues when html2txt is
+        # coupled with click.echo_via_pager.
+        return self.format_markdown(self.strip_unicode(text))
 
     def generate_url_contents(self, url):
         """Generate the formatted contents of the given item's url.
@@ -97,24 +341,582 @@ class WebViewer(object):
         Converts the HTML to text using HTML2Text, colors it, then displays
             the output in a pager.
 
+        See `stream_url_contents`.
+
         :type url: str
         :param url: The url whose contents to fetch.
 
         :rtype: str
         :return: The string representation of the formatted url contents.
         """
+        return ''.join(self.stream_url_contents(url))
+
+    def create_article(self, url, raw_response, encoding, encoding_source,
+                       fetched, truncated):
+        """Create the metadata of a fetched article.
+
+        See `article_cache.ArticleCache` for the keys.
+
+        :type url: str
+        :param url: The article url.
+
+        :type raw_response: :class:`requests.Response`
+        :param raw_response: The response.
+
+        :type encoding: str
+        :param encoding: The encoding of the raw HTML.
+
+        :type encoding_source: str
+        :param encoding_source: How the encoding was found.
+
+        :type fetched: float
+        :param fetched: The epoch timestamp of the request.
+
+        :type truncated: bool
+        :param truncated: Specifies if the raw HTML was cut short.
+
+        :rtype: dict
+        :return: The article metadata, without renders.
+        """
+        return {
+            'url': url,
+            'etag': raw_response.headers.get('ETag'),
+            'last_modified': raw_response.headers.get('Last-Modified'),
+            'encoding': encoding,
+            'encoding_source': encoding_source,
+            'fetched': fetched,
+            'renders': {},
+            'truncated': truncated,
+        }
+
+    def create_html_to_text(self):
+        """Create an HTML2Text with the current RENDER_SETTINGS.
+
+        An HTML2Text instance can only convert a single document.
+
+        :rtype: :class:`html2text.html2text.HTML2Text`
+        :return: An instance of `html2text.html2text.HTML2Text`.
+        """
+        html_to_text = HTML2Text()
+        for name in self.RENDER_SETTINGS:
+            setattr(html_to_text, name, getattr(self.html_to_text, name))
+        return html_to_text
+
+    def fetch(self, url, headers=None):
+        """Fetch the given url through the pooled session.
+
+        See `request` and `iter_body`.
+
+        :type url: str
+        :param url: The url to fetch.
+
+        :type headers: dict
+        :param headers: Additional request headers.
+
+        :rtype: tuple
+        :return: * The :class:`requests.Response`.
+                 * The body as bytes.
+                 * A bool specifying if the body was cut short.
+
+        :raises: `requests.exceptions.RequestException` if the request
+            failed or timed out.
+        """
+        state = {'body': [], 'truncated': False}
+        with self.get_host_semaphore(url), \
+                span('fetch', 'http', url=url) as fetch_span:
+            start = stats.timer()
+            try:
+                raw_response = self.request(url, headers)
+            except requests.exceptions.RequestException as e:
+                stats.record_request(url, stats.timer() - start, 0,
+                                     'article', stats.request_error(e))
+                raise
+            try:
+                for _ in self.iter_body(raw_response, state):
+                    pass
+            finally:
+                raw_response.close()
+            size = sum(len(chunk) for chunk in state['body'])
+            stats.record_request(url, stats.timer() - start, size, 'article',
+                                 stats.status_error(raw_response.status_code))
+            fetch_span.set(status=raw_response.status_code, bytes=size)
+        return raw_response, b''.join(state['body']), state['truncated']
+
+    def get_host_semaphore(self, url):
+        """Get the semaphore limiting the concurrent requests to a host.
+
+        :type url: str
+        :param url: The url to request.
+
+        :rtype: :class:`threading.Semaphore`
+        :return: The host's semaphore.
+        """
+        host = urlparse(url).netloc
+        with self._host_semaphores_lock:
+            semaphore = self.host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.Semaphore(self.MAX_HOST_REQUESTS)
+                self.host_semaphores[host] = semaphore
+        return semaphore
+
+    def get_render_key(self):
+        """Get the key identifying the current render settings.
+
+        :rtype: str
+        :return: A hash of the RENDER_SETTINGS and RENDER_VERSION.
+        """
+        settings = dict((name, getattr(self.html_to_text, name))
+                        for name in self.RENDER_SETTINGS)
+        settings['extract_content'] = self.extract_content
+        settings['markdown_styles'] = self.markdown_styles
+        settings['render_version'] = self.RENDER_VERSION
+        return hashlib.sha1(
+            json.dumps(settings, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def get_validators(self, article):
+        """Get the headers revalidating a cached article.
+
+        :type article: dict
+        :param article: The cached article metadata, or None.
+
+        :rtype: dict
+        :return: The conditional request headers.
+        """
+        headers = {}
+        if article is not None:
+            if article['etag']:
+                headers['If-None-Match'] = article['etag']
+            if article['last_modified']:
+                headers['If-Modified-Since'] = article['last_modified']
+        return headers
+
+    def iter_body(self, raw_response, state):
+        """Read the body of a streamed response in chunks.
+
+        The body is read up to MAX_BODY_SIZE bytes or MAX_FETCH_TIME seconds,
+        whichever comes first, so a huge or slow page is cut short instead
+        of hanging the pager.  A read that fails midway also cuts the body
+        short instead of raising.
+
+        :type raw_response: :class:`requests.Response`
+        :param raw_response: The streamed response.
+
+        :type state: dict
+        :param state: Collects the chunks read in its body list and sets
+            truncated if the body was cut short.
+
+        :rtype: generator
+        :return: Yields the body chunks as bytes.
+        """
+        size = 0
+        deadline = time.time() + self.MAX_FETCH_TIME
         try:
-            headers = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_10_1) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/39.0.2171.95 Safari/537.36'}  # NOQA
-            raw_response = requests.get(url, headers=headers)
-        except (requests.exceptions.SSLError,
-                requests.exceptions.ConnectionError) as e:
-            contents = 'Error: ' + str(e) + '\n'
-            contents += 'Try running hn view # with the --browser/-b flag\n'
-            return contents
-        text = raw_response.text
-        contents = self.html_to_text.handle(text)
-        # Strip out Unicode, which seems to have issues when html2txt is
-        # coupled with click.echo_via_pager.
-        contents = re.sub(r'[^\x00-\x7F]+', '', contents)
-        contents = self.format_markdown(contents)
+            for chunk in raw_response.iter_content(self.CHUNK_SIZE):
+                if size + len(chunk) > self.MAX_BODY_SIZE:
+                    chunk = chunk[:self.MAX_BODY_SIZE - size]
+                    state['truncated'] = True
+                size += len(chunk)
+                state['body'].append(chunk)
+                yield chunk
+                if time.time() > deadline:
+                    state['truncated'] = True
+                if state['truncated']:
+                    break
+        except requests.exceptions.RequestException:
+            state['truncated'] = True
+
+    @traced('load_article', 'article')
+    def load_article(self, url):
+        """Load an article from the cache or the web, without rendering it.
+
+        Follows the caching rules of `stream_url_contents`.  Fetched
+        articles are saved to the cache.
+
+        :type url: str
+        :param url: The article url.
+
+        :rtype: tuple
+        :return: * The article metadata.
+                 * The raw HTML as bytes.
+                 * A bool specifying if the article is in the cache.
+
+        :raises: `requests.exceptions.RequestException` if the request
+            failed and the article is not cached.
+        """
+        article, html = None, None
+        if self.article_cache is not None:
+            article, html = self.article_cache.load(url)
+        now = time.time()
+        if article is not None and (
+                self.offline or
+                now - article['fetched'] < self.ARTICLE_FRESH_AGE):
+            stats.count('article_cache_hits')
+            return article, html, True
+        stats.count('article_cache_misses')
+        if self.offline:
+            raise requests.exceptions.ConnectionError(
+                self.OFFLINE_MESSAGE.format(url))
+        try:
+            raw_response, body, truncated = self.fetch(
+                url, self.get_validators(article))
+        except requests.exceptions.RequestException:
+            if article is not None:
+                return article, html, True
+            raise
+        if article is not None and \
+                raw_response.status_code == requests.codes.not_modified:
+            article['fetched'] = now
+            self.article_cache.save(article)
+            return article, html, True
+        encoding, encoding_source, _ = self.charset_detector.detect_stream(
+            raw_response.headers.get('Content-Type'), [body])
+        article = self.create_article(url, raw_response, encoding,
+                                      encoding_source, now, truncated)
+        cached = self.article_cache is not None and raw_response.ok
+        if cached:
+            self.article_cache.save(article, body)
+        return article, body, cached
+
+    def render_article(self, article, html, render_key):
+        """Render a cached article, reusing its cached render if any.
+
+        New renders are saved to the cache.
+
+        :type article: dict
+        :param article: The article metadata.
+
+        :type html: bytes
+        :param html: The raw HTML.
+
+        :type render_key: str
+        :param render_key: The current render settings key.
+
+        :rtype: str
+        :return: The formatted article.
+        """
+        contents = article['renders'].get(render_key)
+        if contents is None:
+            contents = self.render_html(
+                html.decode(article['encoding'], 'replace'),
+                article.get('truncated', False))
+            article['renders'][render_key] = contents
+            self.article_cache.save(article)
+        return contents
+
+    @traced('render_html', 'render')
+    def render_html(self, text, truncated=False):
+        """Render the given HTML as formatted text.
+
+        :type text: str
+        :param text: The HTML to render.
+
+        :type truncated: bool
+        :param truncated: Specifies if the HTML was cut short.
+
+        :rtype: str
+        :return: The formatted text.
+        """
+        stats.count('articles_rendered')
+        if self.extract_content:
+            text = ContentExtractor().extract(text)
+        contents = self.format_text(self.create_html_to_text().handle(text))
+        if truncated:
+            contents += self.TRUNCATED_MESSAGE
         return contents
+
+    def render_html_stream(self, chunks, encoding):
+        """Render HTML chunks as formatted text as they arrive.
+
+        Finished paragraphs are colored and yielded as soon as HTML2Text
+        outputs them.  The whitespace following a paragraph is held back
+        until the next one, so the joined output matches `render_html`.
+
+        :type chunks: iterable
+        :param chunks: The HTML as chunks of bytes.
+
+        :type encoding: str
+        :param encoding: The HTML encoding.
+
+        :rtype: generator
+        :return: Yields the formatted text in chunks.
+        """
+        decoder = codecs.getincrementaldecoder(encoding)('replace')
+        html_to_text = self.create_html_to_text()
+        pending = ''
+        for chunk in chunks:
+            contents = None
+            with span('render chunk', 'render', bytes=len(chunk)):
+                html_to_text.feed(decoder.decode(chunk))
+                # Wrapping needs the whole text.
+                if not html_to_text.body_width:
+                    pending += self.strip_unicode(html_to_text.flush())
+                    end = len(pending[:pending.rfind('\n\n') + 1].rstrip())
+                    if end:
+                        contents = self.format_markdown(pending[:end])
+                        pending = pending[end:]
+            if contents is not None:
+                yield contents
+        pending += self.strip_unicode(
+            html_to_text.handle(decoder.decode(b'', True)))
+        stats.count('articles_rendered')
+        yield self.format_markdown(pending)
+
+    def render_many(self, urls, max_workers=None):
+        """Fetch and render the given urls in parallel.
+
+        The articles are fetched by a pool of threads, since fetching waits
+        on the network, then converted by a pool of processes, since
+        HTML2Text and the colorizer are CPU bound pure Python.  Cached
+        renders skip the process pool.
+
+        A url that fails to fetch or render yields its error instead.  If
+        the caller stops early, such as when the pager is quit, the pending
+        fetches and renders are cancelled rather than waited for.
+
+        :type urls: list
+        :param urls: The urls to render.
+
+        :type max_workers: int
+        :param max_workers: The number of render processes, defaults to the
+            number of CPUs.
+
+        :rtype: generator
+        :return: Yields a (url, formatted contents) tuple per url, in the
+            order the renders complete.
+        """
+        render_key = self.get_render_key()
+        fetch_futures = {}
+        render_futures = {}
+        # Start the render processes before any fetch thread, see
+        # `create_render_executor`.
+        render_executor = create_render_executor(max_workers)
+        fetch_executor = ThreadPoolExecutor(self.POOL_SIZE)
+        pending = set()
+        try:
+            for url in urls:
+                future = fetch_executor.submit(self.load_article, url)
+                fetch_futures[future] = url
+            pending = set(fetch_futures)
+            while pending:
+                done, pending = futures.wait(
+                    pending, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    if future in render_futures:
+                        url, article, cached = render_futures.pop(future)
+                        try:
+                            contents = future.result()
+                        except Exception as e:
+                            yield url, self.format_error(e)
+                            continue
+                        stats.count('articles_rendered')
+                        if cached:
+                            article['renders'][render_key] = contents
+                            self.article_cache.save(article)
+                        yield url, contents
+                        continue
+                    url = fetch_futures.pop(future)
+                    try:
+                        article, html, cached = future.result()
+                    except Exception as e:
+                        yield url, self.format_error(e)
+                        continue
+                    contents = article['renders'].get(render_key)
+                    if contents is not None:
+                        yield url, contents
+                        continue
+                    future = render_executor.submit(
+                        render_html_in_process, self.config,
+                        self.extract_content, html, article['encoding'],
+                        article.get('truncated', False))
+                    render_futures[future] = (url, article, cached)
+                    pending.add(future)
+        finally:
+            # Only the fetches and renders already running are left to
+            # finish, in the background.
+            for future in pending:
+                future.cancel()
+            fetch_executor.shutdown(wait=False)
+            render_executor.shutdown(wait=False)
+
+    def request(self, url, headers=None):
+        """Send a streamed GET request through the pooled session.
+
+        Callers hold the host semaphore, see `get_host_semaphore`.
+
+        :type url: str
+        :param url: The url to request.
+
+        :type headers: dict
+        :param headers: Additional request headers.
+
+        :rtype: :class:`requests.Response`
+        :return: The streamed response, to be closed by the caller.
+
+        :raises: `requests.exceptions.RequestException` if the request
+            failed or timed out.
+        """
+        return self.session.get(
+            url,
+            headers=headers,
+            timeout=(self.CONNECT_TIMEOUT, self.READ_TIMEOUT),
+            stream=True)
+
+    def stream_url_contents(self, url):
+        """Generate the formatted contents of the given item's url in chunks.
+
+        Unless `extract_content` is set, the response is fed to HTML2Text as
+        it arrives and finished paragraphs are yielded right away, so a pager
+        shows the first screen of a long article after its first few KB.
+        Extracting the main content needs the whole page first.
+
+        Articles fetched within ARTICLE_FRESH_AGE, or any cached article
+        when `offline` is set, are rendered from the cache without any
+        request.  Older cached articles are revalidated
+        with a conditional GET and only downloaded again if they changed,
+        or shown as is if the request fails.
+
+        :type url: str
+        :param url: The url whose contents to fetch.
+
+        :rtype: generator
+        :return: Yields the formatted url contents in chunks.
+        """
+        article, html = None, None
+        if self.article_cache is not None:
+            with span('load article cache', 'cache', url=url):
+                article, html = self.article_cache.load(url)
+        render_key = self.get_render_key()
+        now = time.time()
+        if article is not None and (
+                self.offline or
+                now - article['fetched'] < self.ARTICLE_FRESH_AGE):
+            stats.count('article_cache_hits')
+            yield self.render_article(article, html, render_key)
+            return
+        stats.count('article_cache_misses')
+        if self.offline:
+            yield self.format_error(self.OFFLINE_MESSAGE.format(url))
+            return
+        headers = self.get_validators(article)
+        semaphore = self.get_host_semaphore(url)
+        with semaphore:
+            start = stats.timer()
+            try:
+                with span('request', 'http', url=url):
+                    raw_response = self.request(url, headers)
+            except requests.exceptions.RequestException as e:
+                stats.record_request(url, stats.timer() - start, 0,
+                                     'article', stats.request_error(e))
+                if article is not None:
+                    # Show the stale article rather than an error.
+                    yield self.render_article(article, html, render_key)
+                    return
+                yield self.format_error(e)
+                return
+            # The body is read as the pager shows it, so only the wait for
+            # the response headers counts as the request time.
+            stats.record_request(url, stats.timer() - start, 0, 'article',
+                                 stats.status_error(raw_response.status_code))
+            state = {'body': [], 'truncated': False}
+            try:
+                if article is not None and \
+                        raw_response.status_code == \
+                        requests.codes.not_modified:
+                    article['fetched'] = now
+                    self.article_cache.save(article)
+                    yield self.render_article(article, html, render_key)
+                    return
+                encoding, encoding_source, chunks = \
+                    self.charset_detector.detect_stream(
+                        raw_response.headers.get('Content-Type'),
+                        self.iter_body(raw_response, state))
+                if self.extract_content:
+                    # Finding the main content takes the whole page.
+                    renders = [self.render_html(
+                        b''.join(chunks).decode(encoding, 'replace'))]
+                else:
+                    renders = self.render_html_stream(chunks, encoding)
+                rendered = []
+                for contents in renders:
+                    rendered.append(contents)
+                    yield contents
+                if state['truncated']:
+                    rendered.append(self.TRUNCATED_MESSAGE)
+                    yield self.TRUNCATED_MESSAGE
+            finally:
+                raw_response.close()
+                stats.count('bytes', sum(len(chunk)
+                                         for chunk in state['body']))
+        if self.article_cache is not None and raw_response.ok:
+            article = self.create_article(url, raw_response, encoding,
+                                          encoding_source, now,
+                                          state['truncated'])
+            article['renders'][render_key] = ''.join(rendered)
+            self.article_cache.save(article, b''.join(state['body']))
+
+    def strip_unicode(self, text):
+        """Strip out non-ASCII characters.
+
+        :type text: str
+        :param text: The text to strip.
+
+        :rtype: str
+        :return: The ASCII only text.
+        """
+        return text.encode('ascii', 'ignore').decode('ascii')
+
+
+def create_render_executor(max_workers=None):
+    """Create the process pool of `WebViewer.render_many`.
+
+    Forking a process while other threads run copies the locks they hold,
+    such as those of the requests connection pools or the stats registry,
+    and can deadlock the child.  The fetch threads of `render_many`, and
+    the comment fetches a bundle build runs alongside, are such threads, so
+    the workers are forked from a single threaded forkserver.  Without one,
+    on Python 2, 3.6 and Windows, every worker is started right away.
+
+    :type max_workers: int
+    :param max_workers: The number of processes, defaults to the number of
+        CPUs.
+
+    :rtype: :class:`concurrent.futures.ProcessPoolExecutor`
+    :return: The process pool.
+    """
+    try:
+        context = multiprocessing.get_context('forkserver')
+        return ProcessPoolExecutor(max_workers, mp_context=context)
+    except (AttributeError, TypeError, ValueError):
+        # These pools start every worker on the first task.
+        executor = ProcessPoolExecutor(max_workers)
+        executor.submit(int).result()
+        return executor
+
+
+def render_html_in_process(config, extract_content, html, encoding,
+                           truncated):
+    """Render the given HTML in a worker process of `WebViewer.render_many`.
+
+    Defined at the module level so process pools can pickle it.
+
+    :type config: :class:`config.Config`
+    :param config: The config supplying the colors.
+
+    :type extract_content: bool
+    :param extract_content: See `WebViewer.extract_content`.
+
+    :type html: bytes
+    :param html: The raw HTML.
+
+    :type encoding: str
+    :param encoding: The HTML encoding.
+
+    :type truncated: bool
+    :param truncated: Specifies if the HTML was cut short.
+
+    :rtype: str
+    :return: The formatted text.
+    """
+    web_viewer = WebViewer(config=config)
+    web_viewer.extract_content = extract_content
+    return web_viewer.render_html(html.decode(encoding, 'replace'), truncated)
@@ -15,14 +15,18 @@ setup(
     version=__version__,
     license='Apache License 2.0',
     install_requires=[
-        'click>=5.1,<8.0',
+        'click>=7.0,<8.0',
         'colorama>=0.3.3,<1.0.0',
         'requests>=2.4.3,<3.0.0',
         'pygments>=2.0.2,<3.0.0',
         'prompt-toolkit>=1.0.0,<1.1.0',
         'six>=1.9.0,<2.0.0',
+        'futures>=3.0.0,<4.0.0; python_version < "3"',
     ],
     extras_require={
+        'lxml': [
+            'lxml>=3.4.0',
+        ],
         'testing': [
             'mock>=1.0.1,<2.0.0',
             'tox>=1.9.2,<2.0.0'
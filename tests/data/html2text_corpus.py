@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+import gzip
+import hashlib
+import io
+import os
+
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          'html2text')
+# The HTML2Text options to convert the corpus with, by settings name.
+SETTINGS = {
+    'default': {},
+    'links_each_paragraph': {
+        'body_width': 0,
+        'inline_links': False,
+        'links_each_paragraph': True,
+    },
+    'web_viewer': {
+        'body_width': 0,
+        'inline_links': False,
+        'skip_internal_links': False,
+    },
+}
+# The sha256 digests of the output of the original html2text, by corpus
+# file and settings name.
+expected_digests = {
+    'features.html': {
+        'default':
+            '9eb4a5bfdd930971d1dc5f7058067fee27af6ecddee7087781b2465ff928f55c',
+        'links_each_paragraph':
+            '1047e9e06c606496ae9e0ba326a85e21875c623c578831f7f8a34f25f0e71dbb',
+        'web_viewer':
+            '25e8c620638e631b2b76320f0dced138fff13974afd8c43270e4ef34b1f8ca83',
+    },
+    'rust_core_all.html.gz': {
+        'web_viewer':
+            '750c1c1e032eadcbd9d5b756d73031de390393a05502e36e6c27f20c792c7da7',
+    },
+    'rustdoc_how_to_write.html': {
+        'default':
+            '938c5b153d78fe01764f03f9b790919dac5cde6f9a3b036afa60300365b4043a',
+        'links_each_paragraph':
+            '757fc75ffee5a6f41c1c05150b1f9668707d2605c686360f67db6b3ee47bc16e',
+        'web_viewer':
+            'f43c977e6414ca59ae1d1234d2f765590fc68cf2892066e93c514c881302d4fd',
+    },
+    'rust_releases.html.gz': {
+        'default':
+            '0f2166527395071fb93b4946f32790bd72bd739d1422ce76afba34dd2d073160',
+        'links_each_paragraph':
+            'c8b2ff0c79b32d46dd17a91ca88efef428e1f01b9abbc0791c1993040b71e61d',
+        'web_viewer':
+            '0b06a9b0fdaecf7b199d58fa2f1bfb4fdba8b74a6a4db9d362472ccf90310e29',
+    },
+}
+
+
+def load_html(name):
+    """Load the given corpus file.
+
+    :type name: str
+    :param name: The corpus file name.
+
+    :rtype: str
+    :return: The HTML.
+    """
+    path = os.path.join(CORPUS_DIR, name)
+    if name.endswith('.gz'):
+        with gzip.open(path, 'rb') as html_file:
+            return html_file.read().decode('utf-8')
+    with io.open(path, encoding='utf-8') as html_file:
+        return html_file.read()
+
+
+def convert(html_to_text_class, name, settings_name,
+            tokenizer='html.parser'):
+    """Convert the given corpus file.
+
+    :type html_to_text_class: type
+    :param html_to_text_class: The HTML2Text class.
+
+    :type name: str
+    :param name: The corpus file name.
+
+    :type settings_name: str
+    :param settings_name: A key of SETTINGS.
+
+    :type tokenizer: str
+    :param tokenizer: The HTML2Text tokenizer.
+
+    :rtype: str
+    :return: The converted text.
+    """
+    html_to_text = html_to_text_class()
+    html_to_text.tokenizer = tokenizer
+    for option, value in SETTINGS[settings_name].items():
+        setattr(html_to_text, option, value)
+    return html_to_text.handle(load_html(name))
+
+
+def digest(text):
+    """Get the sha256 digest of the given text.
+
+    :type text: str
+    :param text: The text.
+
+    :rtype: str
+    :return: The hex digest.
+    """
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
@@ -111,6 +111,15 @@ class MockHackerNewsApi(object):
         except IndexError:
             raise InvalidItemID
 
+    def get_items(self, item_ids, max_workers=None):
+        items = []
+        for item_id in item_ids:
+            try:
+                items.append(self.get_item(item_id))
+            except InvalidItemID:
+                pass
+        return items
+
     def get_user(self, user_id):
         for user in self.users:
             if user.user_id == user_id:
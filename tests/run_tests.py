@@ -23,6 +23,26 @@ from test_haxor import HaxorTest  # NOQA
 from test_keys import KeysTest  # NOQA
 from test_toolbar import ToolbarTest  # NOQA
 from test_config import ConfigTest  # NOQA
+from test_bm25 import Bm25Test  # NOQA
+from test_aho_corasick import AhoCorasickTest  # NOQA
+from test_hiring_facets import HiringFacetsTest  # NOQA
+from test_article_cache import ArticleCacheTest  # NOQA
+from test_web_viewer import WebViewerTest  # NOQA
+from test_html2text import Html2TextTest  # NOQA
+from test_content_extractor import ContentExtractorTest  # NOQA
+from test_charset_detector import CharsetDetectorTest  # NOQA
+from test_bundle import BundleTest  # NOQA
+from test_cassette import CassetteTest  # NOQA
+from test_api_server import ApiServerTest  # NOQA
+from test_synthetic import SyntheticGeneratorTest  # NOQA
+from test_tracing import TracingTest  # NOQA
+from test_stats import StatsTest  # NOQA
+from test_metrics import MetricsTest  # NOQA
+from test_profiling import ProfilingTest  # NOQA
+from test_adaptive_concurrency import AdaptiveConcurrencyTest, \
+    BatchFetchConcurrencyTest  # NOQA
+from test_request_hedger import HedgedGetItemTest, \
+    RequestHedgerTest  # NOQA
 # from test_config_integration import ConfigTestIntegration  # NOQA
 try:
     from test_cli import CliTest  # NOQA
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+import threading
+
+import mock
+import requests
+from tests.compat import unittest
+
+from haxor_news.api_server import ApiServer
+from haxor_news.lib import stats, tracing
+from haxor_news.lib.haxor.haxor import AdaptiveConcurrency, HackerNewsApi, \
+    HTTPError
+
+
+class AdaptiveConcurrencyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = stats.reset()
+        self.now = 0.0
+        patcher = mock.patch('haxor_news.lib.stats.timer',
+                             side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.concurrency = AdaptiveConcurrency(4, minimum=1, maximum=6)
+
+    def run_round(self, outcome, latency=0.1):
+        starts = [self.concurrency.acquire()
+                  for _ in range(int(self.concurrency.limit))]
+        self.now += latency
+        for start in starts:
+            self.concurrency.release(start, outcome)
+
+    def test_increase_while_saturated(self):
+        self.run_round(AdaptiveConcurrency.OK)
+        assert 4 < self.concurrency.limit < 5
+        for _ in range(10):
+            self.run_round(AdaptiveConcurrency.OK)
+        assert self.concurrency.limit == 6
+        assert [limit for _, limit in self.concurrency.history] == [4, 5, 6]
+
+    def test_no_increase_below_limit(self):
+        for _ in range(10):
+            self.concurrency.release(self.concurrency.acquire(),
+                                     AdaptiveConcurrency.OK)
+        assert self.concurrency.limit == 4
+
+    def test_no_increase_when_slow(self):
+        self.run_round(AdaptiveConcurrency.OK, latency=0.1)
+        limit = self.concurrency.limit
+        self.run_round(AdaptiveConcurrency.OK, latency=1)
+        assert self.concurrency.limit == limit
+
+    def test_backoff_once_per_round(self):
+        self.run_round(AdaptiveConcurrency.OVERLOADED)
+        assert self.concurrency.limit == 2
+        self.run_round(AdaptiveConcurrency.OVERLOADED)
+        self.run_round(AdaptiveConcurrency.OVERLOADED)
+        assert self.concurrency.limit == 1
+        assert self.concurrency.backoffs == 3
+        assert self.registry.get('concurrency_backoffs') == 3
+        assert [limit for _, limit in self.concurrency.history] == [4, 2, 1]
+
+    def test_history_traced(self):
+        tracer = tracing.start_tracing()
+        self.addCleanup(tracing.stop_tracing)
+        self.concurrency = AdaptiveConcurrency(4, minimum=1, maximum=6)
+        self.run_round(AdaptiveConcurrency.OVERLOADED)
+        for _ in range(10):
+            self.run_round(AdaptiveConcurrency.OK)
+        limits = [event['args']['limit'] for event in tracer.events
+                  if event['name'] == 'concurrency_limit']
+        assert limits == [limit for _, limit in self.concurrency.history]
+        assert limits[:3] == [4, 2, 3]
+
+    def test_neutral(self):
+        self.run_round(AdaptiveConcurrency.NEUTRAL)
+        assert self.concurrency.limit == 4
+        assert self.concurrency.backoffs == 0
+
+    def test_get_outcome(self):
+        get_outcome = AdaptiveConcurrency.get_outcome
+        assert get_outcome(None) == AdaptiveConcurrency.OK
+        assert get_outcome(requests.exceptions.ReadTimeout()) == \
+            AdaptiveConcurrency.OVERLOADED
+        assert get_outcome(requests.exceptions.ConnectionError()) == \
+            AdaptiveConcurrency.OVERLOADED
+        assert get_outcome(HTTPError(429)) == AdaptiveConcurrency.OVERLOADED
+        assert get_outcome(HTTPError(503)) == AdaptiveConcurrency.OVERLOADED
+        assert get_outcome(HTTPError(404)) == AdaptiveConcurrency.NEUTRAL
+        assert get_outcome(HTTPError()) == AdaptiveConcurrency.NEUTRAL
+
+
+class BatchFetchConcurrencyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = stats.reset()
+        self.pages = dict(('item/{0}'.format(item_id),
+                           {'id': item_id, 'title': str(item_id)})
+                          for item_id in range(1, 201))
+        self.servers = []
+
+    def tearDown(self):
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+
+    def start(self, **kwargs):
+        server = ApiServer(self.pages, seed=0, **kwargs)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.servers.append(server)
+        return HackerNewsApi(base_url=server.base_url)
+
+    def test_backoff_on_errors(self):
+        api = self.start(error_rate=0.5)
+        api.get_items(range(1, 201))
+        assert api.concurrency.limit < HackerNewsApi.MAX_WORKERS
+        assert self.registry.get('concurrency_backoffs') > 0
+        assert self.registry.observations['concurrency_limit'] == \
+            [int(api.concurrency.limit)]
+        assert 'backoffs' in self.registry.summary()
+
+    def test_max_workers_caps_in_flight(self):
+        api = self.start()
+        acquire = api.concurrency.acquire
+        caps = []
+
+        def record_cap(cap=None):
+            caps.append(cap)
+            return acquire(cap)
+
+        with mock.patch.object(api.concurrency, 'acquire',
+                               side_effect=record_cap):
+            items = api.get_items(range(1, 11), max_workers=2)
+        assert [item.item_id for item in items] == list(range(1, 11))
+        assert set(caps) == set([2])
+        assert api.concurrency.in_flight == 0
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+import re
+from tests.compat import unittest
+
+from haxor_news.aho_corasick import AhoCorasick
+
+
+class AhoCorasickTest(unittest.TestCase):
+
+    def setUp(self):
+        self.keywords = ['Python', 'Go', 'C++', 'remote', 'he', 'she',
+                         'hers', 'New York']
+        self.matcher = AhoCorasick(self.keywords)
+
+    def test_matches(self):
+        text = 'Acme | New York or REMOTE | Python, C++ and Go'
+        assert self.matcher.matches(text) == \
+            ['Python', 'Go', 'C++', 'remote', 'New York']
+
+    def test_word_boundaries(self):
+        assert self.matcher.matches('Google, pythonic, remotely') == []
+        assert self.matcher.matches('golang') == []
+        assert self.matcher.matches('c++11') == ['C++']
+        assert self.matcher.matches('(go)') == ['Go']
+
+    def test_overlapping_keywords(self):
+        matcher = AhoCorasick(['he', 'she', 'his', 'hers', 'ushers'])
+        found = sorted((start, matcher.keywords[keyword_index])
+                       for start, keyword_index
+                       in matcher.find_all('ushers'))
+        assert found == [(0, 'ushers')]
+        matcher = AhoCorasick(['a b', 'b c', 'a b c'])
+        assert matcher.matches('a b c') == ['a b', 'b c', 'a b c']
+
+    def test_agrees_with_regex(self):
+        text = ('she sells go tools; he hers, python remote '
+                'new york python; c++ shell')
+        for keyword in self.keywords:
+            pattern = r'(?<!\w){0}(?!\w)'.format(re.escape(keyword.lower()))
+            expected = len(re.findall(pattern, text))
+            found = [keyword_index for _, keyword_index
+                     in self.matcher.find_all(text)
+                     if self.matcher.keywords[keyword_index] == keyword]
+            assert len(found) == expected, keyword
+
+    def test_empty(self):
+        assert AhoCorasick([]).matches('python') == []
+        assert AhoCorasick(['']).matches('python') == []
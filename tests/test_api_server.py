@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+import random
+import threading
+import time
+
+import requests
+from tests.compat import unittest
+
+from haxor_news.api_server import ApiServer, LatencyDistribution, \
+    TokenBucket
+from haxor_news.lib.haxor.haxor import HackerNewsApi, HTTPError, \
+    InvalidItemID
+
+
+class ApiServerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.pages = {
+            'topstories': [1, 2],
+            'item/1': {'id': 1, 'title': 'One', 'kids': [3]},
+            'item/2': {'id': 2, 'title': 'Two'},
+            'item/3': {'id': 3, 'text': 'Three'},
+            'user/foo': {'id': 'foo', 'karma': 1},
+        }
+        self.servers = []
+
+    def tearDown(self):
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+
+    def start(self, **kwargs):
+        server = ApiServer(self.pages, seed=0, **kwargs)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.servers.append(server)
+        return server, HackerNewsApi(base_url=server.base_url)
+
+    def test_routes(self):
+        server, api = self.start()
+        assert api.top_stories() == [1, 2]
+        assert api.get_item(1).kids == [3]
+        assert [item.title for item in api.get_items([2, 1])] == \
+            ['Two', 'One']
+        assert api.get_user('foo').karma == 1
+        assert api.get_max_item() == 3
+        assert api.updates() == {'items': [], 'profiles': []}
+        self.assertRaises(InvalidItemID, api.get_item, 9)
+        assert requests.get(server.base_url + 'item/1.json?print=pretty') \
+            .json()['title'] == 'One'
+        assert requests.get(server.base_url + 'item/1').status_code == 404
+        assert server.counts['requests'] == 10
+
+    def test_errors(self):
+        server, api = self.start(error_rate=1)
+        self.assertRaises(HTTPError, api.get_item, 1)
+        assert api.get_items([1, 2]) == []
+        assert server.counts['errors'] == 3
+
+    def test_rate_limit(self):
+        server, api = self.start(rate_limit=0.1, burst=2)
+        api.get_item(1)
+        api.get_item(2)
+        response = api.session.get(server.base_url + 'item/3.json')
+        assert response.status_code == 429
+        assert response.headers['Retry-After'] == '10'
+        assert server.counts['rate_limited'] == 1
+
+    def test_slow_body(self):
+        server, api = self.start(slow_body=0.2, slow_body_rate=1)
+        start = time.time()
+        response = requests.get(server.base_url + 'item/1.json',
+                                stream=True)
+        chunks = list(response.iter_content(4))
+        assert time.time() - start >= 0.2
+        assert b''.join(chunks) == \
+            requests.get(server.base_url + 'item/1.json').content
+        assert server.counts['slow_bodies'] == 2
+
+    def test_latency(self):
+        server, api = self.start(latency='fixed:0.1')
+        start = time.time()
+        api.get_item(1)
+        assert time.time() - start >= 0.1
+
+    def test_latency_distribution(self):
+        rng = random.Random(0)
+        assert LatencyDistribution('fixed:0.5', rng).sample() == 0.5
+        for spec in ('uniform:0.1,0.2', 'exponential:0.1',
+                     'lognormal:0.1,0.5'):
+            samples = [LatencyDistribution(spec, rng).sample()
+                       for _ in range(100)]
+            assert min(samples) > 0
+        assert 0.1 <= LatencyDistribution('uniform:0.1,0.2', rng).sample() \
+            <= 0.2
+        for spec in ('normal:1', 'fixed:a', 'uniform:1', 'fixed:-1'):
+            self.assertRaises(ValueError, LatencyDistribution, spec)
+
+    def test_token_bucket(self):
+        bucket = TokenBucket(rate=10, burst=2)
+        assert bucket.take() == 0
+        assert bucket.take() == 0
+        assert 0 < bucket.take() <= 0.1
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+import os
+import shutil
+import tempfile
+from tests.compat import unittest
+
+from haxor_news.article_cache import ArticleCache
+
+
+class ArticleCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.article_cache = ArticleCache(self.cache_dir)
+        self.url = 'https://example.com/article'
+        self.article = {
+            'url': self.url,
+            'etag': '"abc"',
+            'last_modified': None,
+            'encoding': 'utf-8',
+            'fetched': 1,
+            'renders': {'key': 'text'},
+        }
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_load_missing(self):
+        assert self.article_cache.load(self.url) == (None, None)
+
+    def test_save_and_load(self):
+        html = b'<p>article</p>' * 100
+        self.article_cache.save(self.article, html)
+        path = self.article_cache.get_path(self.url, '.html.z')
+        assert os.path.getsize(path) < len(html)
+        assert self.article_cache.load(self.url) == (self.article, html)
+        self.article['fetched'] = 2
+        self.article_cache.save(self.article)
+        article, cached_html = self.article_cache.load(self.url)
+        assert article['fetched'] == 2
+        assert cached_html == html
+
+    def test_save_max_renders(self):
+        for index in range(ArticleCache.MAX_RENDERS + 2):
+            self.article['renders'][str(index)] = 'text'
+        self.article_cache.save(self.article, b'')
+        article, _ = self.article_cache.load(self.url)
+        assert len(article['renders']) == ArticleCache.MAX_RENDERS
+
+    def test_load_corrupt(self):
+        self.article_cache.save(self.article, b'html')
+        path = self.article_cache.get_path(self.url, '.html.z')
+        with open(path, 'wb') as html_file:
+            html_file.write(b'corrupt')
+        assert self.article_cache.load(self.url) == (None, None)
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+import json
+from tests.compat import unittest
+
+from haxor_news.bm25 import Bm25Index
+
+
+class Bm25Test(unittest.TestCase):
+
+    def setUp(self):
+        self.docs = [
+            'Acme | Remote | <i>Python</i>, Django and Postgres',
+            'Initech | NYC | Java, Spring',
+            'Hooli | SF | Python, Python, Python and C++',
+            'Pied Piper | Palo Alto | Go, Rust',
+        ]
+        self.index = Bm25Index.build(self.docs)
+
+    def test_tokenize(self):
+        tokens = Bm25Index.tokenize('<p>Python &amp; C++ <a href="x">C#</a>')
+        assert tokens == ['python', 'c++', 'c#']
+        tokens = Bm25Index.tokenize('Don&#x27;t &quot;fly&quot; a&#x2F;b')
+        assert tokens == ['don', 't', 'fly', 'a', 'b']
+        assert Bm25Index.tokenize(None) == []
+
+    def test_top_k(self):
+        results = self.index.top_k('python', 10)
+        assert [doc_index for doc_index, _ in results] == [2, 0]
+        assert results[0][1] > results[1][1]
+
+    def test_top_k_limit(self):
+        results = self.index.top_k('python java rust', 2)
+        assert len(results) == 2
+
+    def test_top_k_no_match(self):
+        assert self.index.top_k('cobol', 10) == []
+        assert Bm25Index.build([]).top_k('python', 10) == []
+
+    def test_rare_terms_score_higher(self):
+        scores = self.index.score('django python')
+        assert scores[0] > scores[2]
+
+    def test_serialize(self):
+        data = json.loads(json.dumps(self.index.to_dict()))
+        index = Bm25Index.from_dict(data)
+        assert index.score('python remote') == \
+            self.index.score('python remote')
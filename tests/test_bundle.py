@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+import gzip
+import json
+import os
+import shutil
+import tempfile
+
+import mock
+from tests.compat import unittest
+
+from haxor_news.bundle import Bundle, BundleArticleCache, BundleBuilder, \
+    InvalidBundle, OfflineHackerNewsApi
+from haxor_news.lib.haxor.haxor import HTTPError, InvalidItemID, \
+    InvalidUserID
+from haxor_news.web_viewer import WebViewer
+
+
+class BundleTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'bundle.json.gz')
+        self.url = 'https://example.com/article'
+        self.bundle = Bundle()
+        self.bundle.pages = {
+            'topstories': [1, 2],
+            'newstories': [2],
+            'item/1': {'id': 1, 'by': 'foo', 'kids': [3], 'title': 'One',
+                       'url': self.url},
+            'item/2': {'id': 2, 'by': 'bar', 'title': 'Two'},
+            'item/3': {'id': 3, 'by': 'bar', 'kids': [4], 'text': 'Three'},
+            'item/4': {'id': 4, 'by': 'foo', 'text': 'Four'},
+            'user/foo': {'id': 'foo', 'karma': 1, 'submitted': [1, 4]},
+            'user/bar': {'id': 'bar', 'karma': 2, 'submitted': [2, 3]},
+        }
+        self.article = {
+            'url': self.url,
+            'encoding': 'windows-1252',
+            'fetched': 1,
+            'renders': {},
+        }
+        self.html = b'<p>caf\xe9</p>'
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_save_and_load(self):
+        BundleArticleCache(self.bundle).save(self.article, self.html)
+        self.bundle.hiring_id = 1
+        self.bundle.save(self.path)
+        bundle = Bundle.load(self.path)
+        assert bundle.pages == self.bundle.pages
+        assert bundle.hiring_id == 1
+        assert BundleArticleCache(bundle).load(self.url) == \
+            (self.article, self.html)
+        assert not os.path.exists(self.path + '.tmp')
+
+    def test_load_invalid(self):
+        self.assertRaises(InvalidBundle, Bundle.load, self.path)
+        with gzip.open(self.path, 'wb') as bundle_file:
+            bundle_file.write(json.dumps({'version': 0}).encode('utf-8'))
+        self.assertRaises(InvalidBundle, Bundle.load, self.path)
+
+    def test_article_cache(self):
+        article_cache = BundleArticleCache(self.bundle)
+        assert article_cache.load(self.url) == (None, None)
+        article_cache.save(self.article, self.html)
+        self.article['renders']['key'] = 'text'
+        article_cache.save(self.article)
+        article, html = article_cache.load(self.url)
+        assert article['renders'] == {'key': 'text'}
+        assert html == self.html
+
+    def test_offline_api(self):
+        api = OfflineHackerNewsApi(self.bundle)
+        assert api.top_stories(1) == [1]
+        assert api.get_item(1).title == 'One'
+        assert [item.item_id for item in api.get_items([4, 9, 3])] == [4, 3]
+        assert api.get_user('foo').karma == 1
+        self.assertRaises(InvalidItemID, api.get_item, 9)
+        self.assertRaises(InvalidUserID, api.get_user, 'baz')
+        self.assertRaises(HTTPError, api.ask_stories)
+
+    def test_build(self):
+        web_viewer = mock.Mock()
+        web_viewer.render_many.return_value = iter([(self.url, 'text')])
+        web_viewer.article_cache = BundleArticleCache(self.bundle)
+        web_viewer.article_cache.save(self.article, self.html)
+        builder = BundleBuilder(OfflineHackerNewsApi(self.bundle),
+                                web_viewer)
+        counts = builder.build(1, with_articles=True, monthly_posts=(2, 3))
+        assert counts == {'stories': 2, 'comments': 1, 'articles': 1}
+        pages = builder.bundle.pages
+        assert pages['topstories'] == [1]
+        assert pages['newstories'] == [2]
+        assert 'askstories' not in pages
+        assert sorted(pages) == ['item/1', 'item/2', 'item/3', 'item/4',
+                                 'newstories', 'topstories', 'user/bar',
+                                 'user/foo']
+        assert builder.bundle.articles[self.url]['article'] == self.article
+        web_viewer.render_many.assert_called_with([self.url])
+
+    def test_build_comments(self):
+        builder = BundleBuilder(OfflineHackerNewsApi(self.bundle),
+                                mock.Mock())
+        counts = builder.build(2, with_comments=True)
+        assert counts == {'stories': 2, 'comments': 2, 'articles': 0}
+        assert 'item/4' in builder.bundle.pages
+
+    def test_offline_web_viewer(self):
+        web_viewer = WebViewer()
+        web_viewer.article_cache = BundleArticleCache(self.bundle)
+        web_viewer.offline = True
+        with mock.patch('haxor_news.web_viewer.requests.Session.get') as \
+                mock_session_get:
+            assert 'Not available offline' in \
+                web_viewer.generate_url_contents(self.url)
+            web_viewer.article_cache.save(self.article, self.html)
+            assert 'caf' in web_viewer.generate_url_contents(self.url)
+            assert not mock_session_get.called
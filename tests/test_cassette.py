@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+import io
+import os
+import shutil
+import tempfile
+
+import mock
+import requests
+from tests.compat import unittest
+
+from haxor_news.cassette import Cassette, InvalidCassette, \
+    RecordingAdapter, ReplayAdapter, mount_cassette
+from haxor_news.lib.haxor.haxor import HackerNewsApi
+
+
+class CassetteTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'cassette.json.gz')
+        self.url = 'https://hacker-news.firebaseio.com/v0/item/1.json'
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def create_response(self, request, content):
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.headers = requests.structures.CaseInsensitiveDict({
+            'Content-Type': 'application/json; charset=utf-8',
+            'Content-Encoding': 'gzip',
+        })
+        response.raw = io.BytesIO(content)
+        response.url = request.url
+        response.request = request
+        return response
+
+    def record(self, contents):
+        cassette = Cassette()
+        api = HackerNewsApi()
+        mount_cassette(api.session, RecordingAdapter(cassette))
+        send = mock.Mock(side_effect=[
+            self.create_response(request, content)
+            for request, content in contents])
+        with mock.patch('requests.adapters.HTTPAdapter.send', send):
+            items = [api.get_item(1) for _ in contents]
+        return cassette, items
+
+    def test_record_and_replay(self):
+        request = requests.Request('GET', self.url).prepare()
+        cassette, items = self.record([
+            (request, b'{"id": 1, "title": "caf\xc3\xa9"}'),
+            (request, b'{"id": 1, "title": "Two"}'),
+        ])
+        assert [item.title for item in items] == [u'caf\xe9', 'Two']
+        interaction = cassette.interactions[0]
+        assert interaction['url'] == self.url
+        assert 'Content-Encoding' not in interaction['headers']
+        cassette.save(self.path)
+        api = HackerNewsApi()
+        mount_cassette(api.session,
+                       ReplayAdapter(Cassette.load(self.path), 0))
+        assert api.get_item(1).title == u'caf\xe9'
+        assert api.get_item(1).title == 'Two'
+        assert api.get_item(1).title == 'Two'
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            api.get_item(2)
+
+    @mock.patch('haxor_news.cassette.time.sleep')
+    def test_replay_latency(self, mock_sleep):
+        cassette = Cassette([{
+            'method': 'GET',
+            'url': self.url,
+            'status': 200,
+            'reason': 'OK',
+            'headers': {'Content-Type': 'text/html; charset=utf-8'},
+            'body': '<p>Text</p>',
+            'latency': 0.2,
+            'body_time': 0.4,
+        }])
+        session = requests.Session()
+        mount_cassette(session, ReplayAdapter(cassette, 0.5))
+        response = session.get(self.url, stream=True)
+        mock_sleep.assert_called_once_with(0.1)
+        assert response.encoding == 'utf-8'
+        assert b''.join(response.iter_content(4)) == b'<p>Text</p>'
+        mock_sleep.assert_called_with(0.2)
+        mock_sleep.reset_mock()
+        mount_cassette(session, ReplayAdapter(cassette, 0))
+        assert session.get(self.url).text == '<p>Text</p>'
+        assert not mock_sleep.called
+
+    def test_load_invalid(self):
+        self.assertRaises(InvalidCassette, Cassette.load, self.path)
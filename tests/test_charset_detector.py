@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+from __future__ import print_function
+from __future__ import division
+
+import codecs
+import mock
+from tests.compat import unittest
+
+from haxor_news.charset_detector import CharsetDetector
+from haxor_news.lib import stats
+
+
+class CharsetDetectorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.charset_detector = CharsetDetector()
+
+    def test_detect_bom(self):
+        head = codecs.BOM_UTF8 + b'<meta charset="latin-1">'
+        assert self.charset_detector.detect(
+            'text/html; charset=latin-1', head) == ('utf-8-sig', 'bom')
+
+    def test_detect_header(self):
+        head = b'<meta charset="utf-8">'
+        assert self.charset_detector.detect(
+            'text/html; charset="ISO-8859-1"', head) == \
+            ('iso8859-1', 'header')
+        assert self.charset_detector.detect(
+            'text/html; charset=unknown', head) == ('utf-8', 'meta')
+
+    def test_detect_meta(self):
+        head = (b'<html><head><meta http-equiv="Content-Type" '
+                b'content="text/html; charset=windows-1252"></head>')
+        assert self.charset_detector.detect('text/html', head) == \
+            ('cp1252', 'meta')
+        head = b' ' * CharsetDetector.META_SNIFF_SIZE + \
+            b'<meta charset="windows-1252">'
+        assert self.charset_detector.detect(None, head) == \
+            ('utf-8', 'sample')
+
+    def test_detect_sample(self):
+        head = u'<p>caf\xe9</p>'.encode('utf-8')
+        assert self.charset_detector.detect(None, head[:-5]) == \
+            ('utf-8', 'sample')
+        with mock.patch.object(self.charset_detector,
+                               'detect_statistically') as mock_detect:
+            mock_detect.return_value = 'cp1252'
+            head = u'<p>caf\xe9</p>'.encode('cp1252')
+            assert self.charset_detector.detect(None, head) == \
+                ('cp1252', 'sample')
+            mock_detect.assert_called_with(head)
+
+    @mock.patch('haxor_news.charset_detector.chardet')
+    def test_detect_statistically(self, mock_chardet):
+        mock_chardet.detect.return_value = {'encoding': 'Windows-1252',
+                                            'confidence': 0.9}
+        assert self.charset_detector.detect_statistically(b'\xe9') == \
+            'cp1252'
+        mock_chardet.detect.return_value = {'encoding': 'Windows-1252',
+                                            'confidence': 0.1}
+        assert self.charset_detector.detect_statistically(b'\xe9') is None
+        mock_chardet.detect.return_value = {'encoding': None,
+                                            'confidence': None}
+        assert self.charset_detector.detect_statistically(b'\xe9') is None
+
+    def test_detect_stream(self):
+        def generate_chunks():
+            yield b'<p>' + b'a' * CharsetDetector.SAMPLE_SIZE
+            raise AssertionError('Read past the sample')
+        encoding, source, chunks = self.charset_detector.detect_stream(
+            None, generate_chunks())
+        assert (encoding, source) == ('utf-8', 'sample')
+        assert next(chunks) == b'<p>' + b'a' * CharsetDetector.SAMPLE_SIZE
+
+    def test_detect_stream_header(self):
+        registry = stats.reset()
+        first = b'<p>caf\xe9</p>'
+
+        def generate_chunks():
+            yield first
+            raise AssertionError('Read past the first chunk')
+
+        encoding, source, chunks = self.charset_detector.detect_stream(
+            'text/html; charset=latin-1', generate_chunks())
+        assert (encoding, source) == ('iso8859-1', 'header')
+        assert next(chunks) is first
+        assert registry.get('charset_header') == 1
+        assert 'charset header 1' in registry.summary()
+
+    def test_detect_stream_meta(self):
+        def generate_chunks():
+            yield b'<meta charset="windows-1252">'
+            yield b' ' * CharsetDetector.META_SNIFF_SIZE
+            raise AssertionError('Read past the <meta> sniff size')
+
+        encoding, source, _ = self.charset_detector.detect_stream(
+            'text/html', generate_chunks())
+        assert (encoding, source) == ('cp1252', 'meta')
+
+    @mock.patch('haxor_news.charset_detector.CharsetDetector.'
+                'detect_statistically')
+    def test_detect_stream_full(self, mock_detect):
+        mock_detect.side_effect = [None, 'cp1252']
+        chunks = [b'\xe9' * CharsetDetector.SAMPLE_SIZE, b'\xe9']
+        encoding, source, body = self.charset_detector.detect_stream(
+            'text/html', chunks)
+        assert (encoding, source) == ('cp1252', 'full')
+        assert list(body) == [b''.join(chunks)]
+        mock_detect.side_effect = [None, None]
+        encoding, source, body = self.charset_detector.detect_stream(
+            'text/html', chunks)
+        assert (encoding, source) == ('utf-8', 'default')
@@ -83,6 +83,11 @@ class CompleterTest(unittest.TestCase):
         expected = ['ask']
         self.verify_completions(text, expected)
 
+    def test_arg_bundle(self):
+        text = ['hn bundle ']
+        expected = ['build']
+        self.verify_completions(text, expected)
+
     def test_arg_freelance(self):
         text = ['hn freelance ']
         expected = ['"(?i)(Python|Django)"']
@@ -98,6 +103,11 @@ class CompleterTest(unittest.TestCase):
         expected = ['10']
         self.verify_completions(text, expected)
 
+    def test_arg_read(self):
+        text = ['hn read ']
+        expected = ['top']
+        self.verify_completions(text, expected)
+
     def test_arg_user(self):
         text = ['hn user ']
         expected = ['"user"']
@@ -108,11 +118,33 @@ class CompleterTest(unittest.TestCase):
         expected = ['1']
         self.verify_completions(text, expected)
 
+    def test_option_bundle(self):
+        text = ['hn bundle build ']
+        expected = [
+            '--top 30',
+            '-t 30',
+            '--with_comments',
+            '-wc',
+            '--with_articles',
+            '-wa',
+        ]
+        self.verify_completions(text, expected)
+
     def test_option_freelance(self):
         text = ['hn freelance "" ']
         expected = [
             '--id_post ' + str(freelancer_post_id),
             '-i ' + str(freelancer_post_id),
+            '--rank',
+            '-r',
+            '--limit 10',
+            '-l 10',
+            '--keywords ""',
+            '-k ""',
+            '--months 12',
+            '-m 12',
+            '--where "remote and salary>150k"',
+            '-w "remote and salary>150k"',
         ]
         self.verify_completions(text, expected)
 
@@ -121,6 +153,16 @@ class CompleterTest(unittest.TestCase):
         expected = [
             '--id_post ' + str(who_is_hiring_post_id),
             '-i ' + str(who_is_hiring_post_id),
+            '--rank',
+            '-r',
+            '--limit 10',
+            '-l 10',
+            '--keywords ""',
+            '-k ""',
+            '--months 12',
+            '-m 12',
+            '--where "remote and salary>150k"',
+            '-w "remote and salary>150k"',
         ]
         self.verify_completions(text, expected)
 
@@ -149,6 +191,8 @@ class CompleterTest(unittest.TestCase):
             '-cc',
             '--browser',
             '-b',
+            '--main_content',
+            '-mc',
         ]
         self.verify_completions(text, expected)
 
@@ -169,6 +213,8 @@ class CompleterTest(unittest.TestCase):
             '-cc',
             '--browser',
             '-b',
+            '--main_content',
+            '-mc',
         ]
         self.verify_completions(text, expected)
 
@@ -16,6 +16,8 @@
 from __future__ import print_function
 from __future__ import division
 
+import calendar
+from datetime import datetime
 import mock
 import os
 from tests.compat import unittest
@@ -47,6 +49,85 @@ class ConfigTest(unittest.TestCase):
         assert self.hn.config.item_cache == []
         mock_save_cache.assert_called_with()
 
+    def test_get_hiring_ids_expire(self):
+        config = self.hn.config
+        now = calendar.timegm(datetime(2021, 3, 2, 12).timetuple())
+        next_month = calendar.timegm(datetime(2021, 4, 1).timetuple())
+        posted = calendar.timegm(datetime(2021, 3, 1, 16).timetuple())
+        assert config.get_hiring_ids_expire(posted, now) == next_month
+        # The new posts for March are not up yet.
+        posted = calendar.timegm(datetime(2021, 2, 1, 16).timetuple())
+        assert config.get_hiring_ids_expire(posted, now) == \
+            now + config.HIRING_IDS_RETRY_TTL
+        assert config.get_hiring_ids_expire(now=now) == \
+            now + config.HIRING_IDS_RETRY_TTL
+        now = calendar.timegm(datetime(2021, 12, 31, 23, 30).timetuple())
+        assert config.get_hiring_ids_expire(now=now) == \
+            calendar.timegm(datetime(2022, 1, 1).timetuple())
+
+    @mock.patch('haxor_news.config.Config.save_cache')
+    def test_load_hiring_and_freelance_ids_cached(self, mock_save_cache):
+        config = self.hn.config
+        config.hiring_id = 1
+        config.freelance_id = 2
+        config.hiring_ids_expire = config.get_hiring_ids_expire(
+            post_time=None) + 60
+        resolve_posts = mock.Mock()
+        config.load_hiring_and_freelance_ids(resolve_posts=resolve_posts)
+        assert not resolve_posts.called
+        assert not mock_save_cache.called
+        assert (config.hiring_id, config.freelance_id) == (1, 2)
+
+    @mock.patch('haxor_news.config.time.time')
+    @mock.patch('haxor_news.config.requests.get')
+    @mock.patch('haxor_news.config.Config.save_cache')
+    def test_load_hiring_and_freelance_ids_resolved(self, mock_save_cache,
+                                                    mock_requests_get,
+                                                    mock_time):
+        config = self.hn.config
+        config.hiring_ids_expire = 0
+        mock_time.return_value = calendar.timegm(
+            datetime(2021, 3, 2).timetuple())
+        posted = calendar.timegm(datetime(2021, 3, 1, 16).timetuple())
+        resolve_posts = mock.Mock(return_value=(
+            {'id': 10, 'time': posted}, {'id': 11, 'time': posted}))
+        config.load_hiring_and_freelance_ids(resolve_posts=resolve_posts)
+        assert (config.hiring_id, config.freelance_id) == (10, 11)
+        assert config.hiring_ids_expire == calendar.timegm(
+            datetime(2021, 4, 1).timetuple())
+        assert not mock_requests_get.called
+        mock_save_cache.assert_called_with()
+
+    @mock.patch('haxor_news.config.requests.get')
+    @mock.patch('haxor_news.config.Config.save_cache')
+    def test_load_hiring_and_freelance_ids_from_url(self, mock_save_cache,
+                                                    mock_requests_get):
+        config = self.hn.config
+        config.hiring_ids_expire = 0
+        mock_requests_get.return_value.text = (
+            "freelancer_post_id = 21\n"
+            "who_is_hiring_post_id = 20\n")
+        config.load_hiring_and_freelance_ids(
+            resolve_posts=mock.Mock(return_value=None))
+        assert (config.hiring_id, config.freelance_id) == (20, 21)
+        assert config.hiring_ids_expire > 0
+        mock_save_cache.assert_called_with()
+        assert not os.path.exists('downloaded_settings.py')
+
+    @mock.patch('haxor_news.config.requests.get')
+    @mock.patch('haxor_news.config.Config.'
+                'load_hiring_and_freelance_ids_from_cache_or_defaults')
+    @mock.patch('haxor_news.config.Config.save_cache')
+    def test_load_hiring_and_freelance_ids_fallback(self, mock_save_cache,
+                                                    mock_from_cache,
+                                                    mock_requests_get):
+        self.hn.config.hiring_ids_expire = 0
+        mock_requests_get.return_value.text = 'not settings'
+        self.hn.config.load_hiring_and_freelance_ids(
+            resolve_posts=mock.Mock(return_value=None))
+        mock_from_cache.assert_called_with()
+        assert not mock_save_cache.called
+
     def test_save_and_load_item_ids(self):
         self.hn.config.item_ids = [0, 1, 2]
         self.hn.config.item_cache = [3, 4, 5]
@@ -30,6 +30,7 @@ class ConfigTestIntegration(unittest.TestCase):
         self.hn = HackerNews()
         self.hn.hacker_news_api = MockHackerNewsApi()
         self.limit = len(self.hn.hacker_news_api.items)
+        self.hn.config.hiring_ids_expire = 0
 
     def test_load_hiring_and_freelance_ids(self):
         self.hn.config.load_hiring_and_freelance_ids()
@@ -40,7 +41,7 @@ class ConfigTestIntegration(unittest.TestCase):
         self.hn.config.load_hiring_and_freelance_ids(url='https://example.com')
         assert self.hn.config.hiring_id == who_is_hiring_post_id
         assert self.hn.config.freelance_id == freelancer_post_id
-        os.remove('./downloaded_settings.py')
+        assert not os.path.exists('downloaded_settings.py')
 
     def test_load_hiring_and_freelance_ids_from_cache_or_defaults(self):
         self.hn.config.load_hiring_and_freelance_ids_from_cache_or_defaults()
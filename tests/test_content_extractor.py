@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+
+from __future__ import print_function
+from __future__ import division
+
+from tests.compat import unittest
+
+from haxor_news.content_extractor import ContentExtractor
+from tests.data.html2text_corpus import load_html
+
+
+class ContentExtractorTest(unittest.TestCase):
+
+    PARAGRAPH = ('<p>A paragraph long enough to count, with a comma, and '
+                 'another comma, about the article topic.</p>')
+
+    def setUp(self):
+        self.content_extractor = ContentExtractor()
+
+    def test_extract(self):
+        html = load_html('blog_post.html')
+        content = self.content_extractor.extract(html)
+        assert len(content) < len(html) / 5
+        assert content.startswith('<html><body><h1 class="post-title">')
+        assert 'for chunk in stream:' in content
+        assert '<blockquote>' in content
+        for clutter in ('site-nav', 'Popular posts', 'share-buttons',
+                        'Related posts', 'comment-author', 'Copyright',
+                        'analytics.push'):
+            assert clutter not in content, clutter
+
+    def test_extract_documentation_page(self):
+        html = load_html('rustdoc_how_to_write.html')
+        content = self.content_extractor.extract(html)
+        assert len(content) < len(html) * 0.6
+        assert content.startswith('<html><body><h1 class="menu-title">')
+        assert 'Good documentation is not natural.' in content
+        assert 'towards the bottom.' in content
+        for clutter in ('Keyboard shortcuts', 'theme-list', 'searchbar',
+                        'nav-chapters', '<script'):
+            assert clutter not in content, clutter
+
+    def test_extract_whole_page(self):
+        html = load_html('features.html')
+        assert self.content_extractor.extract(html) == html
+        html = '<html><body><div>' + self.PARAGRAPH + '</div></body></html>'
+        assert self.content_extractor.extract(html) == html
+
+    def test_extract_siblings(self):
+        html = ('<html><body><div class="menu">' +
+                '<a href="/">Home</a>' * 20 + '</div><div>' +
+                '<div>' + self.PARAGRAPH * 4 + '</div>' +
+                '<div>' + self.PARAGRAPH * 3 + '</div></div>' +
+                '<div class="footer">' + self.PARAGRAPH + '</div>' +
+                '</body></html>')
+        assert self.content_extractor.extract(html) == (
+            '<html><body>' + '<div>' + self.PARAGRAPH * 4 + '</div>' +
+            '<div>' + self.PARAGRAPH * 3 + '</div></body></html>')
+
+    def test_extract_unclosed_tags(self):
+        paragraph = self.PARAGRAPH[:-len('</p>')]
+        html = ('<html><body><ul><li><a href="/">Home</a><li><a href="/a">'
+                'About</a></ul><div class="post">' + paragraph * 5 +
+                '<div class="comments"><p>First')
+        content = self.content_extractor.extract(html)
+        assert content == ('<html><body><div class="post">' +
+                           paragraph * 5 + '<div class="comments"><p>First'
+                           '</body></html>')
+
+    def test_extract_link_density(self):
+        links = ('<p>' + '<a href="/post">A related post title, with a '
+                 'comma</a> ' * 5 + '</p>')
+        html = ('<html><body><div class="a">' + links * 6 + '</div>'
+                '<div class="b">' + self.PARAGRAPH * 4 + '</div>'
+                '</body></html>')
+        assert self.content_extractor.extract(html) == (
+            '<html><body><div class="b">' + self.PARAGRAPH * 4 +
+            '</div></body></html>')
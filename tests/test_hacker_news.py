@@ -17,16 +17,24 @@ from __future__ import print_function
 from __future__ import division
 
 import mock
+import os
+import shutil
+import tempfile
 from tests.compat import unittest
 
+from haxor_news.bm25 import Bm25Index
+from haxor_news.bundle import Bundle, OfflineHackerNewsApi
 from haxor_news.hacker_news import HackerNews
+from haxor_news.lib.haxor.haxor import InvalidUserID
+from haxor_news.thread_cache import ThreadCache
 from tests.data.comment import formatted_comment, formatted_heading, raw_comment
 from tests.data.item import formatted_items
 from tests.data.markdown import formatted_markdown, raw_markdown
 from tests.data.regex import raw_text_for_regex
 from tests.data.tip import formatted_tip
 from tests.data.title import formatted_title, raw_title
-from tests.mock_hacker_news_api import MockHackerNewsApi
+from tests.mock_hacker_news_api import MockHackerNewsApi, MockItem, \
+    MockUser
 
 
 class HackerNewsTest(unittest.TestCase):
@@ -34,11 +42,16 @@ class HackerNewsTest(unittest.TestCase):
     def setUp(self):
         self.hn = HackerNews()
         self.hn.hacker_news_api = MockHackerNewsApi()
+        self.cache_dir = tempfile.mkdtemp()
+        self.hn.thread_cache = ThreadCache(self.cache_dir)
         self.limit = len(self.hn.hacker_news_api.items)
         self.valid_id = 0
         self.invalid_id = 9000
         self.query = 'foo'
 
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
     def top(self, limit=2):
         self.hn.print_items(
             message=self.headlines_message('Top'),
@@ -79,6 +92,130 @@ class HackerNewsTest(unittest.TestCase):
         self.hn.hiring_and_freelance(self.query, post_id=self.invalid_id)
         mock_print_item_not_found.assert_called_with(self.invalid_id)
 
+    def test_find_monthly_posts(self):
+        titles = [
+            'Ask HN: Who is hiring? (March 2021)',
+            'Ask HN: Freelancer? Seeking freelancer? (March 2021)',
+            'Ask HN: Who wants to be hired? (March 2021)',
+            'Ask HN: Who is hiring? (February 2021)',
+            'Ask HN: Who is hiring? (January 2021)',
+        ]
+        items = []
+        for index, title in enumerate(titles):
+            item = MockItem()
+            item.item_id = 100 + index
+            item.title = title
+            items.append(item)
+        user = MockUser()
+        user.submitted = [item.item_id for item in items]
+        api = self.hn.hacker_news_api
+        with mock.patch.object(api, 'get_user', return_value=user), \
+                mock.patch.object(api, 'get_items',
+                                  side_effect=lambda ids: [
+                                      item for item in items
+                                      if item.item_id in ids]) \
+                as mock_get_items:
+            posts = self.hn.find_monthly_posts('hiring', 2)
+            assert [post['id'] for post in posts] == [100, 103]
+            assert [self.hn.format_month(post) for post in posts] == \
+                ['March 2021', 'February 2021']
+            mock_get_items.reset_mock()
+            posts = self.hn.find_monthly_posts('freelance', 1)
+            assert [post['id'] for post in posts] == [101]
+            mock_get_items.assert_called_with([])
+
+    @mock.patch('haxor_news.hacker_news.HackerNews.find_monthly_posts')
+    def test_resolve_hiring_and_freelance_posts(self,
+                                                mock_find_monthly_posts):
+        hiring_post = {'id': 1, 'title': 'hiring', 'time': 0}
+        freelance_post = {'id': 2, 'title': 'freelance', 'time': 0}
+        mock_find_monthly_posts.side_effect = lambda kind, months: {
+            'hiring': [hiring_post],
+            'freelance': [freelance_post],
+        }[kind]
+        assert self.hn.resolve_hiring_and_freelance_posts() == \
+            (hiring_post, freelance_post)
+        mock_find_monthly_posts.side_effect = InvalidUserID
+        assert self.hn.resolve_hiring_and_freelance_posts() is None
+        mock_find_monthly_posts.side_effect = None
+        mock_find_monthly_posts.return_value = []
+        assert self.hn.resolve_hiring_and_freelance_posts() is None
+
+    @mock.patch('haxor_news.hacker_news.HackerNews.load_thread')
+    @mock.patch('haxor_news.hacker_news.HackerNews.find_monthly_posts')
+    @mock.patch('haxor_news.hacker_news.click.echo')
+    def test_hiring_and_freelance_months(self, mock_click_echo,
+                                         mock_find_monthly_posts,
+                                         mock_load_thread):
+        mock_find_monthly_posts.return_value = [
+            {'id': 1, 'title': 'Ask HN: Who is hiring? (May 2021)',
+             'time': 0},
+            {'id': 2, 'title': 'Ask HN: Who is hiring? (April 2021)',
+             'time': 0},
+        ]
+        mock_load_thread.side_effect = lambda post_id: {
+            'comments': [{'id': 10 + post_id, 'by': 'foo', 'time': 0,
+                          'text': 'Python {0}'.format(post_id)}],
+        }
+        self.hn.hiring_and_freelance_months('Python 2', 'hiring', 2)
+        mock_find_monthly_posts.assert_called_with('hiring', 2)
+        mock_click_echo.assert_any_call('Python 2', color=True)
+        assert mock.call('Python 1', color=True) not in \
+            mock_click_echo.mock_calls
+
+    @mock.patch('haxor_news.hacker_news.HackerNews.print_keyword_counts')
+    @mock.patch('haxor_news.hacker_news.click.echo')
+    def test_hiring_and_freelance_keywords(self, mock_click_echo,
+                                           mock_print_keyword_counts):
+        self.hn.hiring_and_freelance_keywords(['bar', 'baz'], self.valid_id)
+        mock_click_echo.assert_any_call('text bar', color=True)
+        mock_print_keyword_counts.assert_called_with({'bar': 1, 'baz': 0})
+
+    def test_parse_keywords(self):
+        lines = ['Python\n', '\n', '# languages\n', 'python\n', ' Go \n']
+        assert self.hn.parse_keywords(lines) == ['Python', 'Go']
+
+    @mock.patch('haxor_news.hacker_news.click.echo')
+    def test_hiring_and_freelance_where(self, mock_click_echo):
+        item = self.hn.hacker_news_api.get_item(1)
+        text = item.text
+        item.text = 'Bar | Remote | $150k'
+        try:
+            self.hn.hiring_and_freelance_where('remote and salary>100k',
+                                               self.valid_id)
+            self.hn.hiring_and_freelance_where('salary>200k', self.valid_id)
+        finally:
+            item.text = text
+        mock_click_echo.assert_any_call('Bar | Remote | $150k', color=True)
+        assert len(mock_click_echo.mock_calls) == 2
+
+    @mock.patch('haxor_news.hacker_news.click.secho')
+    def test_hiring_and_freelance_where_invalid(self, mock_click_secho):
+        self.hn.hiring_and_freelance_where('salary>>1', self.valid_id)
+        assert 'Error' in mock_click_secho.call_args[0][0]
+
+    @mock.patch('haxor_news.hacker_news.click.echo')
+    def test_hiring_and_freelance_ranked(self, mock_click_echo):
+        self.hn.hiring_and_freelance_ranked('bar', self.valid_id, self.limit)
+        mock_click_echo.assert_any_call('text bar', color=True)
+        assert len(mock_click_echo.mock_calls) == 2
+
+    @mock.patch('haxor_news.hacker_news.click.echo')
+    def test_hiring_and_freelance_ranked_stale_index(self, mock_click_echo):
+        thread = self.hn.load_thread(self.valid_id)
+        thread['index'] = {'postings': {}, 'doc_lengths': [1, 1]}
+        with mock.patch.object(self.hn, 'load_thread', return_value=thread):
+            self.hn.hiring_and_freelance_ranked('bar', self.valid_id,
+                                                self.limit)
+        mock_click_echo.assert_any_call('text bar', color=True)
+        assert thread['index']['version'] == Bm25Index.VERSION
+
+    @mock.patch('haxor_news.hacker_news.HackerNews.print_item_not_found')
+    def test_hiring_and_freelance_ranked_invalid(self,
+                                                 mock_print_item_not_found):
+        self.hn.hiring_and_freelance_ranked('bar', self.invalid_id, self.limit)
+        mock_print_item_not_found.assert_called_with(self.invalid_id)
+
     @mock.patch('haxor_news.hacker_news.HackerNews.print_items')
     def test_jobs(self, mock_print_items):
         self.hn.jobs(self.limit)
@@ -86,6 +223,57 @@ class HackerNewsTest(unittest.TestCase):
             message=self.hn.headlines_message('Jobs'),
             item_ids=self.hn.hacker_news_api.ask_stories(self.limit))
 
+    def test_load_thread(self):
+        thread = self.hn.load_thread(self.valid_id)
+        assert thread['kids'] == [1]
+        assert [comment['text'] for comment in thread['comments']] == \
+            ['text bar']
+        assert self.hn.thread_cache.load(self.valid_id) == thread
+
+    def test_load_thread_fetches_new_comments(self):
+        self.hn.load_thread(self.valid_id)
+        item = self.hn.hacker_news_api.get_item(self.valid_id)
+        item.kids = [1, 2]
+        with mock.patch.object(self.hn.hacker_news_api, 'get_item',
+                               wraps=self.hn.hacker_news_api.get_item) \
+                as mock_get_item:
+            thread = self.hn.load_thread(self.valid_id)
+            mock_get_item.assert_has_calls([mock.call(0), mock.call(2)])
+            assert len(mock_get_item.mock_calls) == 2
+        assert thread['kids'] == [1, 2]
+        assert len(thread['index']['doc_lengths']) == 2
+
+    def test_load_thread_final(self):
+        thread = self.hn.load_thread(self.valid_id)
+        thread['time'] = 1
+        thread['fetched'] = 2 + self.hn.THREAD_FINAL_AGE
+        self.hn.thread_cache.save(thread)
+        with mock.patch.object(self.hn.hacker_news_api,
+                               'get_item') as mock_get_item:
+            assert self.hn.load_thread(self.valid_id) == thread
+            assert not mock_get_item.called
+
+    def test_load_thread_final_refresh(self):
+        # Cached while the thread was young, then opened once it is final.
+        thread = self.hn.load_thread(self.valid_id)
+        thread['time'] = 1
+        thread['fetched'] = 2
+        self.hn.thread_cache.save(thread)
+        item = self.hn.hacker_news_api.get_item(self.valid_id)
+        item.kids = [1, 2]
+        with mock.patch.object(self.hn.hacker_news_api, 'get_item',
+                               wraps=self.hn.hacker_news_api.get_item) \
+                as mock_get_item:
+            assert self.hn.load_thread(self.valid_id)['kids'] == [1, 2]
+            assert mock_get_item.called
+        thread = self.hn.thread_cache.load(self.valid_id)
+        thread['time'] = 1
+        self.hn.thread_cache.save(thread)
+        with mock.patch.object(self.hn.hacker_news_api,
+                               'get_item') as mock_get_item:
+            assert self.hn.load_thread(self.valid_id)['kids'] == [1, 2]
+            assert not mock_get_item.called
+
     @mock.patch('haxor_news.hacker_news.HackerNews.print_items')
     def test_new(self, mock_print_items):
         self.hn.new(self.limit)
@@ -164,6 +352,15 @@ class HackerNewsTest(unittest.TestCase):
             index, self.hn.QUERY_UNSEEN, comments_expected,
             comments_hide_non_matching, browser)
 
+    @mock.patch('haxor_news.hacker_news.HackerNews.view')
+    def test_view_setup_main_content(self, mock_view):
+        self.hn.view_setup(0, None, False, False, False, False, False, False)
+        assert not self.hn.web_viewer.extract_content
+        self.hn.view_setup(0, None, False, False, False, False, False, False,
+                           main_content=True)
+        assert self.hn.web_viewer.extract_content
+        mock_view.assert_called_with(0, None, False, False, False)
+
     def test_format_comment(self):
         item = self.hn.hacker_news_api.get_item(self.valid_id)
         item.text = raw_comment
@@ -309,9 +506,9 @@ class HackerNewsTest(unittest.TestCase):
         regex_query = 'minutes ago'
         assert not self.hn.match_regex(item, regex_query)
 
-    @mock.patch('haxor_news.hacker_news.WebViewer.generate_url_contents')
+    @mock.patch('haxor_news.hacker_news.WebViewer.stream_url_contents')
     @mock.patch('haxor_news.hacker_news.click')
-    def test_view(self, mock_click, mock_generate_url_contents):
+    def test_view(self, mock_click, mock_stream_url_contents):
         items = self.hn.hacker_news_api.items
         self.hn.config.item_ids = [int(item.item_id) for item in items]
         one_based_index = self.valid_id + 1
@@ -321,11 +518,61 @@ class HackerNewsTest(unittest.TestCase):
         browser = False
         self.hn.view(one_based_index, comments_query, comments,
                      comments_hide_non_matching, browser)
-        mock_generate_url_contents.assert_called_with(
+        mock_stream_url_contents.assert_called_with(
             items[self.valid_id].url)
         assert mock_click.secho.mock_calls
         assert mock_click.echo_via_pager.mock_calls
 
+    @mock.patch('haxor_news.hacker_news.click')
+    def test_load_bundle(self, mock_click):
+        bundle = Bundle()
+        bundle.hiring_id = 1
+        bundle.freelance_id = 2
+        bundle.pages = {
+            'topstories': [1],
+            'item/1': {'id': 1, 'by': 'foo', 'descendants': 0, 'score': 1,
+                       'time': 0, 'title': 'One', 'url': 'one.com'},
+        }
+        self.hn.bundle_path = os.path.join(self.cache_dir, 'bundle.json.gz')
+        bundle.save(self.hn.bundle_path)
+        self.hn.load_bundle()
+        assert self.hn.web_viewer.offline
+        self.hn.load_hiring_and_freelance_ids()
+        assert (self.hn.config.hiring_id, self.hn.config.freelance_id) == \
+            (1, 2)
+        with mock.patch.object(self.hn.config, 'save_cache'):
+            self.hn.top(10)
+        assert self.hn.config.item_ids == [1]
+
+    @mock.patch('haxor_news.config.requests.get')
+    def test_load_hiring_and_freelance_ids_offline(self, mock_requests_get):
+        mock_requests_get.side_effect = AssertionError('Sent a request')
+        self.hn.bundle = Bundle()
+        self.hn.hacker_news_api = OfflineHackerNewsApi(self.hn.bundle)
+        self.hn.config.hiring_id = 0
+        self.hn.config.hiring_ids_expire = 0
+        with mock.patch.object(self.hn.config, 'load_config'):
+            self.hn.load_hiring_and_freelance_ids()
+        assert self.hn.config.hiring_id
+        assert self.hn.config.freelance_id
+        assert not mock_requests_get.called
+
+    @mock.patch('haxor_news.hacker_news.WebViewer.render_many')
+    @mock.patch('haxor_news.hacker_news.click')
+    def test_read(self, mock_click, mock_render_many):
+        mock_click.style.side_effect = lambda text, fg=None: text
+        items = self.hn.hacker_news_api.items
+        items[0].url = None
+        mock_render_many.side_effect = lambda urls: iter(
+            [(url, 'Contents of ' + url) for url in reversed(urls)])
+        self.hn.read('top', 3)
+        contents = ''.join(mock_click.echo_via_pager.call_args[0][0])
+        mock_render_many.assert_called_with(['bar.com', 'baz.com'])
+        assert contents == ('\n' + items[2].title + '\nbaz.com\n\n'
+                            'Contents of baz.com'
+                            '\n' + items[1].title + '\nbar.com\n\n'
+                            'Contents of bar.com')
+
     @mock.patch('haxor_news.hacker_news.HackerNews.print_comments')
     @mock.patch('haxor_news.hacker_news.click')
     def test_view_comments(self, mock_click, mock_print_comments):
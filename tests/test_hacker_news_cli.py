@@ -16,12 +16,17 @@
 from __future__ import print_function
 from __future__ import division
 
+import json
+import os
+
 import mock
 from tests.compat import unittest
 
 from click.testing import CliRunner
 
+from haxor_news.bundle import InvalidBundle
 from haxor_news.hacker_news_cli import HackerNewsCli
+from haxor_news.lib import tracing
 
 
 class HackerNewsCliTest(unittest.TestCase):
@@ -49,6 +54,121 @@ class HackerNewsCliTest(unittest.TestCase):
         mock_hn_call.assert_called_with(self.limit)
         assert result.exit_code == 0
 
+    @mock.patch('haxor_news.hacker_news_cli.HackerNews.build_bundle')
+    def test_bundle_build(self, mock_hn_call):
+        result = self.runner.invoke(
+            self.hacker_news_cli.cli, ['bundle', 'build'])
+        mock_hn_call.assert_called_with(30, False, False)
+        assert result.exit_code == 0
+        result = self.runner.invoke(
+            self.hacker_news_cli.cli,
+            ['bundle', 'build', '--top', '50', '--with_comments', '-wa'])
+        mock_hn_call.assert_called_with(50, True, True)
+        assert result.exit_code == 0
+
+    @mock.patch('haxor_news.hacker_news_cli.HackerNews.top')
+    def test_cassette(self, mock_hn_call):
+        with self.runner.isolated_filesystem():
+            result = self.runner.invoke(
+                self.hacker_news_cli.cli, ['--replay', 'top.json.gz', 'top'])
+            assert result.exit_code == 1
+            result = self.runner.invoke(
+                self.hacker_news_cli.cli, ['--record', 'top.json.gz', 'top'])
+            assert result.exit_code == 0
+            with mock.patch('haxor_news.hacker_news_cli.HackerNews.'
+                            'use_cassette') as mock_use_cassette:
+                result = self.runner.invoke(
+                    self.hacker_news_cli.cli,
+                    ['--replay', 'top.json.gz', '--replay_latency', '0',
+                     'top'])
+                assert mock_use_cassette.call_args[1] == \
+                    {'latency_scale': 0}
+            assert result.exit_code == 0
+        mock_hn_call.assert_called_with(self.limit)
+
+    @mock.patch('haxor_news.hacker_news_cli.HackerNews.top')
+    def test_stats(self, mock_hn_call):
+        result = self.runner.invoke(self.hacker_news_cli.cli, ['top'])
+        assert 'Stats: ' not in result.output
+        result = self.runner.invoke(
+            self.hacker_news_cli.cli, ['--stats', 'top'])
+        assert result.exit_code == 0
+        assert 'Stats: ' in result.output
+        mock_hn_call.assert_called_with(self.limit)
+
+    @mock.patch('haxor_news.hacker_news_cli.HackerNews.top')
+    def test_metrics(self, mock_hn_call):
+        with self.runner.isolated_filesystem():
+            for _ in range(2):
+                result = self.runner.invoke(
+                    self.hacker_news_cli.cli, ['--metrics', 'hn.prom', 'top'])
+                assert result.exit_code == 0
+            with open('hn.prom') as metrics_file:
+                assert 'hn_runs_total{command="top"} 2\n' in \
+                    metrics_file.read()
+        mock_hn_call.assert_called_with(self.limit)
+
+    @mock.patch('haxor_news.hacker_news_cli.HackerNews.top')
+    def test_profile(self, mock_hn_call):
+        with self.runner.isolated_filesystem():
+            result = self.runner.invoke(
+                self.hacker_news_cli.cli, ['--profile', 'cpu', 'top'])
+            assert result.exit_code == 0
+            assert 'Profile saved to hn-top.pstats' in result.output
+            assert os.path.exists('hn-top.pstats')
+            result = self.runner.invoke(
+                self.hacker_news_cli.cli,
+                ['--profile', 'cpu', '--profile_file', 'top.pstats', 'top'])
+            assert result.exit_code == 0
+            assert os.path.exists('top.pstats')
+            result = self.runner.invoke(
+                self.hacker_news_cli.cli, ['--profile', 'io', 'top'])
+            assert result.exit_code == 2
+        mock_hn_call.assert_called_with(self.limit)
+
+    @mock.patch('haxor_news.hacker_news_cli.HackerNews.top')
+    @mock.patch('haxor_news.hacker_news.HackerNewsApi.enable_hedging')
+    def test_hedge(self, mock_enable_hedging, mock_hn_call):
+        result = self.runner.invoke(self.hacker_news_cli.cli, ['top'])
+        assert not mock_enable_hedging.called
+        result = self.runner.invoke(
+            self.hacker_news_cli.cli, ['--hedge', 'top'])
+        assert result.exit_code == 0
+        mock_enable_hedging.assert_called_with()
+        mock_hn_call.assert_called_with(self.limit)
+
+    @mock.patch('haxor_news.hacker_news_cli.HackerNews.top')
+    def test_trace(self, mock_hn_call):
+        with self.runner.isolated_filesystem():
+            result = self.runner.invoke(
+                self.hacker_news_cli.cli, ['--trace', 'top.json', 'top'])
+            assert result.exit_code == 0
+            with open('top.json') as trace_file:
+                events = json.load(trace_file)['traceEvents']
+        assert 'hn top' in [event['name'] for event in events]
+        assert tracing.tracer is None
+        mock_hn_call.assert_called_with(self.limit)
+
+    @mock.patch('haxor_news.hacker_news_cli.HackerNews.load_bundle')
+    @mock.patch('haxor_news.hacker_news_cli.HackerNews.top')
+    def test_offline(self, mock_hn_call, mock_load_bundle):
+        result = self.runner.invoke(self.hacker_news_cli.cli, ['top'])
+        assert not mock_load_bundle.called
+        result = self.runner.invoke(
+            self.hacker_news_cli.cli, ['--offline', 'top'])
+        assert mock_load_bundle.called
+        mock_hn_call.assert_called_with(self.limit)
+        assert result.exit_code == 0
+        mock_load_bundle.reset_mock()
+        result = self.runner.invoke(
+            self.hacker_news_cli.cli, ['top'], env={'HAXOR_OFFLINE': '1'})
+        assert mock_load_bundle.called
+        mock_load_bundle.side_effect = InvalidBundle('Cannot read bundle')
+        result = self.runner.invoke(
+            self.hacker_news_cli.cli, ['--offline', 'top'])
+        assert result.exit_code == 1
+        assert 'hn bundle build' in result.output
+
     @mock.patch('haxor_news.hacker_news_cli.HackerNews.hiring_and_freelance')
     def test_hiring(self, mock_hn_call):
         result = self.runner.invoke(
@@ -56,6 +176,57 @@ class HackerNewsCliTest(unittest.TestCase):
         mock_hn_call.assert_called_with(self.dummy, 1)
         assert result.exit_code == 0
 
+    @mock.patch('haxor_news.hacker_news_cli.HackerNews.'
+                'hiring_and_freelance_ranked')
+    def test_hiring_rank(self, mock_hn_call):
+        result = self.runner.invoke(
+            self.hacker_news_cli.cli,
+            ['hiring', self.dummy, '-i', 1, '--rank', '-l', 5])
+        mock_hn_call.assert_called_with(self.dummy, 1, 5)
+        assert result.exit_code == 0
+
+    @mock.patch('haxor_news.hacker_news_cli.HackerNews.'
+                'hiring_and_freelance_keywords')
+    def test_hiring_keywords(self, mock_hn_call):
+        with self.runner.isolated_filesystem():
+            with open('keywords.txt', 'w') as keywords_file:
+                keywords_file.write('Python\nRust\n')
+            result = self.runner.invoke(
+                self.hacker_news_cli.cli,
+                ['hiring', '-i', 1, '--keywords', 'keywords.txt'])
+        mock_hn_call.assert_called_with(['Python', 'Rust'], 1, None)
+        assert result.exit_code == 0
+
+    @mock.patch('haxor_news.hacker_news_cli.HackerNews.'
+                'hiring_and_freelance_months')
+    def test_hiring_months(self, mock_hn_call):
+        result = self.runner.invoke(
+            self.hacker_news_cli.cli, ['hiring', self.dummy, '--months', 12])
+        mock_hn_call.assert_called_with(self.dummy, 'hiring', 12)
+        assert result.exit_code == 0
+
+    @mock.patch('haxor_news.hacker_news_cli.HackerNews.'
+                'hiring_and_freelance_where')
+    def test_hiring_where(self, mock_hn_call):
+        result = self.runner.invoke(
+            self.hacker_news_cli.cli,
+            ['hiring', '-i', 1, '--where', 'remote and salary>150k'])
+        mock_hn_call.assert_called_with('remote and salary>150k', 1, None)
+        assert result.exit_code == 0
+
+    @mock.patch('haxor_news.hacker_news_cli.HackerNews.'
+                'hiring_and_freelance_where')
+    @mock.patch('haxor_news.hacker_news_cli.HackerNews.'
+                'hiring_and_freelance_ranked')
+    def test_hiring_exclusive_options(self, mock_ranked, mock_where):
+        for command in ('hiring', 'freelance'):
+            result = self.runner.invoke(
+                self.hacker_news_cli.cli,
+                [command, self.dummy, '-i', 1, '--rank', '--where', 'remote'])
+            assert 'cannot be combined' in result.output
+        assert not mock_ranked.called
+        assert not mock_where.called
+
     @mock.patch('haxor_news.hacker_news_cli.HackerNews.hiring_and_freelance')
     def test_freelance(self, mock_hn_call):
         result = self.runner.invoke(
@@ -94,6 +265,19 @@ class HackerNewsCliTest(unittest.TestCase):
         mock_hn_call.assert_called_with(self.limit)
         assert result.exit_code == 0
 
+    @mock.patch('haxor_news.hacker_news_cli.HackerNews.read')
+    def test_read(self, mock_hn_call):
+        result = self.runner.invoke(self.hacker_news_cli.cli, ['read'])
+        mock_hn_call.assert_called_with('top', self.limit)
+        assert result.exit_code == 0
+        result = self.runner.invoke(
+            self.hacker_news_cli.cli, ['read', 'show', '30'])
+        mock_hn_call.assert_called_with('show', 30)
+        assert result.exit_code == 0
+        result = self.runner.invoke(
+            self.hacker_news_cli.cli, ['read', 'jobs'])
+        assert result.exit_code != 0
+
     @mock.patch('haxor_news.hacker_news_cli.HackerNews.user')
     def test_user(self, mock_hn_call):
         result = self.runner.invoke(
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+from tests.compat import unittest
+
+from haxor_news.hiring_facets import HiringFacets, InvalidWhereExpression, \
+    WhereFilter
+
+
+class HiringFacetsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.facets = HiringFacets()
+        self.comments = [
+            {'text': ('Acme | Senior Engineer | New York, NY | REMOTE | '
+                      '$150k - $200k | Visa sponsorship<p>We build rockets.')},
+            {'text': 'Initech | SF | ONSITE | 120-140K<p>No remote, sorry.'},
+            {'text': ('Hooli | Backend Engineer | London (no remote) | '
+                      '&#163;80,000 to &#163;95,000 + 401k')},
+            {'text': 'Looking for a cofounder, ping me.'},
+            {'text': None},
+        ]
+        self.columns = self.facets.extract(self.comments)
+
+    def test_extract(self):
+        assert self.columns['company'] == \
+            ['Acme', 'Initech', 'Hooli', '', '']
+        assert self.columns['location'] == \
+            ['New York, NY', 'SF', 'London (no remote)', '', '']
+        assert self.columns['remote'] == [True, False, False, False, False]
+        assert self.columns['salary_min'] == \
+            [150000, 120000, 80000, None, None]
+        assert self.columns['salary_max'] == \
+            [200000, 140000, 95000, None, None]
+        assert self.columns['visa'] == [True, False, False, False, False]
+
+    def test_parse_salary(self):
+        assert self.facets.parse_salary('90k') == (90000, 90000)
+        assert self.facets.parse_salary('EUR 60,000') == (60000, 60000)
+        assert self.facets.parse_salary('150k-200') == (150000, 200000)
+        assert self.facets.parse_salary('Series A | 50 people | 2021') == \
+            (None, None)
+        assert self.facets.parse_salary('401k match') == (None, None)
+        assert self.facets.parse_salary(u'\u20ac60k \u2013 \u20ac80k') == \
+            (60000, 80000)
+        assert self.facets.parse_salary(u'\u00a350k\u201470k') == \
+            (50000, 70000)
+
+    def test_parse_header_no_visa(self):
+        fields = self.facets.parse_header('Foo | Berlin | no visa sponsorship')
+        assert not fields['visa']
+        assert fields['location'] == 'Berlin'
+
+    def test_where(self):
+        expected = {
+            'remote and salary>150k': [0],
+            'salary>=120k and not remote': [1],
+            'salary<100k': [2],
+            'salary=130k': [1],
+            'location~"new york" or visa': [0],
+            'company=initech': [1],
+            "(remote or location~'london') and salary<160k": [0, 2],
+            'not salary>0': [3, 4],
+            'company!=acme and remote': [],
+        }
+        for expression, rows in expected.items():
+            assert WhereFilter(expression).filter(self.columns) == rows, \
+                expression
+
+    def test_where_invalid(self):
+        for expression in ['remote and', 'salary~100k', 'foo>1',
+                           'salary>abc', '(remote', 'remote)', 'location>1',
+                           'salary 100k']:
+            with self.assertRaises(InvalidWhereExpression):
+                WhereFilter(expression)
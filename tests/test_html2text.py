@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+from tests.compat import unittest
+
+from haxor_news.lib.html2text import html2text
+from haxor_news.lib.html2text.html2text import HTML2Text, lxml_etree, \
+    resolve_tokenizer
+from tests.data.html2text_corpus import SETTINGS, convert, digest, \
+    expected_digests, load_html
+
+
+class Html2TextTest(unittest.TestCase):
+
+    def test_corpus(self):
+        for name, digests in sorted(expected_digests.items()):
+            for settings_name, expected in sorted(digests.items()):
+                text = convert(HTML2Text, name, settings_name)
+                assert digest(text) == expected, (name, settings_name)
+
+    def test_previous_index(self):
+        html_to_text = HTML2Text()
+        links = [
+            {'href': 'https://example.com/'},
+            {'href': 'https://example.com/', 'title': 'Example'},
+            {'href': 'https://example.org/'},
+        ]
+        for link in links:
+            html_to_text.append_link(link)
+        assert html_to_text.previousIndex({'href': 'https://example.com/'}) \
+            == 0
+        assert html_to_text.previousIndex(
+            {'href': 'https://example.com/', 'title': 'Example'}) == 1
+        assert html_to_text.previousIndex(
+            {'href': 'https://example.com/', 'title': 'Other'}) is None
+        assert html_to_text.previousIndex({'title': 'Example'}) is None
+
+    def test_flush(self):
+        html_to_text = HTML2Text()
+        html_to_text.body_width = 0
+        html_to_text.tokenizer = 'html.parser'
+        html_to_text.feed('<p>One&nbsp;two</p><p>Thr')
+        assert html_to_text.flush() == ''
+        # The text cut by the chunk boundary is held back until the next
+        # tag, the paragraph is output once it is known to end.
+        html_to_text.feed('ee</p>')
+        assert html_to_text.flush() == 'One two\n\n'
+        assert html_to_text.flush() == ''
+        assert html_to_text.handle('<p>Four</p>') == 'Three\n\nFour\n'
+
+    def test_resolve_tokenizer(self):
+        assert resolve_tokenizer('html.parser') == 'html.parser'
+        self.assertRaises(ValueError, resolve_tokenizer, 'html5-parser')
+        saved_lxml_etree = html2text.lxml_etree
+        try:
+            html2text.lxml_etree = None
+            assert resolve_tokenizer('auto') == 'html.parser'
+            self.assertRaises(ImportError, resolve_tokenizer, 'lxml')
+        finally:
+            html2text.lxml_etree = saved_lxml_etree
+
+    @unittest.skipIf(lxml_etree is None, 'lxml is not installed')
+    def test_lxml_tokenizer_corpus(self):
+        names = sorted(set(expected_digests) | set(['blog_post.html']))
+        for name in names:
+            for settings_name in sorted(SETTINGS):
+                assert convert(HTML2Text, name, settings_name, 'lxml') == \
+                    convert(HTML2Text, name, settings_name), \
+                    (name, settings_name)
+
+    @unittest.skipIf(lxml_etree is None, 'lxml is not installed')
+    def test_lxml_tokenizer_chunks(self):
+        html = load_html('blog_post.html') + \
+            '<p>&amp;&#169;&#x27;&nbsp;&unknown; &amp</p>'
+        texts = []
+        for tokenizer in ('html.parser', 'lxml'):
+            html_to_text = HTML2Text()
+            html_to_text.tokenizer = tokenizer
+            for index in range(0, len(html), 7):
+                html_to_text.feed(html[index:index + 7])
+            texts.append(html_to_text.close())
+        assert texts[0] == texts[1]
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from tests.compat import unittest
+
+from haxor_news.lib import metrics
+from haxor_news.lib.metrics import MetricsFile, write_metrics
+from haxor_news.lib.stats import Stats
+
+
+class MetricsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'hn.prom')
+        self.registry = Stats()
+        self.registry.record_request('https://a/item/1.json', 0.25, 100,
+                                     'item')
+        self.registry.record_request('https://a/item/2.json', 0.5, 0,
+                                     'item', 'timeout')
+        self.registry.count('article_cache_hits', 3)
+        self.registry.count('article_cache_misses')
+        self.registry.observe('comment_tree_size', 120)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_format(self):
+        metrics = MetricsFile()
+        metrics.add_stats(self.registry, 'view')
+        metrics.derive(now=1500000000)
+        lines = metrics.format().splitlines()
+        assert '# TYPE hn_request_duration_seconds histogram' in lines
+        item_lines = [line for line in lines
+                      if line.startswith('hn_request_duration_seconds')]
+        assert item_lines[2:5] == [
+            'hn_request_duration_seconds_bucket{endpoint="item",le="0.1"} 0',
+            'hn_request_duration_seconds_bucket{endpoint="item",le="0.25"} 1',
+            'hn_request_duration_seconds_bucket{endpoint="item",le="0.5"} 2',
+        ]
+        assert item_lines[-3:] == [
+            'hn_request_duration_seconds_bucket{endpoint="item",le="+Inf"} 2',
+            'hn_request_duration_seconds_sum{endpoint="item"} 0.75',
+            'hn_request_duration_seconds_count{endpoint="item"} 2',
+        ]
+        assert '# TYPE hn_request_errors_total counter' in lines
+        assert 'hn_request_errors_total{type="timeout"} 1' in lines
+        assert 'hn_cache_hit_ratio{cache="article"} 0.75' in lines
+        assert not any(line.startswith('hn_cache_hit_ratio{cache="thread"')
+                       for line in lines)
+        assert 'hn_comment_tree_size_bucket{le="100"} 0' in lines
+        assert 'hn_comment_tree_size_bucket{le="250"} 1' in lines
+        assert 'hn_runs_total{command="view"} 1' in lines
+        assert 'hn_last_run_timestamp_seconds 1500000000' in lines
+
+    def test_write_metrics_cumulative(self):
+        write_metrics(self.path, self.registry, 'view')
+        write_metrics(self.path, Stats(), 'top')
+        # No temporary file is left behind, only the lock file.
+        assert [name for name in os.listdir(self.temp_dir)
+                if name != 'hn.prom.lock'] == ['hn.prom']
+        samples = MetricsFile.load(self.path).samples
+        assert samples[('hn_runs_total', 'command="view"')] == 1
+        assert samples[('hn_runs_total', 'command="top"')] == 1
+        assert samples[('hn_request_duration_seconds_count',
+                        'endpoint="item"')] == 2
+        assert samples[('hn_comment_tree_size_count', '')] == 1
+        write_metrics(self.path, self.registry, 'view')
+        samples = MetricsFile.load(self.path).samples
+        assert samples[('hn_runs_total', 'command="view"')] == 2
+        assert samples[('hn_request_errors_total', 'type="timeout"')] == 2
+        assert samples[('hn_cache_lookups_total',
+                        'cache="article",result="hit"')] == 6
+        assert samples[('hn_cache_hit_ratio', 'cache="article"')] == 0.75
+
+    def test_load_missing(self):
+        assert MetricsFile.load(self.path).samples == {}
+
+    @unittest.skipIf(metrics.fcntl is None, 'File locks need fcntl')
+    def test_concurrent_writes(self):
+        script = '\n'.join([
+            'import sys',
+            'from haxor_news.lib.metrics import write_metrics',
+            'from haxor_news.lib.stats import Stats',
+            'for _ in range(25):',
+            '    write_metrics(sys.argv[1], Stats(), "top")',
+        ])
+        processes = [subprocess.Popen([sys.executable, '-c', script,
+                                       self.path])
+                     for _ in range(4)]
+        for process in processes:
+            assert process.wait() == 0
+        samples = MetricsFile.load(self.path).samples
+        assert samples[('hn_runs_total', 'command="top"')] == 100
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+import io
+import os
+import pstats
+import shutil
+import tempfile
+
+from tests.compat import unittest
+
+from haxor_news.lib import profiling
+from haxor_news.lib.profiling import CommandProfiler
+
+
+def allocate():
+    return [str(index) * 10 for index in range(10000)]
+
+
+class ProfilingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_get_default_path(self):
+        assert CommandProfiler.get_default_path('cpu', 'view') == \
+            'hn-view.pstats'
+        assert CommandProfiler.get_default_path('mem', 'top') == \
+            'hn-top.mem.txt'
+
+    def test_cpu(self):
+        path = os.path.join(self.temp_dir, 'view.pstats')
+        profiler = CommandProfiler('cpu', path)
+        assert not profiler.stop()
+        profiler.start()
+        allocate()
+        assert profiler.stop()
+        assert not profiler.stop()
+        functions = [function for _, _, function in
+                     pstats.Stats(path).stats]
+        assert 'allocate' in functions
+        assert os.listdir(self.temp_dir) == ['view.pstats']
+
+    @unittest.skipIf(profiling.tracemalloc is None, 'needs tracemalloc')
+    def test_mem(self):
+        path = os.path.join(self.temp_dir, 'view.txt')
+        profiler = CommandProfiler('mem', path)
+        profiler.start()
+        data = allocate()
+        assert profiler.stop()
+        with io.open(path, encoding='utf-8') as report_file:
+            report = report_file.read()
+        assert report.startswith('Peak traced memory: ')
+        assert 'test_profiling.py' in report
+        assert 'str(index) * 10' in report
+        assert data
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+import subprocess
+import sys
+import threading
+import time
+
+import mock
+from tests.compat import unittest
+
+from haxor_news.lib import stats
+from haxor_news.lib.haxor.haxor import HackerNewsApi, HTTPError, \
+    RequestHedger
+
+
+class RequestHedgerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.hedger = RequestHedger(percentile=0.9, budget=0.05)
+
+    def test_delay(self):
+        for latency in range(RequestHedger.MIN_SAMPLES, 1, -1):
+            self.hedger.record(latency)
+            assert self.hedger.get_delay() is None
+        self.hedger.record(1)
+        assert self.hedger.get_delay() == 18
+
+    def test_budget(self):
+        for _ in range(19):
+            self.hedger.get_delay()
+        assert not self.hedger.try_hedge()
+        self.hedger.get_delay()
+        assert self.hedger.try_hedge()
+        assert not self.hedger.try_hedge()
+        assert self.hedger.hedges == 1
+
+
+class HedgedGetItemTest(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = stats.reset()
+        self.api = HackerNewsApi(base_url='http://localhost/v0/')
+        hedger = RequestHedger(budget=1)
+        for _ in range(RequestHedger.MIN_SAMPLES):
+            hedger.record(0.01)
+        self.api.enable_hedging(hedger)
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+
+    def response(self, data):
+        response = mock.Mock()
+        response.json.return_value = data
+        return response
+
+    def test_hedge_wins(self):
+        responses = [self.response({'id': 1, 'title': 'Slow'}),
+                     self.response({'id': 1, 'title': 'Hedge'})]
+
+        def get(url, timeout=None):
+            response = responses.pop(0)
+            if response.json()['title'] == 'Slow':
+                self.release.wait(5)
+            return response
+
+        with mock.patch.object(self.api, '_get', side_effect=get):
+            assert self.api.get_item(1).title == 'Hedge'
+        assert self.registry.get('hedged_requests') == 1
+        assert self.registry.get('hedge_wins') == 1
+
+    def test_fast_request_not_hedged(self):
+        with mock.patch.object(
+                self.api, '_get',
+                return_value=self.response({'id': 1})) as mock_get:
+            assert self.api.get_item(1).item_id == 1
+        assert mock_get.call_count == 1
+        assert self.registry.get('hedged_requests') == 0
+
+    def test_hedge_failure(self):
+        calls = []
+
+        def get(url, timeout=None):
+            calls.append((url, timeout))
+            if len(calls) == 1:
+                self.release.wait(0.2)
+                return self.response({'id': 1, 'title': 'Slow'})
+            raise HTTPError(503)
+
+        with mock.patch.object(self.api, '_get', side_effect=get):
+            assert self.api.get_item(1).title == 'Slow'
+        url = 'http://localhost/v0/item/1.json'
+        assert calls == [(url, None),
+                         (url, (HackerNewsApi.CONNECT_TIMEOUT,
+                                HackerNewsApi.HEDGE_READ_TIMEOUT))]
+        assert self.registry.get('hedge_wins') == 0
+
+    def test_loser_does_not_delay_exit(self):
+        script = '\n'.join([
+            'import time',
+            'import mock',
+            'from haxor_news.lib.haxor.haxor import HackerNewsApi, '
+            'RequestHedger',
+            'api = HackerNewsApi(base_url="http://localhost/v0/")',
+            'hedger = RequestHedger(budget=1)',
+            'for _ in range(RequestHedger.MIN_SAMPLES):',
+            '    hedger.record(0.01)',
+            'api.enable_hedging(hedger)',
+            'calls = []',
+            'def get(url, timeout=None):',
+            '    calls.append(url)',
+            '    if len(calls) == 1:',
+            '        time.sleep(30)',
+            '    response = mock.Mock()',
+            '    response.json.return_value = {"id": 1}',
+            '    return response',
+            'api._get = get',
+            'print(api.get_item(1).item_id)',
+        ])
+        start = time.time()
+        output = subprocess.check_output([sys.executable, '-c', script])
+        assert output.strip() == b'1'
+        assert time.time() - start < 15
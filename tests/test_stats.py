@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+import mock
+import requests
+from tests.compat import unittest
+
+from haxor_news.lib import stats
+from haxor_news.lib.haxor.haxor import HackerNewsApi, HTTPError
+
+
+class StatsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = stats.reset()
+
+    def test_count(self):
+        stats.count('items_rendered')
+        stats.count('items_rendered', 2)
+        assert self.registry.get('items_rendered') == 3
+        assert self.registry.get('articles_rendered') == 0
+
+    def test_record_request(self):
+        stats.record_request('https://a/1', 0.2, 100, 'item')
+        stats.record_request('https://a/2', 0.5, 50, 'item', 'http_500')
+        stats.record_request('https://a/3', 0.1, 0, 'article')
+        assert self.registry.get('requests') == 3
+        assert self.registry.get('request_errors') == 1
+        assert self.registry.get('bytes') == 150
+        assert self.registry.errors == {'http_500': 1}
+        assert self.registry.latencies == {'item': [0.2, 0.5],
+                                           'article': [0.1]}
+        assert self.registry.slowest_request == (0.5, 'https://a/2')
+
+    def test_error_types(self):
+        assert stats.request_error(
+            requests.exceptions.ConnectTimeout()) == 'timeout'
+        assert stats.request_error(
+            requests.exceptions.ConnectionError()) == 'connection'
+        assert stats.request_error(
+            requests.exceptions.TooManyRedirects()) == 'request'
+        assert stats.status_error(304) is None
+        assert stats.status_error(429) == 'http_429'
+
+    def test_summary(self):
+        stats.record_request('https://a/1', 0.25, 2048)
+        stats.count('article_cache_hits')
+        stats.count('thread_cache_misses', 2)
+        stats.count('items_rendered', 30)
+        summary = self.registry.summary()
+        assert summary.startswith('Stats: ')
+        assert '1 requests (0 failed)' in summary
+        assert '2.0 KB downloaded' in summary
+        assert 'cache 1 hits 2 misses' in summary
+        assert '30 items rendered' in summary
+        assert 'articles rendered' not in summary
+        assert summary.endswith('slowest request 0.25s https://a/1')
+
+    def test_hacker_news_api(self):
+        hacker_news_api = HackerNewsApi()
+        response = mock.Mock(status_code=500, content=b'{}')
+        with mock.patch.object(hacker_news_api.session, 'get',
+                               return_value=response):
+            with self.assertRaises(HTTPError):
+                hacker_news_api.get_item(1)
+        with mock.patch.object(
+                hacker_news_api.session, 'get',
+                side_effect=requests.exceptions.ConnectionError):
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                hacker_news_api.get_item(1)
+        assert self.registry.get('requests') == 2
+        assert self.registry.get('request_errors') == 2
+        assert self.registry.get('bytes') == 2
+        assert self.registry.errors == {'http_500': 1, 'connection': 1}
+        assert list(self.registry.latencies) == ['item']
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+from tests.compat import unittest
+
+from haxor_news.bundle import OfflineHackerNewsApi
+from haxor_news.synthetic import SyntheticGenerator
+
+
+class SyntheticGeneratorTest(unittest.TestCase):
+
+    def get_depth(self, pages, item):
+        depth = 0
+        while 'parent' in item:
+            item = pages['item/{0}'.format(item['parent'])]
+            depth += 1
+        return depth
+
+    def get_comments(self, pages):
+        return [item for path, item in pages.items()
+                if path.startswith('item/') and item['type'] == 'comment']
+
+    def test_thread(self):
+        generator = SyntheticGenerator(seed=1)
+        story_id = generator.thread(comments=3000, max_depth=10,
+                                    chain_depth=40)
+        pages = generator.pages
+        comments = self.get_comments(pages)
+        assert len(comments) == 3000
+        depths = [self.get_depth(pages, comment) for comment in comments]
+        assert max(depths) == 40
+        assert max(depth for comment, depth in zip(comments, depths)
+                   if comment['id'] > story_id + 40) <= 10
+        assert depths.count(1) > depths.count(2) > depths.count(3)
+        deleted = [comment for comment in comments if comment.get('deleted')]
+        dead = [comment for comment in comments if comment.get('dead')]
+        assert 0.01 < len(deleted) / 3000 < 0.03
+        assert 0.005 < len(dead) / 3000 < 0.02
+        assert all('text' not in comment and 'by' not in comment
+                   for comment in deleted)
+        for comment in comments:
+            parent = pages['item/{0}'.format(comment['parent'])]
+            assert comment['id'] in parent['kids']
+
+    def test_thread_deleted_chain(self):
+        # Seed 0 deletes a chain comment, leaving the levels under it empty.
+        generator = SyntheticGenerator(seed=0, deleted_ratio=0.3)
+        generator.thread(comments=300, chain_depth=40)
+        comments = self.get_comments(generator.pages)
+        assert len(comments) == 300
+        assert max(self.get_depth(generator.pages, comment)
+                   for comment in comments) == 40
+
+    def test_seed(self):
+        pages = []
+        for _ in range(2):
+            generator = SyntheticGenerator(seed=2)
+            generator.thread(comments=50)
+            pages.append(generator.pages)
+        assert pages[0] == pages[1]
+
+    def test_user(self):
+        generator = SyntheticGenerator(seed=3)
+        user = generator.user('heavy', submissions=50000)
+        assert len(user['submitted']) == 50000
+        assert user['submitted'][0] > user['submitted'][-1]
+        assert 'item/{0}'.format(user['submitted'][0]) not in generator.pages
+        user = generator.user('light', submissions=5, with_items=True)
+        assert all('item/{0}'.format(item_id) in generator.pages
+                   for item_id in user['submitted'])
+
+    def test_offline_api(self):
+        generator = SyntheticGenerator(seed=4)
+        story_id = generator.thread(comments=100)
+        generator.story_list('topstories', [story_id])
+        api = OfflineHackerNewsApi(generator.to_bundle())
+        assert api.top_stories() == [story_id]
+        story = api.get_item(story_id)
+        assert story.descendants == 100
+        assert len(api.get_items(story.kids)) == len(story.kids)
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+from tests.compat import unittest
+
+from haxor_news.lib import tracing
+
+
+class TracingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'trace.json')
+
+    def tearDown(self):
+        tracing.stop_tracing()
+        shutil.rmtree(self.temp_dir)
+
+    def test_null_span(self):
+        assert tracing.tracer is None
+        with tracing.span('get_item', 'fetch', item_id=1) as span:
+            span.set(status=200)
+        assert span is tracing.NULL_SPAN
+
+    def test_nested_spans(self):
+        tracer = tracing.start_tracing()
+        with tracing.span('command', 'command'):
+            with tracing.span('get_item', 'fetch', item_id=1) as span:
+                span.set(status=200)
+        assert tracing.stop_tracing() is tracer
+        get_item, command = tracer.events
+        assert get_item['name'] == 'get_item'
+        assert get_item['cat'] == 'fetch'
+        assert get_item['ph'] == 'X'
+        assert get_item['args'] == {'item_id': 1, 'status': 200}
+        assert command['ts'] <= get_item['ts']
+        assert get_item['ts'] + get_item['dur'] <= \
+            command['ts'] + command['dur']
+        assert 'args' not in command
+
+    def test_span_error(self):
+        tracer = tracing.start_tracing()
+        with self.assertRaises(ValueError):
+            with tracing.span('render'):
+                raise ValueError
+        assert tracer.events[0]['args'] == {'error': 'ValueError'}
+
+    def test_traced(self):
+        @tracing.traced('double', 'format')
+        def double(value):
+            return value * 2
+
+        assert double(2) == 4
+        tracer = tracing.start_tracing()
+        assert double(3) == 6
+        assert [event['name'] for event in tracer.events] == ['double']
+
+    def test_counter(self):
+        tracing.counter('concurrency_limit', 'fetch', limit=4)
+        tracer = tracing.start_tracing()
+        tracing.counter('concurrency_limit', 'fetch', limit=2)
+        event, = tracer.events
+        assert event['name'] == 'concurrency_limit'
+        assert event['cat'] == 'fetch'
+        assert event['ph'] == 'C'
+        assert event['args'] == {'limit': 2}
+
+    def test_save(self):
+        tracer = tracing.start_tracing()
+        thread = threading.Thread(target=self.run_span, args=('GET',),
+                                  name='fetcher')
+        thread.start()
+        thread.join()
+        self.run_span('write')
+        tracer.save(self.path)
+        with open(self.path) as trace_file:
+            events = json.load(trace_file)['traceEvents']
+        spans = [event for event in events if event['ph'] == 'X']
+        assert [event['name'] for event in spans] == ['GET', 'write']
+        assert spans[0]['tid'] != spans[1]['tid']
+        thread_names = dict((event['tid'], event['args']['name'])
+                            for event in events if event['ph'] == 'M')
+        assert thread_names[spans[0]['tid']] == 'fetcher'
+
+    def run_span(self, name):
+        with tracing.span(name):
+            pass
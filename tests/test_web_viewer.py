@@ -0,0 +1,376 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2015 Donne Martin. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+
+from __future__ import print_function
+from __future__ import division
+
+import mock
+import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from tests.compat import unittest
+
+import requests
+
+from haxor_news.web_viewer import WebViewer, create_render_executor
+from tests.data.html2text_corpus import expected_digests, load_html
+
+
+class WebViewerTest(unittest.TestCase):
+
+    HTML = (
+        u'<html><head><title>Title</title><style>p {}</style></head><body>'
+        u'<h1>Header</h1><p>First <b>bold</b> paragraph&nbsp;with '
+        u'<a href="https://example.com">a link</a> and caf\u00e9.</p>'
+        u'<ul><li>One</li><li>Two <code>code</code></li></ul>'
+        u'<p>\u00a0</p><p></p><br><br>'
+        u'<pre>line 1\n\n\nline 2</pre>'
+        u'<blockquote>Quote</blockquote><p>Last &amp; <i>final</i> '
+        u'<a href="https://example.com">again</a>'
+        u'<img src="https://example.com/a.png" alt="image"></p>'
+        u'</body></html>')
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.web_viewer = WebViewer(self.cache_dir)
+        self.url = 'https://example.com/article'
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def create_response(self, status_code=200, content=b'<h1>Title</h1>',
+                        headers=None):
+        response = mock.Mock()
+        response.status_code = status_code
+        response.ok = status_code < 400
+        response.iter_content.return_value = [content]
+        response.encoding = 'utf-8'
+        response.headers = headers or {}
+        return response
+
+    def test_format_markdown_colors(self):
+        config = mock.Mock(clr_bold='blue', clr_code='magenta',
+                           clr_header='red', clr_link='white',
+                           clr_list='yellow')
+        web_viewer = WebViewer(config=config)
+        result = web_viewer.format_markdown(
+            u'# Title\n\n  * [link](/url) **bold** `code`')
+        assert result == (
+            u'\x1b[31mTitle\x1b[0m\n\n\x1b[33m  * \x1b[37m[link](/url)'
+            u'\x1b[0m \x1b[34mbold\x1b[0m \x1b[35m`code`\x1b[0m\x1b[0m')
+        assert web_viewer.get_render_key() != self.web_viewer.get_render_key()
+
+    def test_format_markdown_blank_lines(self):
+        texts = [
+            u'', u'\n', u'\n\n', u' \n \n ', u'one', u'one\n', u'one\n\n',
+            u'one  \n \n\n  two\n', u'\n\n  one\ntwo\n \n', u' \none\n',
+            u'one\n  two\n\t\nthree  \n\n\n',
+        ]
+        for text in texts:
+            expected = re.sub(r'(\s*\r?\n\s*){2,}', r'\n\n', text)
+            assert self.web_viewer.format_markdown(text) == expected
+
+    def test_render_html_stream(self):
+        html = (self.HTML * 20).encode('utf-8')
+        for size in (1, 7, 64, len(html)):
+            chunks = [html[start:start+size]
+                      for start in range(0, len(html), size)]
+            rendered = list(self.web_viewer.render_html_stream(chunks,
+                                                               'utf-8'))
+            assert ''.join(rendered) == \
+                self.web_viewer.render_html(html.decode('utf-8'))
+            if size < len(html):
+                assert len(rendered) > 2
+
+    def test_render_html_stream_corpus(self):
+        self.web_viewer.extract_content = False
+        for name in sorted(expected_digests):
+            html = load_html(name).encode('utf-8')
+            expected = self.web_viewer.render_html(html.decode('utf-8'))
+            # Tiny chunks split most text nodes, but are slow on big files.
+            sizes = (4096, 8192) if len(html) > 65536 else (1, 7, 13, 4096)
+            for size in sizes:
+                chunks = [html[start:start+size]
+                          for start in range(0, len(html), size)]
+                rendered = self.web_viewer.render_html_stream(chunks, 'utf-8')
+                assert ''.join(rendered) == expected, (name, size)
+
+    def test_render_html_stream_incremental(self):
+        chunks = [(self.HTML * 10).encode('utf-8')] * 2
+
+        def generate_chunks():
+            for chunk in chunks:
+                yield chunk
+            raise AssertionError('Read past the second chunk')
+
+        rendered = self.web_viewer.render_html_stream(generate_chunks(),
+                                                      'utf-8')
+        assert 'Header' in next(rendered)
+
+    @mock.patch('haxor_news.web_viewer.requests.Session.get')
+    def test_stream_url_contents(self, mock_session_get):
+        response = self.create_response()
+        html = (self.HTML * 20).encode('utf-8')
+        response.iter_content.return_value = [html[:1000], html[1000:]]
+        mock_session_get.return_value = response
+        rendered = list(self.web_viewer.stream_url_contents(self.url))
+        assert len(rendered) > 1
+        article, cached_html = self.web_viewer.article_cache.load(self.url)
+        assert cached_html == html
+        assert article['renders'][self.web_viewer.get_render_key()] == \
+            ''.join(rendered)
+        response.close.assert_called_with()
+
+    @mock.patch('haxor_news.web_viewer.requests.Session.get')
+    def test_stream_url_contents_streams_by_default(self, mock_session_get):
+        response = self.create_response()
+        # Larger than the charset detection sample.
+        chunk = (self.HTML * 150).encode('utf-8')
+
+        def iter_content(chunk_size):
+            yield chunk
+            raise AssertionError('Read past the first chunk')
+
+        response.iter_content.side_effect = iter_content
+        mock_session_get.return_value = response
+        rendered = self.web_viewer.stream_url_contents(self.url)
+        assert 'Header' in next(rendered)
+
+    @mock.patch('haxor_news.web_viewer.requests.Session.get')
+    def test_stream_url_contents_extract_content(self, mock_session_get):
+        response = self.create_response(
+            content=load_html('blog_post.html').encode('utf-8'))
+        mock_session_get.return_value = response
+        contents = ''.join(self.web_viewer.stream_url_contents(self.url))
+        assert 'Popular posts' in contents
+        self.web_viewer.extract_content = True
+        contents = ''.join(self.web_viewer.stream_url_contents(self.url))
+        assert 'Making the parser linear' in contents
+        assert 'Popular posts' not in contents
+
+    @mock.patch('haxor_news.web_viewer.requests.Session.get')
+    def test_generate_url_contents_charset(self, mock_requests_get):
+        html = (u'<html><head><meta charset="windows-1252"></head>'
+                u'<body><p>\u201cQuoted\u201d</p></body></html>')
+        mock_requests_get.return_value = self.create_response(
+            content=html.encode('cp1252'),
+            headers={'Content-Type': 'text/html'})
+        contents = self.web_viewer.generate_url_contents(self.url)
+        assert contents == 'Quoted\n'
+        article, _ = self.web_viewer.article_cache.load(self.url)
+        assert article['encoding'] == 'cp1252'
+        assert article['encoding_source'] == 'meta'
+
+    @mock.patch('haxor_news.web_viewer.requests.Session.get')
+    def test_generate_url_contents(self, mock_requests_get):
+        mock_requests_get.return_value = self.create_response(
+            headers={'ETag': '"v1"'})
+        contents = self.web_viewer.generate_url_contents(self.url)
+        assert 'Title' in contents
+        # Fresh articles are rendered from the cache without a request.
+        mock_requests_get.reset_mock()
+        assert self.web_viewer.generate_url_contents(self.url) == contents
+        assert not mock_requests_get.called
+
+    @mock.patch('haxor_news.web_viewer.requests.Session.get')
+    def test_generate_url_contents_not_modified(self, mock_requests_get):
+        mock_requests_get.return_value = self.create_response(
+            headers={'ETag': '"v1"', 'Last-Modified': 'yesterday'})
+        contents = self.web_viewer.generate_url_contents(self.url)
+        stale = time.time() + WebViewer.ARTICLE_FRESH_AGE
+        mock_requests_get.return_value = self.create_response(
+            status_code=requests.codes.not_modified, content=b'')
+        with mock.patch('haxor_news.web_viewer.time.time',
+                        return_value=stale):
+            assert self.web_viewer.generate_url_contents(self.url) == \
+                contents
+        headers = mock_requests_get.call_args[1]['headers']
+        assert headers['If-None-Match'] == '"v1"'
+        assert headers['If-Modified-Since'] == 'yesterday'
+        article, html = self.web_viewer.article_cache.load(self.url)
+        assert article['fetched'] == stale
+        assert html == b'<h1>Title</h1>'
+
+    @mock.patch('haxor_news.web_viewer.requests.Session.get')
+    def test_generate_url_contents_changed(self, mock_requests_get):
+        mock_requests_get.return_value = self.create_response()
+        self.web_viewer.generate_url_contents(self.url)
+        mock_requests_get.return_value = self.create_response(
+            content=b'<h1>Changed</h1>')
+        stale = time.time() + WebViewer.ARTICLE_FRESH_AGE
+        with mock.patch('haxor_news.web_viewer.time.time',
+                        return_value=stale):
+            contents = self.web_viewer.generate_url_contents(self.url)
+        assert 'Changed' in contents
+
+    @mock.patch('haxor_news.web_viewer.requests.Session.get')
+    def test_generate_url_contents_error(self, mock_requests_get):
+        mock_requests_get.side_effect = requests.exceptions.ConnectionError
+        contents = self.web_viewer.generate_url_contents(self.url)
+        assert contents.startswith('Error: ')
+
+    @mock.patch('haxor_news.web_viewer.requests.Session.get')
+    def test_generate_url_contents_error_stale(self, mock_requests_get):
+        mock_requests_get.return_value = self.create_response()
+        contents = self.web_viewer.generate_url_contents(self.url)
+        mock_requests_get.side_effect = requests.exceptions.ConnectionError
+        stale = time.time() + WebViewer.ARTICLE_FRESH_AGE
+        with mock.patch('haxor_news.web_viewer.time.time',
+                        return_value=stale):
+            assert self.web_viewer.generate_url_contents(self.url) == \
+                contents
+
+    @mock.patch('haxor_news.web_viewer.requests.Session.get')
+    def test_generate_url_contents_render_settings(self, mock_requests_get):
+        mock_requests_get.return_value = self.create_response()
+        self.web_viewer.generate_url_contents(self.url)
+        render_key = self.web_viewer.get_render_key()
+        self.web_viewer.html_to_text.ignore_links = True
+        assert self.web_viewer.get_render_key() != render_key
+        mock_requests_get.reset_mock()
+        self.web_viewer.generate_url_contents(self.url)
+        assert not mock_requests_get.called
+        article, _ = self.web_viewer.article_cache.load(self.url)
+        assert len(article['renders']) == 2
+
+    @mock.patch('haxor_news.web_viewer.requests.Session.get')
+    def test_fetch(self, mock_session_get):
+        response = self.create_response()
+        response.iter_content.return_value = [b'a', b'b']
+        mock_session_get.return_value = response
+        assert self.web_viewer.fetch(self.url) == (response, b'ab', False)
+        kwargs = mock_session_get.call_args[1]
+        assert kwargs['stream']
+        assert kwargs['timeout'] == (WebViewer.CONNECT_TIMEOUT,
+                                     WebViewer.READ_TIMEOUT)
+        response.close.assert_called_with()
+
+    @mock.patch('haxor_news.web_viewer.requests.Session.get')
+    def test_fetch_too_large(self, mock_session_get):
+        chunk = b'a' * WebViewer.CHUNK_SIZE
+        response = self.create_response()
+        response.iter_content.return_value = iter([chunk] * 1000)
+        mock_session_get.return_value = response
+        _, content, truncated = self.web_viewer.fetch(self.url)
+        assert len(content) == WebViewer.MAX_BODY_SIZE
+        assert truncated
+        contents = self.web_viewer.generate_url_contents(self.url)
+        assert 'the rest was left out' in contents
+
+    @mock.patch('haxor_news.web_viewer.requests.Session.get')
+    def test_generate_url_contents_timeout(self, mock_session_get):
+        mock_session_get.side_effect = requests.exceptions.ReadTimeout
+        contents = self.web_viewer.generate_url_contents(self.url)
+        assert contents.startswith('Error: ')
+
+    @mock.patch('haxor_news.web_viewer.requests.Session.get')
+    def test_load_article(self, mock_session_get):
+        mock_session_get.return_value = self.create_response(
+            content=b'<p>Text</p>', headers={'ETag': '"v1"'})
+        article, html, cached = self.web_viewer.load_article(self.url)
+        assert (html, cached) == (b'<p>Text</p>', True)
+        assert article['etag'] == '"v1"'
+        assert article['renders'] == {}
+        article['fetched'] -= WebViewer.ARTICLE_FRESH_AGE
+        self.web_viewer.article_cache.save(article)
+        mock_session_get.return_value = self.create_response(
+            status_code=304)
+        article, html, cached = self.web_viewer.load_article(self.url)
+        assert (html, cached) == (b'<p>Text</p>', True)
+        assert mock_session_get.call_args[1]['headers'] == \
+            {'If-None-Match': '"v1"'}
+        mock_session_get.side_effect = requests.exceptions.ConnectionError
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self.web_viewer.load_article('https://example.com/other')
+
+    @mock.patch('haxor_news.web_viewer.requests.Session.get')
+    def test_render_many(self, mock_session_get):
+        def get(url, **kwargs):
+            if url.endswith('error'):
+                raise requests.exceptions.ConnectionError('refused')
+            return self.create_response(
+                content=u'<p>{0}</p>'.format(url).encode('utf-8'))
+        mock_session_get.side_effect = get
+        urls = ['https://example.com/' + name
+                for name in ('one', 'two', 'error')]
+        results = dict(self.web_viewer.render_many(urls, max_workers=2))
+        assert results[urls[0]] == urls[0] + '\n'
+        assert results[urls[1]] == urls[1] + '\n'
+        assert results[urls[2]].startswith('Error: refused')
+        render_key = self.web_viewer.get_render_key()
+        article, _ = self.web_viewer.article_cache.load(urls[0])
+        assert article['renders'] == {render_key: urls[0] + '\n'}
+        mock_session_get.reset_mock()
+        results = dict(self.web_viewer.render_many(urls[:2]))
+        assert results[urls[1]] == urls[1] + '\n'
+        assert not mock_session_get.called
+
+    @mock.patch('haxor_news.web_viewer.render_html_in_process')
+    @mock.patch('haxor_news.web_viewer.ProcessPoolExecutor',
+                new=ThreadPoolExecutor)
+    @mock.patch('requests.Session.get')
+    def test_render_many_render_error(self, mock_session_get, mock_render):
+        mock_session_get.side_effect = lambda url, **kwargs: \
+            self.create_response(
+                content=u'<p>{0}</p>'.format(url).encode('utf-8'))
+
+        def render(config, extract_content, html, *args):
+            if b'error' in html:
+                raise ValueError('bad markup')
+            return 'Rendered'
+        mock_render.side_effect = render
+        urls = ['https://example.com/' + name for name in ('one', 'error')]
+        results = dict(self.web_viewer.render_many(urls))
+        assert results[urls[0]] == 'Rendered'
+        assert results[urls[1]].startswith('Error: bad markup')
+
+    @mock.patch('requests.Session.get')
+    def test_render_many_close_early(self, mock_session_get):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def get(url, **kwargs):
+            if not url.endswith('fast'):
+                release.wait(30)
+            return self.create_response(content=b'<p>Text</p>')
+        mock_session_get.side_effect = get
+        urls = ['https://example.com/' + name
+                for name in ('fast', 'slow', 'slower')]
+        start = time.time()
+        renders = self.web_viewer.render_many(urls)
+        assert next(renders) == (urls[0], 'Text\n')
+        renders.close()
+        assert time.time() - start < 10
+
+    @unittest.skipIf(sys.platform == 'win32' or sys.version_info < (3, 7),
+                     'No forkserver process pools')
+    def test_create_render_executor(self):
+        executor = create_render_executor(1)
+        try:
+            assert executor.submit(os.getppid).result() != os.getpid()
+        finally:
+            executor.shutdown()
+
+    def test_get_host_semaphore(self):
+        semaphore = self.web_viewer.get_host_semaphore(self.url)
+        assert self.web_viewer.get_host_semaphore(
+            'https://example.com/other') is semaphore
+        assert self.web_viewer.get_host_semaphore(
+            'https://example.org/') is not semaphore